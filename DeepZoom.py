@@ -0,0 +1,131 @@
+from manim import *
+import numpy as np
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+# --------------------- 常量区 ---------------------
+TILE_PIXELS = 512           # 每块瓦片的边长（像素）
+TILE_CACHE_SIZE = 256       # 最多保留的已栅格化瓦片数量
+
+
+# --------------------- 栅格化 ---------------------
+def rasterize(
+    mobject: Mobject,
+    center: np.ndarray,
+    width: float,
+    height: float,
+    pixel_width: int,
+    pixel_height: int,
+) -> ImageMobject:
+    """用一台独立的相机把 mobject 在 [center ± (width, height)/2] 内的部分画成图片（背景透明）"""
+    camera = Camera(
+        frame_center=np.array(center, dtype=float),
+        frame_width=width,
+        frame_height=height,
+        pixel_width=pixel_width,
+        pixel_height=pixel_height,
+        background_opacity=0,
+    )
+    camera.capture_mobject(mobject)
+    image = ImageMobject(camera.pixel_array.copy())
+    image.stretch_to_fit_width(width).stretch_to_fit_height(height).move_to(center)
+    return image
+
+
+# --------------------- 瓦片金字塔 ---------------------
+class TilePyramid(Group):
+    """静态内容的多尺度瓦片金字塔，用于跨越好几个数量级的镜头推近。
+
+    以 focus 为中心、边长 base_width 的正方形为第 0 层（一块瓦片），
+    第 l 层切成 2^l × 2^l 块，每块都是 tile_pixels 见方的图片。
+    follow(frame) 之后每帧按画面宽度选出分辨率刚好够用的那一层，
+    只显示与画面相交的瓦片（首次用到时才栅格化，之后走 LRU 缓存），
+    所以无论推得多近，每帧绘制的像素量都有上限，而不是整幅矢量场景。
+    """
+
+    def __init__(
+        self,
+        mobject: Mobject,
+        focus: Optional[np.ndarray] = None,
+        base_width: Optional[float] = None,
+        max_level: int = 20,
+        tile_pixels: int = TILE_PIXELS,
+        cache_size: int = TILE_CACHE_SIZE,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.source = mobject
+        self.focus = np.array(mobject.get_center() if focus is None else focus, dtype=float)
+        if base_width is None:
+            # 以 focus 为中心、恰好盖住整个 mobject 的正方形
+            corners = np.array([mobject.get_corner(d) for d in (UL, UR, DL, DR)])
+            base_width = 2 * np.abs(corners[:, :2] - self.focus[:2]).max()
+        self.base_width = base_width
+        self.max_level = max_level
+        self.tile_pixels = tile_pixels
+        self.cache_size = cache_size
+        self._tiles: "OrderedDict[Tuple[int, int, int], ImageMobject]" = OrderedDict()
+        self.level = 0
+
+    # ------------- 瓦片几何 -------------
+    def tile_width(self, level: int) -> float:
+        return self.base_width / 2 ** level
+
+    def level_for(self, frame_width: float, pixel_width: Optional[int] = None) -> int:
+        """瓦片像素密度不低于屏幕像素密度的最粗一层"""
+        pixel_width = config["pixel_width"] if pixel_width is None else pixel_width
+        needed = self.base_width * pixel_width / (self.tile_pixels * frame_width)
+        level = int(np.ceil(np.log2(max(needed, 1.0))))
+        return min(level, self.max_level)
+
+    def visible_tiles(
+        self,
+        level: int,
+        center: np.ndarray,
+        width: float,
+        height: float
+    ) -> List[Tuple[int, int, int]]:
+        """第 level 层中与画面 [center ± (width, height)/2] 相交的瓦片编号"""
+        size = self.tile_width(level)
+        count = 2 ** level
+        origin = self.focus[:2] - self.base_width / 2
+        lo = np.floor((np.asarray(center[:2]) - [width / 2, height / 2] - origin) / size)
+        hi = np.floor((np.asarray(center[:2]) + [width / 2, height / 2] - origin) / size)
+        lo = np.clip(lo, 0, count - 1).astype(int)
+        hi = np.clip(hi, 0, count - 1).astype(int)
+        return [
+            (level, i, j)
+            for i in range(lo[0], hi[0] + 1)
+            for j in range(lo[1], hi[1] + 1)
+        ]
+
+    def get_tile(self, key: Tuple[int, int, int]) -> ImageMobject:
+        """取（必要时先栅格化）一块瓦片"""
+        tile = self._tiles.get(key)
+        if tile is None:
+            level, i, j = key
+            size = self.tile_width(level)
+            center = np.array([
+                *(self.focus[:2] - self.base_width / 2 + (np.array([i, j]) + 0.5) * size), 0
+            ])
+            tile = rasterize(self.source, center, size, size, self.tile_pixels, self.tile_pixels)
+            self._tiles[key] = tile
+            if len(self._tiles) > self.cache_size:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(key)
+        return tile
+
+    # ------------- 跟随相机 -------------
+    def update_view(self, frame: Mobject):
+        """按 frame 的位置与宽度换上对应层级的可见瓦片"""
+        self.level = self.level_for(frame.width)
+        if config["dry_run"]:
+            return self                 # 空跑（SceneDryRun）时不栅格化瓦片
+        keys = self.visible_tiles(self.level, frame.get_center(), frame.width, frame.height)
+        self.submobjects = [self.get_tile(key) for key in keys]
+        return self
+
+    def follow(self, frame: Mobject):
+        self.add_updater(lambda m: m.update_view(frame), call_updater=True)
+        return self
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
+import math
 from typing import Callable, Optional, Union, List, Tuple
+from LabelCache import cached_text
+from SequenceTools import SequencePoints, RevealTerms, evaluate_sequence
 
 # --------------------- 常量区 ---------------------
 TITLE_TEXT = "数列极限的动态演示"
@@ -14,6 +17,304 @@ SUB_TICK_COLOR = YELLOW
 LABEL_COLOR = BLUE
 ANIM_TIME = 0.5
 ZOOM_TIME = 1
+VIEW_MARGIN = 0.15          # 可视窗口两侧额外保留的比例
+MIN_TICK_SPACING = 0.6      # 相邻刻度在屏幕上的最小间距（Manim 单位）
+KEY_DECIMALS = 6            # 刻度键的定点精度：x = key / 10**KEY_DECIMALS
+
+# --------------------- 视口与刻度层级 ---------------------
+def visible_x_range(
+    scale: float,
+    center: np.ndarray,
+    margin: float = VIEW_MARGIN,
+    frame_width: Optional[float] = None
+) -> Tuple[float, float]:
+    """给定缩放与中心，返回屏幕可见的数学坐标区间（两侧各留 margin 比例的余量）"""
+    width = config.frame_width if frame_width is None else frame_width
+    half = width * (0.5 + margin)
+    return (-half - center[0]) / scale, (half - center[0]) / scale
+
+
+def tick_level_exponent(scale: float, min_spacing: float = MIN_TICK_SPACING) -> int:
+    """最细可显示的刻度层级 10**exp：保证相邻刻度的屏幕间距不小于 min_spacing"""
+    exp = math.ceil(math.log10(min_spacing / scale) - 1e-9)
+    return max(exp, -KEY_DECIMALS)
+
+
+def level_keys(lo: float, hi: float, exp: int) -> range:
+    """区间 [lo, hi] 内层级 10**exp 的全部刻度键（整数运算，不受浮点误差影响）"""
+    unit = 10 ** KEY_DECIMALS
+    step = 10 ** (KEY_DECIMALS + exp)
+    k_lo = math.ceil(lo * unit / step)
+    k_hi = math.floor(hi * unit / step)
+    return range(k_lo * step, k_hi * step + 1, step)
+
+
+def to_key(x: float) -> int:
+    """数学坐标 -> 刻度键（定点整数）"""
+    return int(round(x * 10 ** KEY_DECIMALS))
+
+
+def step_keys(start: float, end: float, step: float) -> range:
+    """[start, end] 内 step 整数倍的全部刻度键。
+
+    先把端点和 step 量化到定点网格再做整数运算，不会像 np.arange 那样累积浮点误差，
+    深度缩放后也不会出现重复或缺失的刻度。
+    """
+    step_key = to_key(step)
+    if step_key <= 0:
+        return range(0)
+    k_lo = -(-to_key(start) // step_key)
+    k_hi = to_key(end) // step_key
+    return range(k_lo * step_key, k_hi * step_key + 1, step_key)
+
+
+def key_level(key: int) -> int:
+    """刻度键所属的最粗层级 10**exp：3 -> 0，0.5 -> -1，0.25 -> -2"""
+    exp = -KEY_DECIMALS
+    while exp < 0 and key % 10 == 0:
+        key //= 10
+        exp += 1
+    return exp
+
+
+def key_to_text(key: int) -> str:
+    """刻度键转标签文本，只保留必要的小数位：1000000 -> '1'，-500000 -> '-0.5'"""
+    unit = 10 ** KEY_DECIMALS
+    if key % unit == 0:
+        return str(key // unit)
+    decimals, k = KEY_DECIMALS, key
+    while k % 10 == 0:
+        k //= 10
+        decimals -= 1
+    return f"{key / unit:.{decimals}f}"
+
+
+class ViewportTicks:
+    """视口感知的刻度层：只物化可视窗口（含边距）内的刻度与标签，
+    并随缩放在 1、0.1、0.01 …… 之间切换刻度密度。
+
+    整数刻度使用主刻度样式，其余使用子刻度样式；宿主数轴直接把
+    ticks / labels / sub_ticks / sub_labels 当作自己的分组使用。
+    """
+
+    def __init__(
+        self,
+        x_min: float,
+        x_max: float,
+        scale: float,
+        center: np.ndarray,
+        tick_length: float = 0.2,
+        sub_tick_length: float = 0.1,
+        font_size: float = TICK_FONT_SIZE,
+        sub_font_size: float = SUB_TICK_FS,
+        include_numbers: bool = True,
+        label_buff: float = 0.3,
+        sub_label_buff: float = 0.15,
+        margin: float = VIEW_MARGIN,
+        min_spacing: float = MIN_TICK_SPACING,
+        frame_width: Optional[float] = None
+    ):
+        self.x_min, self.x_max = x_min, x_max
+        self.tick_length = tick_length
+        self.sub_tick_length = sub_tick_length
+        self.font_size = font_size
+        self.sub_font_size = sub_font_size
+        self.include_numbers = include_numbers
+        self.label_buff = label_buff
+        self.sub_label_buff = sub_label_buff
+        self.margin = margin
+        self.min_spacing = min_spacing
+        self.frame_width = frame_width
+
+        self.ticks = VGroup()
+        self.labels = VGroup()
+        self.sub_ticks = VGroup()
+        self.sub_labels = VGroup()
+        self._items = {}        # key -> (tick, label or None)
+        self._leaving = []      # 本次缩放结束后需要移除的键
+
+        self.scale = scale
+        self.center = np.array(center, dtype=float)
+        for key in self._wanted_keys(self.scale, self.center):
+            self._materialize(key, self.scale, self.center)
+
+    # ------------- 私有方法 -------------
+    def _wanted_keys(self, scale: float, center: np.ndarray) -> set:
+        lo, hi = visible_x_range(scale, center, self.margin, self.frame_width)
+        lo, hi = max(lo, self.x_min), min(hi, self.x_max)
+        if lo > hi:
+            return set()
+        return set(level_keys(lo, hi, tick_level_exponent(scale, self.min_spacing)))
+
+    def _pos(self, key: int, scale: float, center: np.ndarray) -> np.ndarray:
+        return center + RIGHT * (key / 10 ** KEY_DECIMALS) * scale
+
+    def _is_main(self, key: int) -> bool:
+        return key % 10 ** KEY_DECIMALS == 0
+
+    def _materialize(self, key: int, scale: float, center: np.ndarray):
+        pos = self._pos(key, scale, center)
+        if self._is_main(key):
+            tick = Line(UP * self.tick_length, DOWN * self.tick_length / 2, color=TICK_COLOR)
+            tick_group, label_group = self.ticks, self.labels
+            font_size, color, buff = self.font_size, TICK_COLOR, self.label_buff
+        else:
+            tick = Line(UP * self.sub_tick_length, DOWN * self.sub_tick_length, color=SUB_TICK_COLOR)
+            tick_group, label_group = self.sub_ticks, self.sub_labels
+            font_size, color, buff = self.sub_font_size, SUB_TICK_COLOR, self.sub_label_buff
+        tick.move_to(pos)
+        tick_group.add(tick)
+
+        label = None
+        if self.include_numbers:
+            label = cached_text(key_to_text(key), font_size=font_size, color=color)
+            label.next_to(pos, DOWN, buff=buff)
+            label_group.add(label)
+        self._items[key] = (tick, label)
+
+    # ------------- 公开接口 -------------
+    def zoom_anims(self, scale: float, center: np.ndarray) -> List[Animation]:
+        """切换到新的缩放/中心：新进入窗口的刻度从旧位置淡入，离开的淡出，
+        只为窗口内（新旧并集）的刻度生成动画。缩放播放完后需调用 finish_zoom。"""
+        center = np.array(center, dtype=float)
+        wanted = self._wanted_keys(scale, center)
+        for key in wanted - self._items.keys():
+            self._materialize(key, self.scale, self.center)
+            tick, label = self._items[key]
+            tick.set_stroke(opacity=0)
+            if label is not None:
+                label.set_opacity(0)
+
+        anims = []
+        self._leaving = []
+        for key, (tick, label) in self._items.items():
+            opacity = 1 if key in wanted else 0
+            if opacity == 0:
+                self._leaving.append(key)
+            target = self._pos(key, scale, center)
+            buff = self.label_buff if self._is_main(key) else self.sub_label_buff
+            anims.append(tick.animate.move_to(target).set_stroke(opacity=opacity))
+            if label is not None:
+                anims.append(label.animate.next_to(target, DOWN, buff=buff).set_opacity(opacity))
+
+        self.scale, self.center = scale, center
+        return anims
+
+    def finish_zoom(self, scene: Optional[Scene] = None):
+        """移除已经离开窗口（或层级过细）的刻度与标签。
+        播放 .animate 时 manim 会把分组外的刻度直接加进场景，传入 scene 才能把它们一并移出，
+        否则透明的刻度会随缩放次数在场景里越积越多。"""
+        for key in self._leaving:
+            tick, label = self._items.pop(key)
+            main = self._is_main(key)
+            (self.ticks if main else self.sub_ticks).remove(tick)
+            if label is not None:
+                (self.labels if main else self.sub_labels).remove(label)
+            if scene is not None:
+                scene.remove(*[m for m in (tick, label) if m is not None])
+        self._leaving = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def staggered_reveal(
+    term_anims: List[List[Animation]],
+    run_time: float = ANIM_TIME,
+    stagger: Optional[float] = None
+) -> Animation:
+    """把每一项自己的出现动画按固定间隔错开，合成一个动画。
+
+    stagger 为相邻两项的开始间隔，默认 1.5 * run_time，
+    与逐项 play(run_time) + wait(run_time/2) 的节奏一致，但只产生一个片段文件。
+    """
+    if stagger is None:
+        stagger = run_time * 1.5
+    groups = [AnimationGroup(*anims, run_time=run_time) for anims in term_anims]
+    return LaggedStart(*groups, lag_ratio=stagger / run_time)
+
+
+class CoordRegistry:
+    """数轴元素的数学坐标表。
+
+    每类元素（主刻度、子刻度、数列点、函数点……）对应一段连续的 float 数组，
+    顺序与对应 VGroup 中的子对象一致；缩放时直接用这些坐标做数组运算，
+    不再解析标签文字，也不再从屏幕位置反推坐标。
+    """
+
+    def __init__(self):
+        self._coords = {}
+
+    def extend(self, kind: str, xs) -> np.ndarray:
+        """在 kind 类末尾追加坐标，返回追加后的整段数组"""
+        xs = np.atleast_1d(np.asarray(xs, dtype=float))
+        self._coords[kind] = np.concatenate([self[kind], xs])
+        return self._coords[kind]
+
+    def __getitem__(self, kind: str) -> np.ndarray:
+        return self._coords.get(kind, np.zeros(0))
+
+    def __len__(self) -> int:
+        return sum(len(xs) for xs in self._coords.values())
+
+
+class TickPath(VMobject):
+    """把同一层级的一批刻度画成一个 VMobject：每个刻度是一条竖直子路径。
+
+    刻度位置由数学坐标 xs 与布局 (unit, origin) 推出，缩放时只需 layout 一次，
+    不必逐个移动成百上千个 Line。
+    """
+
+    def __init__(
+        self,
+        xs=(),
+        length: float = 0.2,
+        unit: float = 1.0,
+        origin: np.ndarray = ORIGIN,
+        color: ParsableManimColor = TICK_COLOR,
+        **kwargs
+    ):
+        super().__init__(color=color, **kwargs)
+        self.length = length
+        self.unit = unit
+        self.origin = np.array(origin, dtype=float)
+        self.xs = np.zeros(0)
+        self.add_ticks(xs)
+
+    def _rebuild(self):
+        centers = self.origin + np.outer(self.xs * self.unit, RIGHT)
+        top = centers + UP * self.length / 2
+        bottom = centers + DOWN * self.length / 2
+        # 每条竖线是一段退化为直线的三次贝塞尔（4 个控制点）
+        t = np.array([0, 1/3, 2/3, 1])[None, :, None]
+        points = top[:, None, :] + t * (bottom - top)[:, None, :]
+        self.set_points(points.reshape(-1, 3))
+
+    def add_ticks(self, xs):
+        """追加刻度（数学坐标）"""
+        self.xs = np.concatenate([self.xs, np.atleast_1d(np.asarray(xs, dtype=float))])
+        self._rebuild()
+        return self
+
+    def layout(self, unit: float, origin: np.ndarray):
+        """按新的缩放 / 中心重新排布全部刻度"""
+        self.unit = unit
+        self.origin = np.array(origin, dtype=float)
+        self._rebuild()
+        return self
+
+    def shift(self, *vectors):
+        super().shift(*vectors)
+        self.origin = self.origin + np.sum(vectors, axis=0)
+        return self
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path()):
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if isinstance(mobject1, TickPath) and isinstance(mobject2, TickPath):
+            self.unit = interpolate(mobject1.unit, mobject2.unit, alpha)
+            self.origin = interpolate(mobject1.origin, mobject2.origin, alpha)
+        return self
+
 
 # --------------------- 可复用组件 ---------------------
 class EnhancedNumberAxis(VGroup):
@@ -31,8 +332,15 @@ class EnhancedNumberAxis(VGroup):
         include_numbers: bool = True,
         numbers_to_include: Optional[List[float]] = None,
         decimal_places: int = 0,
+        culling: bool = False,
+        point_cloud: bool = False,
+        compound_ticks: bool = False,
         **kwargs
     ):
+        """culling=True 时刻度改由 ViewportTicks 管理（忽略 numbers_to_include 与手动子刻度）：
+        只保留可视窗口内的刻度和标签，缩放时在 1 / 0.1 / 0.01 …… 之间切换密度；
+        point_cloud=True 时数列点存放在一个 SequencePoints 里，适合上万项的数列；
+        compound_ticks=True 时同一层级的刻度合成一个 TickPath（ticks / sub_ticks 中存放的是 TickPath）"""
         super().__init__(**kwargs)
         
         # 参数设置
@@ -46,14 +354,35 @@ class EnhancedNumberAxis(VGroup):
         self.include_numbers = include_numbers
         self.numbers_to_include = numbers_to_include
         self.decimal_places = decimal_places
+        self.compound_ticks = compound_ticks
         
         # 存储组件
-        self.seq_dots = VGroup()
+        self.seq_dots = SequencePoints(color=DOT_COLOR, radius=DEFAULT_DOT_RADIUS) if point_cloud else VGroup()
         self.seq_labels = VGroup()
         self.seq_n_values = []
+        self.seq_label_keys = []         # 每个数列标签当前的 (文字, 字号)，缩放时据此判断是否需要重建
+        self.sequence_func = None        # 最近一次添加数列点所用的通项公式
+        self.coords = CoordRegistry()    # 各类元素的数学坐标（a_n 在添加点时只求值一次）
+        self._sub_tick_keys = set()      # 已创建的子刻度键，增量添加时据此复用
+        self._sub_paths = {}             # compound_ticks 时：层级 -> 该层级的 TickPath
+        self._pending_sub_paths = []     # (层级路径, 新刻度路径)：新刻度淡入后再并入层级路径
         self.function_dots = VGroup()
         self.function_labels = VGroup()
         
+        # 向量化缩放：单个 ValueTracker 表示缩放进度 0 -> 1
+        self.zoom_tracker = ValueTracker(0)
+        self._zoom_mobs = []               # 逐帧改字号的数列标签：点数组会被替换，只能单独平移
+        self._zoom_xs = np.zeros(0)
+        self._zoom_leaves = []             # 其余随缩放平移的子对象，points 是 _zoom_buffer 的视图
+        self._zoom_buffer = np.zeros((0, 3))
+        self._zoom_point_xs = np.zeros(0)  # 共享缓冲区中每个点所属元素的数学坐标
+        self._view = (initial_scale, np.array(center, dtype=float))  # 元素当前实际布局所用的 (缩放, 中心)
+        self._zoom_term_xs = np.zeros(0)  # 点云模式下各项的数学坐标
+        self._zoom_paths = []             # compound_ticks 时随缩放重排的 TickPath
+        self._zoom_label_sizes = []       # (标签, 字号比例, 锚定边)：缩放中逐帧改字号的数列标签
+        self._zoom_relabels = []          # (下标, 新文字, 方向)：缩放结束时需要重建的数列标签
+        self._zoom_alpha = 0.0
+        
         # 创建数轴
         self.line = Line(
             self._x2pos(self.x_min), 
@@ -61,42 +390,69 @@ class EnhancedNumberAxis(VGroup):
             color=TICK_COLOR
         )
         
-        # 主刻度
-        self.ticks = VGroup()
-        self.labels = VGroup()
-        
-        # 确定要显示的数字
-        if self.numbers_to_include is not None:
-            numbers = self.numbers_to_include
+        self.viewport = None
+        if culling:
+            # 视口刻度：只物化可视窗口内的刻度，并按缩放自动切换刻度密度
+            self.viewport = ViewportTicks(
+                self.x_min, self.x_max,
+                self.scale_factor, self.center_offset,
+                tick_length=self.tick_length/2,
+                sub_tick_length=self.sub_tick_length/2,
+                include_numbers=self.include_numbers,
+                label_buff=0.15,
+                sub_label_buff=0.1
+            )
+            self.ticks, self.labels = self.viewport.ticks, self.viewport.labels
+            self.sub_ticks, self.sub_labels = self.viewport.sub_ticks, self.viewport.sub_labels
         else:
-            numbers = np.arange(self.x_min, self.x_max + self.step, self.step)
+            # 主刻度
+            self.ticks = VGroup()
+            self.labels = VGroup()
         
-        for x in numbers:
-            if self.x_min <= x <= self.x_max:
-                tick = Line(UP * self.tick_length/2, DOWN * self.tick_length/3, color=TICK_COLOR)
-                tick.move_to(self._x2pos(x))
-                self.ticks.add(tick)
+            # 确定要显示的数字
+            if self.numbers_to_include is not None:
+                numbers = self.numbers_to_include
+            else:
+                numbers = np.arange(self.x_min, self.x_max + self.step, self.step)
+        
+            half = (self.tick_length/2 + self.tick_length/3) / 2
+            for x in numbers:
+                if self.x_min <= x <= self.x_max:
+                    if self.compound_ticks:
+                        tick = self._x2pos(x) + DOWN * half  # 标签的锚点：刻度下端
+                    else:
+                        tick = Line(UP * self.tick_length/2, DOWN * self.tick_length/3, color=TICK_COLOR)
+                        tick.move_to(self._x2pos(x))
+                        self.ticks.add(tick)
+                    self.coords.extend("tick", x)
                 
-                if self.include_numbers:
-                    label = Text(
-                        f"{x:.{self.decimal_places}f}", 
-                        font_size=TICK_FONT_SIZE, 
-                        color=TICK_COLOR
-                    )
-                    label.next_to(tick, DOWN, buff=0.15)
-                    self.labels.add(label)
+                    if self.include_numbers:
+                        label = cached_text(
+                            f"{x:.{self.decimal_places}f}", 
+                            font_size=TICK_FONT_SIZE, 
+                            color=TICK_COLOR
+                        )
+                        label.next_to(tick, DOWN, buff=0.15)
+                        self.labels.add(label)
+                        self.coords.extend("tick_label", x)
+            if self.compound_ticks:
+                self.ticks.add(TickPath(
+                    self.coords["tick"], length=2 * half,
+                    unit=self.scale_factor, origin=self.center_offset, color=TICK_COLOR
+                ))
         
-        # 子刻度
-        self.sub_ticks = VGroup()
-        self.sub_labels = VGroup()
+            # 子刻度
+            self.sub_ticks = VGroup()
+            self.sub_labels = VGroup()
+        
+            if sub_tick_range is not None:
+                self.add_sub_ticks(
+                    self.sub_tick_range[0], 
+                    self.sub_tick_range[1], 
+                    sub_tick_step,
+                    animate=True
+                )
         
-        if sub_tick_range is not None:           
-            self.add_sub_ticks(
-                self.sub_tick_range[0], 
-                self.sub_tick_range[1], 
-                sub_tick_step,
-                animate=True
-            )
         
         # 添加所有组件
         self.add(
@@ -111,21 +467,40 @@ class EnhancedNumberAxis(VGroup):
             self.function_labels
         )
     
+    @property
+    def seq_a_values(self) -> np.ndarray:
+        """与 seq_n_values 一一对应的 a_n"""
+        return self.coords["seq"]
+
     def _x2pos(self, x: float) -> np.ndarray:
         """将数学坐标 x 转换为 Manim 坐标"""
         return self.center_offset + RIGHT * x * self.scale_factor
+
+    def number_to_point(self, x: float) -> np.ndarray:
+        """数学坐标 x 在数轴当前实际布局中的位置（vectorized 缩放进行中也逐帧变化），
+        供 EpsilonBand 等跟随数轴的部件使用"""
+        scale, center = self._view
+        return center + RIGHT * x * scale
+
+    def _xs2pos(self, xs: np.ndarray) -> np.ndarray:
+        """_x2pos 的数组版本：一次把 N 个数学坐标转换成 (N, 3) 的 Manim 坐标"""
+        return self.center_offset + np.outer(np.asarray(xs, dtype=float) * self.scale_factor, RIGHT)
     
     def add_sub_ticks(
         self, 
         start: float,   # 子刻度起始位置
         end: float,     # 子刻度结束位置
-        step: float = 0.1,   # 子刻度间隔，默认为0.1
+        step: Optional[float] = 0.1,   # 子刻度间隔，默认为0.1；None 表示按当前缩放自动选层级
         animate: bool = False,  # 是否启用动画效果，默认为False
         scene: Optional[Scene] = None,  # 传入Scene以执行动画
         font_size =SUB_TICK_FS,
         include_numbers:bool = True
     ):
-        """在指定区间添加子刻度"""
+        """在指定区间添加子刻度（增量式：已存在的刻度直接复用，只创建新需要的更细刻度）"""
+        if self.viewport is not None:
+            return
+        if step is None:
+            step = 10.0 ** min(tick_level_exponent(self.scale_factor), -1)
         if step <= 0:
             return
         
@@ -136,58 +511,87 @@ class EnhancedNumberAxis(VGroup):
         #     self.sub_ticks = VGroup()
         #     self.sub_labels = VGroup()
         
-        # 添加新的子刻度
-        x_values = np.arange(start, end + step, step)
-
-        for x in x_values:
-            if abs(x - round(x)) < 1e-5: continue # 避免浮点精度问题                
-
-            if self.x_min <= x <= self.x_max:
-                tick = Line(
-                    UP * self.sub_tick_length/2, 
-                    DOWN * self.sub_tick_length/2, 
-                    color=SUB_TICK_COLOR
-                )
-                tick.move_to(self._x2pos(x))
-                self.sub_ticks.add(tick)
-                             
-                if include_numbers:
-                    label = Text(
-                        f"{x:.1f}", 
-                        font_size=font_size, 
-                        color=SUB_TICK_COLOR
-                    )
-                    label.next_to(tick, DOWN, buff=0.1)
-                    self.sub_labels.add(label)
-        
-        # 更新组件
-        # self.remove(self.sub_ticks, self.sub_labels)
-        # self.add(self.sub_ticks, self.sub_labels)
+        # 添加新的子刻度（整数键运算，不受浮点误差影响）
+        keys = step_keys(max(start, self.x_min), min(end, self.x_max), step)
+        new_ticks, new_labels = self._add_sub_tick_keys(
+            keys, self.sub_tick_length/2, self.sub_tick_length/2,
+            font_size, 0.1, include_numbers
+        )
         
-        if animate and scene is not None:
+        if animate and scene is not None and len(new_ticks):
             scene.play(
-                FadeIn(self.sub_ticks), 
-                FadeIn(self.sub_labels), 
+                FadeIn(new_ticks), 
+                FadeIn(new_labels), 
                 run_time=ANIM_TIME/2
             )
+        self._merge_sub_paths(scene)
 
     def add_sub_ticks_2(self,
-                        startPos:int = 0,
-                        new_sub_ticks_range:tuple[int, int] = (0,1)):
-        for i in range(new_sub_ticks_range[0], new_sub_ticks_range[1] + 1):
-            pos =startPos + i * 0.1
-            if abs(pos - round(pos)) < 1e-9:
-                continue  # 跳过整数刻度
-
-            t = Line(UP*0.1, DOWN*0.1, color=SUB_TICK_COLOR)
-            lab = Text(f"{pos:.1f}", font_size=SUB_TICK_FS, color=SUB_TICK_COLOR)
-            self.sub_ticks.add(t)
-            self.sub_labels.add(lab)
-            x = startPos + (i + 1) * 0.1
-            t.move_to(self._x2pos(x))
-            lab.next_to(t, DOWN, buff=0.15)
-       
-    
+                        startPos:float = 0,
+                        new_sub_ticks_range:tuple[int, int] = (0,1),
+                        step: float = 0.1):
+        """添加 startPos + i * step（i 取 new_sub_ticks_range 闭区间）处的子刻度"""
+        if self.viewport is not None:
+            return  # 子刻度由视口按缩放层级自动生成
+        base, step_key = to_key(startPos), to_key(step)
+        keys = [base + i * step_key
+                for i in range(new_sub_ticks_range[0], new_sub_ticks_range[1] + 1)]
+        self._add_sub_tick_keys(keys, 0.1, 0.1, SUB_TICK_FS, 0.15, True)
+        self._merge_sub_paths()
+
+    def _add_sub_tick_keys(
+        self,
+        keys,
+        up_length: float,
+        down_length: float,
+        font_size: float,
+        label_buff: float,
+        include_numbers: bool
+    ) -> Tuple[VGroup, VGroup]:
+        """按刻度键创建子刻度：整数键属于主刻度层级、已存在的键直接复用，返回新建的刻度与标签"""
+        new_ticks, new_labels = VGroup(), VGroup()
+        half = (up_length + down_length) / 2
+        level_xs = {}  # compound_ticks 时按层级收集，每个层级合成一个 TickPath
+        for key in keys:
+            if key_level(key) == 0 or key in self._sub_tick_keys:
+                continue
+            self._sub_tick_keys.add(key)
+            x = key / 10 ** KEY_DECIMALS
+            if self.compound_ticks:
+                level_xs.setdefault(key_level(key), []).append(x)
+                tick = self._x2pos(x) + DOWN * half  # 标签的锚点：刻度下端
+            else:
+                tick = Line(UP * up_length, DOWN * down_length, color=SUB_TICK_COLOR)
+                tick.move_to(self._x2pos(x))
+                self.sub_ticks.add(tick)
+                new_ticks.add(tick)
+            self.coords.extend("sub_tick", x)
+            
+            if include_numbers:
+                label = cached_text(key_to_text(key), font_size=font_size, color=SUB_TICK_COLOR)
+                label.next_to(tick, DOWN, buff=label_buff)
+                self.sub_labels.add(label)
+                new_labels.add(label)
+                self.coords.extend("sub_label", x)
+        for level, xs in level_xs.items():
+            path = TickPath(xs, length=2 * half, unit=self.scale_factor,
+                            origin=self.center_offset, color=SUB_TICK_COLOR)
+            new_ticks.add(path)
+            if level in self._sub_paths:
+                # 每个层级只保留一个 TickPath：新刻度先单独淡入，随后由 _merge_sub_paths 并入
+                self._pending_sub_paths.append((self._sub_paths[level], path))
+            else:
+                self._sub_paths[level] = path
+                self.sub_ticks.add(path)
+        return new_ticks, new_labels
+
+    def _merge_sub_paths(self, scene: Optional[Scene] = None):
+        """把新建的子刻度并入同层级已有的 TickPath，反复缩放也不会堆积子对象"""
+        for path, new_path in self._pending_sub_paths:
+            path.add_ticks(new_path.xs)
+            if scene is not None:
+                scene.remove(new_path)
+        self._pending_sub_paths = []
 
     def add_sequence_points(
         self, 
@@ -198,27 +602,26 @@ class EnhancedNumberAxis(VGroup):
         label_func: Optional[Callable[[int], str]] = None,
         run_time: float = ANIM_TIME,
         lable_size:int = LABEL_FS,
-        isPlay:bool = True
+        isPlay:bool = True,
+        batched: bool = False,
+        stagger: Optional[float] = None
     ):
-        """添加数列点，支持自定义函数"""
-        for n in range(n_start, n_end + 1):
-            a_n = func(n)
+        """添加数列点，支持自定义函数
+
+        batched=True 时整段 n 用一个 LaggedStart 动画依次出现（间隔 stagger），
+        画面与逐项播放一致，但不再为每一项单独 play/wait。
+        func 可以是 NumPy 向量化函数（对整段 n 一次求值），也可以是普通标量函数。
+        """
+        if isinstance(self.seq_dots, SequencePoints):
+            self._add_cloud_points(n_start, n_end, scene, func, label_func,
+                                   run_time, lable_size, isPlay, batched, stagger)
+            return
+        term_anims = []
+        ns = range(n_start, n_end + 1)
+        values = self._record_terms(func, ns)
+        for n, a_n in zip(ns, values):
             dot = Dot(color=DOT_COLOR).move_to(self._x2pos(a_n))
-            
-            # 创建标签
-            if label_func is not None:
-                label_text = label_func(n)
-            else:
-                if n <= 2:
-                    label_text = f"a_{{{n}}} = {a_n:.2f}"
-                else:
-                    label_text = f"a_{{{n}}}"
-            
-            # 使用MathTex或Text取决于内容
-            if any(c in label_text for c in ['_', '^', '\\']):
-                label = MathTex(f"\\boldsymbol{{{label_text}}}", font_size=lable_size, color=LABEL_COLOR)
-            else:
-                label = Text(label_text, font_size=lable_size, color=LABEL_COLOR)#, weight=BOLD)
+            label = self._make_seq_label(n, a_n, label_func, lable_size)
 
             # 交替显示标签位置
             direction = DOWN if n % 2 == 0 else UP
@@ -226,13 +629,95 @@ class EnhancedNumberAxis(VGroup):
             
             self.seq_dots.add(dot)
             self.seq_labels.add(label)
-            self.seq_n_values.append(n)           
-            if isPlay:
+            if isPlay and batched:
+                term_anims.append([FadeIn(dot), Write(label)])
+            elif isPlay:
                 scene.play(FadeIn(dot), Write(label), run_time=run_time)
                 scene.wait(run_time/2)
         
+        if term_anims:
+            scene.play(staggered_reveal(term_anims, run_time, stagger))
+            scene.wait(run_time/2)
         if not isPlay:
             scene.play(FadeIn(self.seq_dots[n_start-1:n_end]), Write(self.seq_labels[n_start-1:n_end]), run_time=run_time)
+
+    def _record_terms(self, func: Callable[[int], float], ns) -> np.ndarray:
+        """对整段 n 求值一次，并把 (n, a_n) 记入轴上的数列存储"""
+        values = evaluate_sequence(func, ns)
+        self.seq_n_values.extend(ns)
+        self.coords.extend("seq", values)
+        self.sequence_func = func
+        return values
+
+    def _make_seq_label(
+        self,
+        n: int,
+        a_n: float,
+        label_func: Optional[Callable[[int], str]],
+        lable_size: int
+    ) -> Mobject:
+        """创建第 n 项的标签，并记下它的 (文字, 字号)"""
+        if label_func is not None:
+            label_text = label_func(n)
+        else:
+            if n <= 2:
+                label_text = f"a_{{{n}}} = {a_n:.2f}"
+            else:
+                label_text = f"a_{{{n}}}"
+        self.seq_label_keys.append((label_text, lable_size))
+        return self._seq_label_mobject(label_text, lable_size)
+
+    @staticmethod
+    def _seq_label_mobject(label_text: str, lable_size: int) -> Mobject:
+        # 使用MathTex或Text取决于内容
+        if any(c in label_text for c in ['_', '^', '\\']):
+            return MathTex(f"\\boldsymbol{{{label_text}}}", font_size=lable_size, color=LABEL_COLOR)
+        return Text(label_text, font_size=lable_size, color=LABEL_COLOR)#, weight=BOLD)
+
+    def _add_cloud_points(
+        self,
+        n_start: int,
+        n_end: int,
+        scene: Scene,
+        func: Callable[[int], float],
+        label_func: Optional[Callable[[int], str]],
+        run_time: float,
+        lable_size: int,
+        isPlay: bool,
+        batched: bool,
+        stagger: Optional[float]
+    ):
+        """点云模式：一次性把整段数列写进 SequencePoints，再用 RevealTerms 逐项显现"""
+        ns = list(range(n_start, n_end + 1))
+        values = self._record_terms(func, ns)
+        positions = self._xs2pos(values)
+        indices = self.seq_dots.add_terms(positions, opacity=0)
+        r = self.seq_dots.default_radius
+
+        labels = []
+        for n, a_n, pos in zip(ns, values, positions):
+            label = self._make_seq_label(n, a_n, label_func, lable_size)
+            direction = DOWN if n % 2 == 0 else UP
+            label.next_to(pos, direction, buff=0.2 + r).align_to(pos + LEFT * r, LEFT)
+            labels.append(label)
+            self.seq_labels.add(label)
+
+        if isPlay and batched:
+            stagger = 1.5 * run_time if stagger is None else stagger
+            lag = stagger / run_time
+            total = run_time * (1 + (len(ns) - 1) * lag)
+            scene.play(
+                RevealTerms(self.seq_dots, indices, lag_ratio=lag, run_time=total),
+                LaggedStart(*[Write(l, run_time=run_time) for l in labels], lag_ratio=lag)
+            )
+            scene.wait(run_time/2)
+        elif isPlay:
+            for i, label in zip(indices, labels):
+                scene.play(RevealTerms(self.seq_dots, [i]), Write(label), run_time=run_time)
+                scene.wait(run_time/2)
+        else:
+            scene.play(RevealTerms(self.seq_dots, indices), Write(VGroup(*labels)), run_time=run_time)
+
     def add_function_points(
         self,
         func: Callable[[float], float],
@@ -262,6 +747,7 @@ class EnhancedNumberAxis(VGroup):
             
             self.function_dots.add(dot)
             self.function_labels.add(label)
+            self.coords.extend("function", y)
             
             scene.play(FadeIn(dot), Write(label), run_time=run_time)
             scene.wait(run_time/2)
@@ -279,8 +765,16 @@ class EnhancedNumberAxis(VGroup):
         sub_tick_range: Optional[Tuple[float, float]] = None,
         sub_tick_step: Optional[float] = None,
         otherAnimationsTicks: Optional[List[Animation]] = None,
+        vectorized: bool = False,
+        batched_points: bool = False,
     ):
-        """缩放动画，支持中心点移动和子刻度更新"""
+        """缩放动画，支持中心点移动和子刻度更新
+
+        vectorized=True 时由单个 ValueTracker 驱动整条数轴：刻度、标签、点的控制点在缩放开始时
+        并入一个共享缓冲区，每帧只对它做一次 NumPy 原地运算，动画数量与每帧的 Python 调用都不随元素数量增长。
+        已有数列点的位置取自添加时记下的 a_n；sequence_func 只用于 new_points，
+        不传时沿用上一次添加点所用的公式。
+        """
         if new_center is not None:
             self.center_offset = new_center
        
@@ -289,6 +783,74 @@ class EnhancedNumberAxis(VGroup):
         old_scale = self.scale_factor
         self.scale_factor = new_scale
         
+        if vectorized:
+            anims.append(self._begin_tracked_zoom(pointLablesize, sequence_func))
+        else:
+            anims += self._transform_zoom_anims(pointLablesize, sequence_func)
+            self._view = (self.scale_factor, np.array(self.center_offset, dtype=float))
+        if self.viewport is not None:
+            anims += self.viewport.zoom_anims(self.scale_factor, self.center_offset)
+        
+        if otherAnimationsTicks is not None:
+            anims.append(otherAnimationsTicks)
+
+        # 执行动画
+        if scene is not None:
+            scene.play(*anims, run_time=run_time)
+        if vectorized:
+            self._end_tracked_zoom()
+        if self.viewport is not None:
+            self.viewport.finish_zoom(scene)
+
+        if scene is not None:
+            # 添加子刻度（如果需要）
+            if sub_tick_range is not None and sub_tick_step is not None:
+                self.add_sub_ticks(
+                    sub_tick_range[0], 
+                    sub_tick_range[1], 
+                    sub_tick_step, 
+                    animate=True, 
+                    scene=scene
+                )
+            
+            # 添加新点（如果需要）
+            if new_points is not None:
+                self.add_sequence_points(
+                    new_points[0], 
+                    new_points[1],
+                    scene=scene,                     
+                    func=self._resolve_sequence_func(sequence_func),
+                    run_time=run_time/2,
+                    lable_size=pointLablesize,
+                    isPlay=isPlayPoint,
+                    batched=batched_points
+                )
+    
+    def _tick_anims(self, group: VGroup, xs: np.ndarray) -> List[Animation]:
+        """刻度的缩放动画：合成路径整体重排一次，独立 Line 逐个移动"""
+        if self.compound_ticks:
+            return [path.animate.layout(self.scale_factor, self.center_offset) for path in group]
+        return [tick.animate.move_to(pos) for tick, pos in zip(group, self._xs2pos(xs))]
+
+    def _resolve_sequence_func(
+        self,
+        sequence_func: Optional[Callable[[int], float]]
+    ) -> Callable[[int], float]:
+        """新增点使用的通项：显式传入的优先，其次沿用上次添加点时的公式，最后才是 1/n"""
+        if sequence_func is not None:
+            return sequence_func
+        if self.sequence_func is not None:
+            return self.sequence_func
+        return lambda n: 1/n
+
+    def _transform_zoom_anims(
+        self,
+        pointLablesize: int = LABEL_FS,
+        sequence_func: Optional[Callable[[int], float]] = None,
+    ) -> List[Animation]:
+        """逐个元素生成 move_to / Transform 动画（原缩放方式）"""
+        anims = []
+        
         # 更新数轴线条
         new_line = Line(
             self._x2pos(self.x_min), 
@@ -297,23 +859,16 @@ class EnhancedNumberAxis(VGroup):
         )
         anims.append(Transform(self.line, new_line))
         
-        # 更新主刻度及其标签
-        
-        for x, tick, lab in zip(range(self.x_min, self.x_max + 1),
-                                self.ticks, self.labels):            
-            anims += [
-                tick.animate.move_to(self._x2pos(x)),
-                lab.animate.next_to(self._x2pos(x), DOWN, buff=0.3)
-            ]
-        
-        
-        # 更新子刻度及其标签
-        for (tick, lab) in zip(self.sub_ticks, self.sub_labels):
-            x =float(lab.text)
-            anims += [
-                tick.animate.move_to(self._x2pos(x)),
-                lab.animate.next_to(self._x2pos(x), DOWN, buff=0.15)
-            ]
+        # 更新主刻度及其标签（启用视口时由 ViewportTicks 负责）
+        if self.viewport is None:
+            anims += self._tick_anims(self.ticks, self.coords["tick"])
+            for lab, pos in zip(self.labels, self._xs2pos(self.coords["tick_label"])):
+                anims.append(lab.animate.next_to(pos, DOWN, buff=0.3))
+            
+            # 更新子刻度及其标签
+            anims += self._tick_anims(self.sub_ticks, self.coords["sub_tick"])
+            for lab, pos in zip(self.sub_labels, self._xs2pos(self.coords["sub_label"])):
+                anims.append(lab.animate.next_to(pos, DOWN, buff=0.15))
         
         
         # # 更新子刻度标签
@@ -331,91 +886,185 @@ class EnhancedNumberAxis(VGroup):
         #     except (ValueError, AttributeError):
         #         pass
         
-        # 更新数列点
-        for dot, n in zip(self.seq_dots, self.seq_n_values):
-            a_n = sequence_func(n) if sequence_func is not None else 1/n
-            new_dot = Dot(color=dot.get_color()).move_to(self._x2pos(a_n))
-            anims.append(Transform(dot, new_dot))
+        # 更新数列点：直接读取添加点时记下的 a_n，不再重新求值
+        values = self.seq_a_values
+        positions = self._xs2pos(values)
+        if isinstance(self.seq_dots, SequencePoints):
+            anims.append(self.seq_dots.animate.set_positions(positions))
+        else:
+            for dot, pos in zip(self.seq_dots, positions):
+                new_dot = Dot(color=dot.get_color()).move_to(pos)
+                anims.append(Transform(dot, new_dot))
         
-        # 更新数列标签
-        for label, dot, n in zip(self.seq_labels, self.seq_dots, self.seq_n_values):
-            a_n = sequence_func(n) if sequence_func is not None else 1/n
+        # 更新数列标签：文字不变的标签直接移动/缩放，只有文字变化（如 n <= 3 附带数值）才重建
+        for i, (label, n, a_n, pos) in enumerate(
+                zip(self.seq_labels, self.seq_n_values, values, positions)):
             direction = DOWN if n % 2 == 0 else UP
-            if n <= 3 and sequence_func is None:
-                label_text = f"a_{{{n}}} = {a_n:.2f}"
-            else:
-                label_text = f"a_{{{n}}}"
+            label_text = self._zoomed_label_text(n, a_n, sequence_func)
             
-            if any(c in label_text for c in ['_', '^', '\\']):
-                new_label = MathTex(label_text, font_size=pointLablesize, color=LABEL_COLOR)
+            old_text, old_size = self.seq_label_keys[i]
+            if label_text == old_text:
+                target = label.animate
+                if pointLablesize != old_size:
+                    target = target.scale(pointLablesize / old_size)
+                anims.append(target.next_to(pos, direction, buff=0.2))
             else:
-                new_label = Text(label_text, font_size=pointLablesize, color=LABEL_COLOR)
-            
-            new_label.next_to(self._x2pos(a_n), direction, buff=0.2)
-            anims.append(Transform(label, new_label))
+                new_label = self._seq_label_mobject(label_text, pointLablesize)
+                new_label.next_to(pos, direction, buff=0.2)
+                anims.append(Transform(label, new_label))
+            self.seq_label_keys[i] = (label_text, pointLablesize)
         
         # 更新函数点
-        for dot in self.function_dots:
-            x = self._pos2x(dot.get_center())
-            new_dot = Dot(color=dot.get_color()).move_to(self._x2pos(x))
+        function_pos = self._xs2pos(self.coords["function"])
+        for dot, pos in zip(self.function_dots, function_pos):
+            new_dot = Dot(color=dot.get_color()).move_to(pos)
             anims.append(Transform(dot, new_dot))
         
-        # 更新函数标签
-        for label, dot in zip(self.function_labels, self.function_dots):
-            x = self._pos2x(dot.get_center())
-            # 安全地获取标签文本
-            if hasattr(label, 'tex_string'):
-                label_text = label.tex_string
-            elif hasattr(label, 'text'):
-                label_text = label.text
-            else:
-                label_text = ""
-                
-            if any(c in label_text for c in ['_', '^', '\\']):
-                new_label = MathTex(label_text, font_size=LABEL_FS, color=LABEL_COLOR)
-            else:
-                new_label = Text(label_text, font_size=LABEL_FS, color=LABEL_COLOR)
-            
-            new_label.next_to(self._x2pos(x), UP, buff=0.2)
-            anims.append(Transform(label, new_label))
+        # 更新函数标签（文字不随缩放变化，只需移动）
+        for label, pos in zip(self.function_labels, function_pos):
+            anims.append(label.animate.next_to(pos, UP, buff=0.2))
         
-        if otherAnimationsTicks is not None:
-            anims.append(otherAnimationsTicks)
+        return anims
 
-        # 执行动画
-        if scene is not None:
-            scene.play(*anims, run_time=run_time)
-            
-            # 添加子刻度（如果需要）
-            if sub_tick_range is not None and sub_tick_step is not None:
-                self.add_sub_ticks(
-                    sub_tick_range[0], 
-                    sub_tick_range[1], 
-                    sub_tick_step, 
-                    animate=True, 
-                    scene=scene
-                )
-            
-            # 添加新点（如果需要）
-            if new_points is not None:
-                self.add_sequence_points(
-                    new_points[0], 
-                    new_points[1],
-                    scene=scene,                     
-                    func=sequence_func if sequence_func is not None else lambda n: 1/n,                   
-                    run_time=run_time/2,
-                    lable_size=pointLablesize,
-                    isPlay=isPlayPoint
-                )
-    
-    def _pos2x(self, pos: np.ndarray) -> float:
-        """将 Manim 坐标转换为数学坐标 x"""
-        # 确保我们处理的是单个坐标而不是数组
-        if isinstance(pos, np.ndarray):
-            return (pos[0] - self.center_offset[0]) / self.scale_factor
+    @staticmethod
+    def _zoomed_label_text(n: int, a_n: float, sequence_func: Optional[Callable[[int], float]]) -> str:
+        """缩放后第 n 项标签的文字：前 3 项附带数值（换了新通项时不附带）"""
+        if n <= 3 and sequence_func is None:
+            return f"a_{{{n}}} = {a_n:.2f}"
+        return f"a_{{{n}}}"
+
+    def _begin_tracked_zoom(
+        self,
+        pointLablesize: int = LABEL_FS,
+        sequence_func: Optional[Callable[[int], float]] = None,
+    ) -> Animation:
+        """收集所有随缩放移动的元素，返回按进度 alpha 整体重排它们的单个动画"""
+        # 以元素实际所处的布局为起点，而不是可能被外部改写过的 scale_factor
+        old_scale, old_center = self._view
+        seq, function = self.coords["seq"], self.coords["function"]
+        groups = [(self.seq_labels, seq), (self.function_dots, function), (self.function_labels, function)]
+        cloud = self.seq_dots if isinstance(self.seq_dots, SequencePoints) else None
+        if cloud is None:
+            groups.append((self.seq_dots, seq))
         else:
-            # 如果 pos 不是数组，直接返回
-            return pos
+            # 点云中的各项不是独立 mobject，直接整体改写其坐标数组
+            self._zoom_term_xs = seq.copy()
+        self._zoom_paths = []
+        if self.viewport is None:  # 视口刻度自带动画，这里不再重复移动
+            groups += [(self.labels, self.coords["tick_label"]), (self.sub_labels, self.coords["sub_label"])]
+            if self.compound_ticks:
+                # 合成刻度路径每帧按新布局整体重排
+                self._zoom_paths = [*self.ticks, *self.sub_ticks]
+            else:
+                groups += [(self.ticks, self.coords["tick"]), (self.sub_ticks, self.coords["sub_tick"])]
+
+        # 数列标签沿用逐个变换时的规则：文字不变只改字号（逐帧渐变，朝向点的一边不动），
+        # 文字变化的在缩放结束时重建
+        self._zoom_label_sizes, self._zoom_relabels = [], []
+        for i, (label, n, a_n) in enumerate(zip(self.seq_labels, self.seq_n_values, self.seq_a_values)):
+            direction = DOWN if n % 2 == 0 else UP
+            label_text = self._zoomed_label_text(n, a_n, sequence_func)
+            old_text, old_size = self.seq_label_keys[i]
+            if label_text != old_text:
+                self._zoom_relabels.append((i, label_text, direction))
+            elif pointLablesize != old_size:
+                self._zoom_label_sizes.append((label, pointLablesize / old_size, -direction))
+            self.seq_label_keys[i] = (label_text, pointLablesize)
+        self._zoom_alpha = 0.0
+
+        # 每个元素的数学坐标直接取自坐标表，标签与刻度/点保持原有的相对偏移
+        resized = {id(label) for label, _, _ in self._zoom_label_sizes}
+        mobs, xs, leaves, leaf_xs = [], [], [], []
+        for group, coords in groups:
+            for mob, x in zip(group.submobjects, coords):
+                if id(mob) in resized:
+                    mobs.append(mob)
+                    xs.append(x)
+                    continue
+                for leaf in mob.family_members_with_points():
+                    leaves.append(leaf)
+                    leaf_xs.append(np.full(len(leaf.points), x))
+        self._zoom_mobs = mobs
+        self._zoom_xs = np.array(xs, dtype=float)
+        self._share_zoom_points(leaves, leaf_xs)
+        self._zoom_path = (old_scale, self.scale_factor,
+                           old_center, np.array(self.center_offset, dtype=float))
+
+        self.zoom_tracker.set_value(0)
+        # 由动画本身驱动每帧重排：场景里常常只加入了数轴的部件（line / ticks ……），
+        # 挂在数轴上的 updater 不会被执行。动画对象必须是数轴本身，
+        # 否则 Cairo 会把数轴当成静止物体烘进静态底图，缩放期间画面不动
+        return UpdateFromAlphaFunc(self, self._tracked_zoom_step, suspend_mobject_updating=False)
+
+    def _tracked_zoom_step(self, axis: "EnhancedNumberAxis", alpha: float):
+        self.zoom_tracker.set_value(alpha)
+        s0, s1, c0, c1 = self._zoom_path
+        self._apply_view(interpolate(s0, s1, alpha), interpolate(c0, c1, alpha))
+        self._scale_zoom_labels(alpha)
+
+    def _scale_zoom_labels(self, alpha: float):
+        prev = self._zoom_alpha
+        for label, ratio, edge in self._zoom_label_sizes:
+            label.scale(interpolate(1, ratio, alpha) / interpolate(1, ratio, prev), about_edge=edge)
+        self._zoom_alpha = alpha
+
+    def _end_tracked_zoom(self):
+        _, s1, _, c1 = self._zoom_path
+        self._apply_view(s1, c1)  # 保证最终精确落位
+        self._scale_zoom_labels(1.0)
+        self._release_zoom_points()
+        positions = self._xs2pos(self.seq_a_values)
+        for i, label_text, direction in self._zoom_relabels:
+            new_label = self._seq_label_mobject(label_text, self.seq_label_keys[i][1])
+            self.seq_labels[i].become(new_label.next_to(positions[i], direction, buff=0.2))
+        self._zoom_label_sizes, self._zoom_relabels = [], []
+        self._zoom_mobs, self._zoom_xs = [], np.zeros(0)
+        self._zoom_term_xs = np.zeros(0)
+        self._zoom_paths = []
+
+    def _share_zoom_points(self, leaves: List[Mobject], leaf_xs: List[np.ndarray]):
+        """把各子对象的控制点并入一个缓冲区，子对象的 points 改为其中的视图"""
+        self._zoom_leaves = leaves
+        if not leaves:
+            self._zoom_buffer, self._zoom_point_xs = np.zeros((0, 3)), np.zeros(0)
+            return
+        self._zoom_buffer = np.concatenate([leaf.points for leaf in leaves])
+        self._zoom_point_xs = np.concatenate(leaf_xs)
+        start = 0
+        for leaf in leaves:
+            end = start + len(leaf.points)
+            leaf.points = self._zoom_buffer[start:end]
+            start = end
+
+    def _release_zoom_points(self):
+        """缩放结束后让各子对象重新持有独立的点数组"""
+        for leaf in self._zoom_leaves:
+            leaf.points = leaf.points.copy()
+        self._zoom_leaves = []
+        self._zoom_buffer, self._zoom_point_xs = np.zeros((0, 3)), np.zeros(0)
+
+    def _apply_view(self, scale: float, center: np.ndarray):
+        """按相对上一帧的布局变化，对共享缓冲区做一次原地平移（x 方向位移与数学坐标成正比）"""
+        prev_scale, prev_center = self._view
+        dx = center[0] - prev_center[0]
+        dy = center[1] - prev_center[1]
+        self._zoom_buffer[:, 0] += dx + self._zoom_point_xs * (scale - prev_scale)
+        self._zoom_buffer[:, 1] += dy
+        for mob, x in zip(self._zoom_mobs, self._zoom_xs):
+            mob.shift(np.array([dx + x * (scale - prev_scale), dy, 0]))
+        if len(self._zoom_term_xs):
+            positions = self.seq_dots.positions.copy()
+            positions[:, 0] += dx + self._zoom_term_xs * (scale - prev_scale)
+            positions[:, 1] += dy
+            self.seq_dots.set_positions(positions)
+        for path in self._zoom_paths:
+            path.layout(scale, center)
+
+        self.line.put_start_and_end_on(
+            center + RIGHT * self.x_min * scale,
+            center + RIGHT * self.x_max * scale
+        )
+        self._view = (scale, np.array(center, dtype=float))
 
 class DemoScene(Scene):
     def construct(self):
@@ -449,7 +1098,8 @@ class DemoScene(Scene):
             scene=self,           
             sub_tick_range=None,
             sub_tick_step=.1,
-            sequence_func=lambda n: np.sin(n)/n
+            sequence_func=lambda n: np.sin(n)/n,
+            vectorized=True
         )
         # axis.add_function_points(
         #     func=lambda x: np.sin(x),
@@ -459,10 +1109,10 @@ class DemoScene(Scene):
         #     label_func=lambda x: f"\\sin({x:.1f}) = {np.sin(x):.2f}"
         # )
          # 第二次缩放
-        axis.zoom_to(new_scale=21,scene=self,new_points=(8,13))
-        axis.zoom_to(new_scale=11,scene=self)
-        axis.zoom_to(new_scale=5,scene=self)
-        axis.zoom_to(new_scale=5,new_center=DOWN+LEFT,scene=self)
+        axis.zoom_to(new_scale=21,scene=self,new_points=(8,13),vectorized=True)
+        axis.zoom_to(new_scale=11,scene=self,vectorized=True)
+        axis.zoom_to(new_scale=5,scene=self,vectorized=True)
+        axis.zoom_to(new_scale=5,new_center=DOWN+LEFT,scene=self,vectorized=True)
         # self.wait(1)
         
         # # 添加函数点
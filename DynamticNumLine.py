@@ -2,6 +2,8 @@ from manim import *
 import numpy as np
 from typing import Optional
 
+from TexPipeline import install_tex_cache
+
 # --------------------- 常量区 ---------------------
 TITLE_TEXT       = "数列极限的动态演示"
 TITLE_SIZE       = 41
@@ -329,6 +331,8 @@ config.tex_template = TexTemplate(
 \usepackage{amsmath,amssymb}
 """
 )
+# 所有 MathTex / Tex 走共享的磁盘缓存
+install_tex_cache()
 
 
 
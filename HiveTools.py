@@ -0,0 +1,193 @@
+from manim import *
+import numpy as np
+from typing import List, Optional, Sequence
+
+# --------------------- 常量区 ---------------------
+HIVE_MAX_DEPTH = 10
+
+
+def _unit_square_points() -> np.ndarray:
+    """边长为 1、中心在原点的正方形（4 段直线写成三次贝塞尔，16 个控制点）"""
+    corners = np.array([UR, UL, DL, DR, UR]) / 2
+    points = []
+    for a, b in zip(corners[:-1], corners[1:]):
+        points += [a, interpolate(a, b, 1 / 3), interpolate(a, b, 2 / 3), b]
+    return np.array(points)
+
+
+UNIT_SQUARE = _unit_square_points()
+
+
+# --------------------- 分割树 ---------------------
+class SplitTree:
+    """“切蛋糕”式的逐层对半分割，只在下标数组上完成。
+
+    centers 为各格子中心 (N, 2) 或 (N, 3)。第 depth 层沿 axis = depth % 2 方向
+    （0 为 x，1 为 y）把每组按坐标排序后对半分（前 n//2 个为左/下半）。
+    全部层次只重排一次下标：order 是格子下标的排列，第 d 层的每一组都是
+    order 上的一段连续切片 order[bounds[d][g]:bounds[d][g + 1]]。
+    每层用一次 np.lexsort（组号为主键、坐标为次键）同时排好所有组，排序稳定，
+    与逐组 list.sort(key=get_center) 的结果一致。
+    """
+
+    def __init__(self, centers: np.ndarray, max_depth: int = HIVE_MAX_DEPTH):
+        self.centers = np.asarray(centers, dtype=float)
+        self.max_depth = max_depth
+        n = len(self.centers)
+        order = np.arange(n)
+        bounds = [np.array([0, n])]
+        for depth in range(max_depth):
+            parent = bounds[-1]
+            group_of_pos = np.repeat(np.arange(len(parent) - 1), np.diff(parent))
+            coord = self.centers[order, depth % 2]
+            # 组号是主键：只在组内重排，前面各层的切片仍是同一批格子
+            order = order[np.lexsort((coord, group_of_pos))]
+            mids = parent[:-1] + np.diff(parent) // 2
+            child = np.empty(2 * len(parent) - 1, dtype=int)
+            child[0::2] = parent
+            child[1::2] = mids
+            bounds.append(child)
+        self.order = order
+        self.bounds = bounds
+
+    def num_groups(self, depth: int) -> int:
+        return len(self.bounds[depth]) - 1
+
+    def groups(self, depth: int) -> List[np.ndarray]:
+        """第 depth 层所有组的格子下标（order 上的切片视图，不复制）"""
+        b = self.bounds[depth]
+        return [self.order[b[g]:b[g + 1]] for g in range(len(b) - 1)]
+
+    def group_ids(self, depth: int) -> np.ndarray:
+        """每个格子在第 depth 层所属组的编号 (N,)"""
+        b = self.bounds[depth]
+        ids = np.empty(len(self.order), dtype=int)
+        ids[self.order] = np.repeat(np.arange(len(b) - 1), np.diff(b))
+        return ids
+
+    def split_offsets(
+        self,
+        depth: int,
+        positions: np.ndarray,
+        cell_size: Sequence[float],
+        gap_step: float = 0.0
+    ) -> np.ndarray:
+        """第 depth 层分裂时每个格子的位移 (N, 3)。
+
+        沿 axis = (depth - 1) % 2 方向，每对兄弟组各自退开 gap = (两组宽度之和) / 2 + gap_step，
+        左/下半（偶数组）向负方向，右/上半向正方向；组宽按当前位置和格子尺寸计算。
+        """
+        axis = (depth - 1) % 2
+        ids = self.group_ids(depth)
+        num = self.num_groups(depth)
+        half = cell_size[axis] / 2
+        coord = np.asarray(positions, dtype=float)[:, axis]
+        lo = np.full(num, np.inf)
+        hi = np.full(num, -np.inf)
+        np.minimum.at(lo, ids, coord - half)
+        np.maximum.at(hi, ids, coord + half)
+        extent = np.where(hi > lo, hi - lo, 0.0)        # 空组宽度记为 0
+        gap = (extent[0::2] + extent[1::2]) / 2 + gap_step
+        offsets = np.zeros((len(ids), 3))
+        offsets[:, axis] = np.where(ids % 2, 1.0, -1.0) * gap[ids // 2]
+        return offsets
+
+
+# --------------------- 格子阵列 ---------------------
+class CellArray(VMobject):
+    """同色矩形格子的紧凑容器：所有格子是同一个 VMobject 里的子路径。
+
+    格子中心 positions (N, 3) 与统一尺寸 cell_size (宽, 高) 保存在 NumPy 数组中，
+    平移、缩放以及 Transform / .animate 都会同步更新；整层移动用 ShiftCells 一次完成。
+    """
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        width: float,
+        height: float,
+        color: ParsableManimColor = WHITE,
+        opacity: float = 1.0,
+        **kwargs
+    ):
+        super().__init__(fill_color=color, fill_opacity=opacity, stroke_width=0, **kwargs)
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        if positions.shape[1] == 2:
+            positions = np.hstack([positions, np.zeros((len(positions), 1))])
+        self.positions = positions
+        self.cell_size = np.array([width, height], dtype=float)
+        self._rebuild()
+
+    @property
+    def num_cells(self) -> int:
+        return len(self.positions)
+
+    def _rebuild(self):
+        scale = np.array([*self.cell_size, 1.0])
+        self.set_points(
+            (self.positions[:, None, :] + UNIT_SQUARE[None] * scale).reshape(-1, 3)
+        )
+
+    def set_positions(self, positions: np.ndarray):
+        self.positions = np.asarray(positions, dtype=float).copy()
+        self._rebuild()
+        return self
+
+    def get_cell_center(self, index: int) -> np.ndarray:
+        return self.positions[index].copy()
+
+    # ------------- 与 Mobject 变换保持同步 -------------
+    def shift(self, *vectors):
+        super().shift(*vectors)
+        self.positions += np.sum(vectors, axis=0)
+        return self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            about_point = self.get_critical_point(ORIGIN if about_edge is None else about_edge)
+        about_point = np.array(about_point, dtype=float)
+        super().apply_points_function_about_point(func, about_point=about_point)
+        if self.num_cells:
+            self.positions = func(self.positions - about_point) + about_point
+            basis = func(np.array([ORIGIN, RIGHT, UP], dtype=float))
+            self.cell_size = self.cell_size * np.array([
+                np.linalg.norm(basis[1] - basis[0]),
+                np.linalg.norm(basis[2] - basis[0]),
+            ])
+        return self
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path()):
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if (
+            isinstance(mobject1, CellArray)
+            and isinstance(mobject2, CellArray)
+            and mobject1.num_cells == mobject2.num_cells
+        ):
+            self.positions = path_func(mobject1.positions, mobject2.positions, alpha)
+            self.cell_size = interpolate(mobject1.cell_size, mobject2.cell_size, alpha)
+        return self
+
+
+class ShiftCells(Animation):
+    """按逐格位移数组 offsets (N, 3) 同时移动 CellArray 的全部格子。
+
+    开始时把位移展开到每个控制点，之后每帧只做一次数组加法，
+    与格子数量、分组数量无关。
+    """
+
+    def __init__(self, cells: CellArray, offsets: np.ndarray, **kwargs):
+        self.offsets = np.asarray(offsets, dtype=float)
+        super().__init__(cells, **kwargs)
+
+    def begin(self):
+        self.start_positions = self.mobject.positions.copy()
+        self.start_points = self.mobject.points.copy()
+        self.point_offsets = np.repeat(self.offsets, len(UNIT_SQUARE), axis=0)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        self.mobject.points = self.start_points + self.rate_func(alpha) * self.point_offsets
+
+    def finish(self):
+        super().finish()
+        self.mobject.positions = self.start_positions + self.rate_func(1) * self.offsets
@@ -0,0 +1,298 @@
+from manim import *
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+# --------------------- 常量区 ---------------------
+GLYPH_CACHE_SIZE = 512      # 进程内最多缓存的标签原型数量
+PREFETCH_WORKERS = max(1, (os.cpu_count() or 2) // 2)   # 后台排版线程数，其余核心留给渲染
+
+# --------------------- 可复用组件 ---------------------
+class GlyphCache:
+    """进程级标签缓存：相同 (文本, 字体, 字号, 颜色) 只渲染解析一次，之后只发放副本。
+    prefetch 把原型的构造提前交给后台线程，get 遇到还在构造中的键时等它完成而不是重复构造。
+    """
+
+    def __init__(self, max_size: int = GLYPH_CACHE_SIZE):
+        self.max_size = max_size
+        self._store: "OrderedDict[Hashable, Mobject]" = OrderedDict()
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._generation = 0        # clear() 时加一，清空之前开始的构造不再写回缓存
+        self.hits = 0
+        self.misses = 0
+
+    def _build(self, key: Hashable, factory: Callable[[], Mobject], generation: int) -> Mobject:
+        try:
+            proto = factory()
+        except BaseException:
+            with self._lock:
+                if generation == self._generation:
+                    self._pending.pop(key, None)
+            raise
+        with self._lock:
+            self.misses += 1
+            if generation != self._generation:
+                return proto
+            self._store[key] = proto
+            if len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+            self._pending.pop(key, None)
+        return proto
+
+    def get(self, key: Hashable, factory: Callable[[], Mobject]) -> Mobject:
+        """命中则复制原型；正在后台构造则等待；否则调用 factory 生成原型并按 LRU 淘汰"""
+        pending = None
+        with self._lock:
+            proto = self._store.get(key)
+            if proto is not None:
+                self.hits += 1
+                self._store.move_to_end(key)
+            else:
+                pending = self._pending.get(key)
+            generation = self._generation
+        if proto is None:
+            # 后台构造出错时，异常在这里（第一次用到时）抛出
+            proto = pending.result() if pending is not None else self._build(key, factory, generation)
+        return proto.copy()
+
+    def prefetch(self, key: Hashable, factory: Callable[[], Mobject]) -> Future:
+        """在后台线程中构造原型（已缓存或已在构造中则不重复提交）"""
+        with self._lock:
+            if key in self._store:
+                future = Future()
+                future.set_result(self._store[key])
+                return future
+            future = self._pending.get(key)
+            if future is None:
+                future = _prefetch_pool().submit(self._build, key, factory, self._generation)
+                self._pending[key] = future
+        return future
+
+    def wait(self):
+        """等待所有后台构造结束（成功与否都不抛出）"""
+        with self._lock:
+            pending = list(self._pending.values())
+        wait(pending)
+
+    def clear(self):
+        """清空缓存；尚未开始的后台构造直接取消，已在进行的完成后也不再写回"""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._generation += 1
+            self._store.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._store),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+_PREFETCH_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _prefetch_pool() -> ThreadPoolExecutor:
+    global _PREFETCH_POOL
+    if _PREFETCH_POOL is None:
+        _PREFETCH_POOL = ThreadPoolExecutor(PREFETCH_WORKERS, thread_name_prefix="glyph-prefetch")
+    return _PREFETCH_POOL
+
+
+GLYPH_CACHE = GlyphCache()
+
+
+def _color_key(color) -> str:
+    """把各种颜色写法统一成十六进制字符串，保证缓存键可哈希且不重复"""
+    return ManimColor(color).to_hex()
+
+
+def _text_entry(text: str, font_size: float, color, font: str) -> Tuple[Hashable, Callable[[], Text]]:
+    key = ("Text", text, font, font_size, _color_key(color))
+    return key, lambda: Text(text, font_size=font_size, color=color, font=font)
+
+
+def cached_text(
+    text: str,
+    font_size: float = DEFAULT_FONT_SIZE,
+    color=WHITE,
+    font: str = "",
+) -> Text:
+    """从全局缓存中取一个 Text 副本（原型位于 ORIGIN，取出后自行定位）"""
+    return GLYPH_CACHE.get(*_text_entry(text, font_size, color, font))
+
+
+def _kwargs_key(kwargs: dict) -> tuple:
+    """把其余构造参数转成可哈希的键（颜色统一成十六进制）"""
+    items = []
+    for k, v in sorted(kwargs.items()):
+        if k.endswith("color") and v is not None:
+            v = _color_key(v)
+        items.append((k, repr(v)))
+    return tuple(items)
+
+
+def _tex_entry(tex_strings: tuple, kwargs: dict) -> Tuple[Hashable, Callable[[], MathTex]]:
+    key = ("MathTex", tex_strings, _kwargs_key(kwargs))
+    return key, lambda: MathTex(*tex_strings, **kwargs)
+
+
+def cached_tex(*tex_strings: str, **kwargs) -> MathTex:
+    """从全局缓存中取一个 MathTex 副本：相同的 (各段字符串, 参数) 只编译解析一次"""
+    return GLYPH_CACHE.get(*_tex_entry(tex_strings, kwargs))
+
+
+# --------------------- 后台预取 ---------------------
+class Prefetched:
+    """prefetch_tex / prefetch_text 的返回值：构造已在后台线程进行，result() 取一个副本（未完成则等待）"""
+
+    def __init__(self, key: Hashable, factory: Callable[[], Mobject]):
+        self.key = key
+        self.factory = factory
+        self.future = GLYPH_CACHE.prefetch(key, factory)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self) -> Mobject:
+        return GLYPH_CACHE.get(self.key, self.factory)
+
+
+def prefetch_tex(*tex_strings: str, **kwargs) -> Prefetched:
+    """提前排版一个公式：LaTeX 在后台线程里跑，与前面动画的渲染重叠。
+    参数与 cached_tex 相同；之后用相同参数调用 cached_tex（或 LiveTex）也会直接拿到这份结果。
+    """
+    return Prefetched(*_tex_entry(tex_strings, kwargs))
+
+
+def prefetch_text(
+    text: str,
+    font_size: float = DEFAULT_FONT_SIZE,
+    color=WHITE,
+    font: str = "",
+) -> Prefetched:
+    """cached_text 的后台预取版本"""
+    return Prefetched(*_text_entry(text, font_size, color, font))
+
+
+class LiveTex(VGroup):
+    """随数值实时变化的公式标签，用来代替 always_redraw(lambda: MathTex(f"..."))。
+
+    parts 中的字符串是静态部分，可调用对象每帧返回变化的部分（如 f"{eps:.2f}"）。
+    构造时把全部段落连同各动态部分的初值排版一次，记下相邻两段之间的间距；之后静态部分不再重新编译。
+    某个动态部分的字符串真正改变时，只单独排版这一段（cached_tex 按字符串复用），
+    按基线对齐后换下旧的子对象，再依记下的间距从左到右重新排好各段。
+    为此每段排版时前面都带一个基线锚点 BASELINE_ANCHOR，因此每个动态部分都必须能单独编译
+    （例如不能把 \\left( 与 \\right) 拆到不同的段里）。
+    一段可能被 MathTex 的 {{ }} 记法拆成多个子对象，因此各段按它自己拆出的 tex_string 个数
+    从排版结果中取子对象，每段是一个 VGroup。
+    字符串不变的帧什么都不做；placement 每帧调用一次，用来摆放位置。
+    下标访问 live[i] 取当前的第 i 段。
+    """
+
+    BASELINE_ANCHOR = "0"
+
+    def __init__(
+        self,
+        *parts: Union[str, Callable[[], str]],
+        placement: Optional[Callable[["LiveTex"], object]] = None,
+        **tex_kwargs
+    ):
+        super().__init__()
+        self.parts = parts
+        self.placement = placement
+        self.tex_kwargs = tex_kwargs
+        self._strings = self._render_strings()
+        reference = cached_tex(self.BASELINE_ANCHOR, *self._strings, **tex_kwargs)
+        anchor, *self.pieces = _split_parts(reference, (self.BASELINE_ANCHOR, *self._strings))
+        self._widths = [_width(piece) for piece in self.pieces]  # 各段未缩放时的宽度，用来换算当前缩放
+        self._gaps = [
+            b.get_left()[0] - a.get_right()[0] if _has_points(a) and _has_points(b) else 0
+            for a, b in zip(self.pieces, self.pieces[1:])
+        ]
+        self._anchor_height = anchor.height
+        # 基线只用一个不可见的点记录，放在第一段左端，不撑大标签的包围盒
+        left = next((piece.get_left()[0] for piece in self.pieces if _has_points(piece)), anchor.get_right()[0])
+        self.baseline = VectorizedPoint([left, anchor.get_bottom()[1], 0])
+        self.add(*self.pieces, self.baseline)
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def _render_strings(self) -> tuple:
+        return tuple(p() if callable(p) else p for p in self.parts)
+
+    def _scale(self) -> float:
+        """标签相对构造时排版结果的缩放倍数"""
+        for piece, width in zip(self.pieces, self._widths):
+            if width > 0 and _has_points(piece):
+                return piece.width / width
+        return 1
+
+    def _swap_piece(self, index: int, string: str, scale: float):
+        tex = cached_tex(self.BASELINE_ANCHOR, string, **self.tex_kwargs)
+        anchor, piece = _split_parts(tex, (self.BASELINE_ANCHOR, string))
+        tex.scale(scale * self._anchor_height / anchor.height, about_point=anchor.get_bottom())
+        tex.shift(UP * (self.baseline.get_center()[1] - anchor.get_bottom()[1]))
+        old = self.pieces[index]
+        self._widths[index] = _width(piece) / scale
+        self.pieces[index] = piece
+        self.submobjects[self.submobjects.index(old)] = piece
+
+    def _relayout(self, scale: float):
+        """从基线点起，按构造时记下的间距从左到右依次摆放各段（只改水平位置）"""
+        cursor = self.baseline.get_center()[0]
+        for piece, gap in zip(self.pieces, [*self._gaps, 0]):
+            if _has_points(piece):
+                piece.shift(RIGHT * (cursor - piece.get_left()[0]))
+                cursor = piece.get_right()[0]
+            cursor += gap * scale
+
+    def refresh(self):
+        strings = self._render_strings()
+        if strings != self._strings:
+            scale = self._scale()
+            for index, (old, new) in enumerate(zip(self._strings, strings)):
+                if old != new:
+                    self._swap_piece(index, new, scale)
+            self._strings = strings
+            self._relayout(scale)
+        if self.placement is not None:
+            self.placement(self)
+        return self
+
+    def __getitem__(self, value):
+        return self.pieces[value]
+
+
+def _has_points(mob: Mobject) -> bool:
+    return any(m.has_points() for m in mob.get_family())
+
+
+def _width(mob: Mobject) -> float:
+    return mob.width if _has_points(mob) else 0
+
+
+def _split_parts(tex: MathTex, parts: tuple) -> list:
+    """按 MathTex 对每段字符串的拆分结果（{{ }} 会把一段拆成几段、空串不占子对象），
+    把 tex 的子对象分回各段，每段一个 VGroup"""
+    counts = [len(tex._prepare_tex_strings([part])) for part in parts]
+    if sum(counts) != len(tex.submobjects):
+        raise ValueError(f"Cannot map the typeset parts of {tex.tex_string!r} back to {parts!r}")
+    groups, start = [], 0
+    for count in counts:
+        groups.append(VGroup(*tex.submobjects[start:start + count]))
+        start += count
+    return groups
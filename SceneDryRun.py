@@ -0,0 +1,248 @@
+from manim import *
+import argparse
+import importlib.util
+import json
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import manim.mobject.text.tex_mobject as tex_mobject
+
+import TexPipeline
+from LabelCache import GLYPH_CACHE
+
+# --------------------- 常量区 ---------------------
+PLACEHOLDER_GLYPH = (5.0, 7.0)      # 占位 SVG 中每个字符方块的宽、高（SVG 单位）
+# 不占字形的排版命令，估算字符数时跳过
+LAYOUT_COMMANDS = {
+    "left", "right", "big", "Big", "bigg", "Bigg", "quad", "qquad", "displaystyle",
+    "textstyle", "mathrm", "mathbf", "mathit", "mathbb", "mathcal", "text", "textbf",
+    "operatorname", "limits", "nolimits", "begin", "end", "hspace", "vspace", "color",
+}
+_SPECIAL = re.compile(r"\\special\{dvisvgm:raw\s*(?:<g id='([^']*)'>|(</g>))\}")
+_COMMAND = re.compile(r"\\([a-zA-Z]+|.)")
+
+
+# --------------------- 占位 SVG ---------------------
+def glyph_count(tex: str) -> int:
+    """粗略估计一段 Tex 排出来的字形数量：每个命令记 1 个（排版命令记 0），其余可见字符各记 1 个"""
+    count = 0
+    for match in _COMMAND.finditer(tex):
+        name = match.group(1)
+        count += name.isalpha() and name not in LAYOUT_COMMANDS
+    rest = _COMMAND.sub("", tex)
+    return count + sum(not c.isspace() and c not in "{}^_&$" for c in rest)
+
+
+def placeholder_svg(expression: str) -> str:
+    """与 dvisvgm 输出结构相同的占位 SVG：保留 MathTex 用 \\special 标出的 <g id> 分组，
+    每个字形画成一个小方块，这样 MathTex 的分段、下标访问都能照常工作。
+    """
+    width, height = PLACEHOLDER_GLYPH
+    body = []
+    x = 0.0
+    pos = 0
+    for match in list(_SPECIAL.finditer(expression)) + [None]:
+        chunk = expression[pos:match.start() if match else len(expression)]
+        for _ in range(glyph_count(chunk)):
+            body.append(f'<path d="M {x} 0 h {width * 0.8} v {-height} h {-width * 0.8} z"/>')
+            x += width
+        if match is None:
+            break
+        body.append("</g>" if match.group(2) else f'<g id="{match.group(1)}">')
+        pos = match.end()
+    view = f"0 {-height} {max(x, width)} {height}"
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view}">'
+        f'<g id="root">{"".join(body)}</g></svg>'
+    )
+
+
+# --------------------- 场景分析 ---------------------
+def _family_stats(scene: Scene) -> Tuple[int, int]:
+    """场景中 mobject（含子对象）的数量与控制点总数"""
+    family = scene.get_mobject_family_members()
+    return len(family), sum(len(getattr(m, "points", ())) for m in family)
+
+
+def _active_updaters(scene: Scene) -> Dict[str, int]:
+    """当前生效的 updater，按 "类型:函数名" 计数"""
+    counts = Counter()
+    for mob in scene.get_mobject_family_members():
+        for updater in mob.updaters:
+            counts[f"{type(mob).__name__}:{getattr(updater, '__qualname__', type(updater).__name__)}"] += 1
+    for updater in scene.updaters:
+        counts[f"Scene:{getattr(updater, '__qualname__', type(updater).__name__)}"] += 1
+    return dict(counts)
+
+
+class SceneAnalyzer:
+    """空跑一个场景的 construct：不栅格化、不编码，只收集渲染前就能知道的信息。
+
+    动画按 manim 的跳过模式执行（每段只插值到终点一次），场景状态与真正渲染一致；
+    Tex 已在共享缓存里的直接用真实 SVG，否则换成同结构的占位 SVG，不启动 LaTeX。
+    run() 返回的清单包括：请求过的全部 Tex / Text 字符串、每次 play / wait 的时长与动画、
+    每段的 mobject 数、控制点数和生效的 updater，以及总时长、总帧数等汇总。
+    """
+
+    def __init__(self, scene_class: type):
+        self.scene_class = scene_class
+        self.tex: Dict[Tuple[str, Optional[str]], bool] = {}    # (表达式, 环境) -> 是否已缓存
+        self.text: Dict[Tuple[str, str], None] = {}
+        self.segments: List[dict] = []
+        self.time = 0.0
+        self._placeholder_dir = TexPipeline.get_tex_cache().directory / "dryrun"
+
+    # ------------- 钩子 -------------
+    def _tex_to_svg_file(
+        self,
+        expression: str,
+        environment: Optional[str] = None,
+        tex_template: Optional[TexTemplate] = None
+    ) -> Path:
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        key = TexPipeline.tex_key(expression, environment, tex_template)
+        path = TexPipeline.get_tex_cache().get(key)
+        self.tex.setdefault((expression, environment), path is not None)
+        if path is not None:
+            return path
+        path = self._placeholder_dir / f"{key}.svg"
+        if not path.exists():
+            self._placeholder_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(placeholder_svg(expression), encoding="utf-8")
+        return path
+
+    def _wrap_text_init(self, cls: type):
+        original = cls.__init__
+
+        def __init__(mob, text, *args, **kwargs):
+            self.text.setdefault((text, kwargs.get("font", "")), None)
+            original(mob, text, *args, **kwargs)
+
+        cls.__init__ = __init__
+        return original
+
+    def _wrap_play(self, scene: Scene):
+        original = scene.renderer.play
+
+        def play(scene_, *args, **kwargs):
+            mobjects, points = _family_stats(scene)
+            updaters = _active_updaters(scene)
+            original(scene_, *args, **kwargs)
+            after = _family_stats(scene)
+            animations = scene.animations or []
+            self.segments.append({
+                "index": len(self.segments),
+                "kind": "wait" if animations and all(isinstance(a, Wait) for a in animations) else "play",
+                "start": round(self.time, 6),
+                "run_time": scene.duration,
+                "animations": [type(a).__name__ for a in animations],
+                "mobjects": max(mobjects, after[0]),
+                "points": max(points, after[1]),
+                "updaters": updaters,
+            })
+            self.time += scene.duration
+
+        scene.renderer.play = play
+
+    # ------------- 执行 -------------
+    def run(self) -> dict:
+        started = time.perf_counter()
+        with tempconfig({"dry_run": True, "disable_caching": True}):
+            scene = self.scene_class()
+            scene.renderer.skip_animations = True
+            scene.renderer._original_skipping_status = True
+            self._wrap_play(scene)
+            patched = {cls: self._wrap_text_init(cls) for cls in (Text, MarkupText)}
+            tex_to_svg_file = tex_mobject.tex_to_svg_file
+            compile_tex_batch = TexPipeline.compile_tex_batch
+            tex_mobject.tex_to_svg_file = self._tex_to_svg_file
+            # construct 开头的 precompile_scene_tex 在空跑时不编译
+            TexPipeline.compile_tex_batch = lambda *args, **kwargs: 0
+            try:
+                scene.setup()
+                scene.construct()
+            finally:
+                # 后台预取可能还在用占位钩子排版，等它们结束再恢复钩子
+                GLYPH_CACHE.wait()
+                tex_mobject.tex_to_svg_file = tex_to_svg_file
+                TexPipeline.compile_tex_batch = compile_tex_batch
+                for cls, original in patched.items():
+                    cls.__init__ = original
+                # 缓存里的标签原型可能是用占位 SVG 建的，不能留给真正的渲染
+                GLYPH_CACHE.clear()
+            frame_rate = config["frame_rate"]
+        return self.manifest(frame_rate, time.perf_counter() - started)
+
+    def manifest(self, frame_rate: float, elapsed: float) -> dict:
+        return {
+            "scene": self.scene_class.__name__,
+            "file": str(Path(sys.modules[self.scene_class.__module__].__file__).resolve()),
+            "tex": [[expression, environment] for expression, environment in self.tex],
+            "tex_uncached": sum(not cached for cached in self.tex.values()),
+            "text": [[text, font] for text, font in self.text],
+            "segments": self.segments,
+            "plays": sum(s["kind"] == "play" for s in self.segments),
+            "waits": sum(s["kind"] == "wait" for s in self.segments),
+            "duration": self.time,
+            "frames": sum(int(np.ceil(s["run_time"] * frame_rate)) for s in self.segments),
+            "peak_mobjects": max((s["mobjects"] for s in self.segments), default=0),
+            "peak_points": max((s["points"] for s in self.segments), default=0),
+            "analysis_seconds": round(elapsed, 3),
+        }
+
+
+# --------------------- 清单的去处 ---------------------
+def manifest_path(scene_class: type) -> Path:
+    return TexPipeline.get_tex_cache().directory / "manifests" / TexPipeline.scene_tex_list_path(scene_class).name
+
+
+def save_manifest(scene_class: type, manifest: dict, path: Optional[Path] = None) -> Path:
+    """写出清单，同时把其中的 Tex 写成该场景的字符串清单，下次渲染时由 precompile_scene_tex 批量编译"""
+    path = manifest_path(scene_class) if path is None else Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+    tex_list = TexPipeline.SceneTexList(TexPipeline.scene_tex_list_path(scene_class))
+    for expression, environment in manifest["tex"]:
+        tex_list.record(expression, environment)
+    tex_list.save()
+    return path
+
+
+def load_scene_class(file: str, name: str) -> type:
+    """按文件路径载入场景模块；仓库根目录放在 sys.path 最前，保证导入的是根目录下的公共模块"""
+    root = str(Path(__file__).resolve().parent)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    module_name = Path(file).stem
+    spec = importlib.util.spec_from_file_location(module_name, file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a scene's construct without rendering and write a manifest")
+    parser.add_argument("file", help="scene module, e.g. 极限/DynamticNumLine.py")
+    parser.add_argument("scene", help="scene class name, e.g. SequenceLimitWithZoom")
+    parser.add_argument("--output", help="manifest path (default: under the Tex cache directory)")
+    parser.add_argument("--precompile", action="store_true", help="batch-compile the uncached Tex strings now")
+    args = parser.parse_args()
+
+    scene_class = load_scene_class(args.file, args.scene)
+    manifest = SceneAnalyzer(scene_class).run()
+    path = save_manifest(scene_class, manifest, args.output)
+    logger.info(
+        f"{manifest['scene']}: {manifest['plays']} plays, {manifest['waits']} waits, "
+        f"{manifest['duration']:.1f}s / {manifest['frames']} frames, "
+        f"{len(manifest['tex'])} Tex ({manifest['tex_uncached']} uncached), {len(manifest['text'])} Text, "
+        f"peak {manifest['peak_mobjects']} mobjects / {manifest['peak_points']} points, "
+        f"analysed in {manifest['analysis_seconds']}s -> {path}"
+    )
+    if args.precompile:
+        TexPipeline.compile_tex_batch(map(tuple, manifest["tex"]))
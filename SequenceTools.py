@@ -0,0 +1,631 @@
+from manim import *
+import numpy as np
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+# --------------------- 常量区 ---------------------
+SEQ_DOT_RADIUS = 0.05
+SEQ_DOT_COLOR = RED
+
+
+def _unit_circle_points() -> np.ndarray:
+    """四段三次贝塞尔拼成的单位圆（16 个控制点），所有数列点共用这一模板"""
+    k = 4 / 3 * np.tan(np.pi / 8)
+    points = []
+    for i in range(4):
+        a, b = i * PI / 2, (i + 1) * PI / 2
+        p0 = np.array([np.cos(a), np.sin(a), 0])
+        p3 = np.array([np.cos(b), np.sin(b), 0])
+        p1 = p0 + k * np.array([-np.sin(a), np.cos(a), 0])
+        p2 = p3 + k * np.array([np.sin(b), -np.cos(b), 0])
+        points += [p0, p1, p2, p3]
+    return np.array(points)
+
+
+UNIT_CIRCLE = _unit_circle_points()
+
+
+# --------------------- 数列求值 ---------------------
+def vectorized_sequence(func: Callable) -> Callable:
+    """标记 func 可以直接接收 n 的 NumPy 数组（如 lambda n: np.sin(n)/n）"""
+    func.vectorized = True
+    return func
+
+
+def evaluate_sequence(
+    func: Callable,
+    ns: Iterable[int],
+    vectorized: Optional[bool] = None
+) -> np.ndarray:
+    """对一整段 n 求 a_n，返回 float 数组。
+
+    vectorized 为 None 时先看 func.vectorized 标记，没有标记就直接把 n 数组传进去试一次；
+    抛异常或返回形状不对（例如用了 math.sin、if 判断）时退回逐项调用。
+    n 以 float 数组传入，避免 n**-1 之类的整数幂报错和大 n 时的整数溢出。
+    """
+    ns = np.asarray(ns if isinstance(ns, np.ndarray) else list(ns), dtype=float)
+    if vectorized is None:
+        vectorized = getattr(func, "vectorized", None)
+    if vectorized is not False and ns.size:
+        try:
+            with np.errstate(all="ignore"):
+                values = np.asarray(func(ns), dtype=float)
+            if values.ndim == 0:
+                values = np.full(ns.shape, float(values))
+            if values.shape == ns.shape:
+                return values
+        except Exception:
+            if vectorized:
+                raise
+    return np.array([func(int(n)) for n in ns], dtype=float)
+
+
+# --------------------- ε-N 求解 ---------------------
+EPSILON_N_HORIZON = 10000   # 默认只检查前这么多项
+
+
+class EpsilonNSolver:
+    """对任意数列数值求 ε-N：最小的 N，使 N 之后（到 horizon 为止）所有项都满足 |a_n - L| < ε。
+
+    构造时一次性算出偏差 |a_n - L| 的后缀最大值（单调不增），
+    之后每次查询只是一次二分查找，ε 扫动时每帧调用也是 O(log n)；ε 可以是标量或数组。
+    在 horizon 内找不到时返回 None（数组查询对应位置为 -1）。
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        L: float,
+        horizon: int = EPSILON_N_HORIZON,
+        start: int = 1,
+        vectorized: Optional[bool] = None
+    ):
+        self.L = L
+        self.ns = np.arange(start, start + horizon)
+        self.values = evaluate_sequence(func, self.ns, vectorized)
+        deviation = np.abs(self.values - L)
+        deviation[np.isnan(deviation)] = np.inf
+        self.deviation = deviation
+        # tail_max[i] = max(deviation[i:])，取负后单调不减，可直接 searchsorted
+        self.tail_max = np.maximum.accumulate(deviation[::-1])[::-1]
+        self._neg_tail_max = -self.tail_max
+
+    def first_index(self, epsilon):
+        """第一个"之后全部落入邻域"的项在 ns 中的下标，越界表示 horizon 内找不到"""
+        return np.searchsorted(self._neg_tail_max, -np.asarray(epsilon, dtype=float), side="right")
+
+    def solve(self, epsilon) -> np.ndarray:
+        """ε 数组 → N 数组（找不到的位置为 -1）"""
+        idx = np.atleast_1d(self.first_index(epsilon))
+        found = idx < len(self.ns)
+        return np.where(found, self.ns[np.minimum(idx, len(self.ns) - 1)] - 1, -1)
+
+    def N(self, epsilon) -> Optional[int]:
+        """标量 ε 对应的最小 N：n > N 时 |a_n - L| < ε"""
+        N = int(self.solve(epsilon)[0])
+        return N if N >= 0 else None
+
+    def first_term(self, epsilon) -> Optional[int]:
+        """从第几项开始进入邻域，即 N + 1"""
+        N = self.N(epsilon)
+        return None if N is None else N + 1
+
+    __call__ = N
+
+
+# --------------------- 可复用组件 ---------------------
+class SequencePoints(VGroup):
+    """紧凑的数列点容器。
+
+    所有项的位置 positions (N, 3)、半径 radii (N,)、颜色 rgbas (N, 4) 都放在连续的
+    NumPy 数组里；绘制时按样式分桶，每个桶是一个由许多圆形子路径组成的 VMobject，
+    因此 10^4 ~ 10^5 项也只对应极少量的 mobject，同时仍可逐项修改颜色与透明度。
+    平移、缩放、旋转以及 Transform / .animate 都会同步更新这些数组。
+    """
+
+    def __init__(
+        self,
+        positions: Optional[np.ndarray] = None,
+        radius: float = SEQ_DOT_RADIUS,
+        color: ParsableManimColor = SEQ_DOT_COLOR,
+        opacity: float = 1.0,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.default_radius = radius
+        self.default_rgba = color_to_rgba(color, opacity)
+        self.positions = np.zeros((0, 3))
+        self.radii = np.zeros(0)
+        self.rgbas = np.zeros((0, 4))
+        if positions is not None:
+            self.add_terms(positions, radius=radius, color=color, opacity=opacity)
+
+    # ------------- 数组 -> 绘制 -------------
+    @property
+    def num_terms(self) -> int:
+        return len(self.positions)
+
+    def _circle_points(self, idx: np.ndarray) -> np.ndarray:
+        return (
+            self.positions[idx, None, :] + self.radii[idx, None, None] * UNIT_CIRCLE[None]
+        ).reshape(-1, 3)
+
+    def _rebuild(self):
+        """按 rgba 分桶重建绘制用的子路径（纯 NumPy，复用已有的桶对象）"""
+        if self.num_terms == 0:
+            self.remove(*self.submobjects)
+            return
+        styles, inverse = np.unique(self.rgbas, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        buckets = list(self.submobjects[:len(styles)])
+        while len(buckets) < len(styles):
+            buckets.append(VMobject(stroke_width=0))
+        for bucket, k in zip(buckets, range(len(styles))):
+            rgba = styles[k]
+            bucket.set_points(self._circle_points(np.flatnonzero(inverse == k)))
+            bucket.set_fill(rgba_to_color(rgba), opacity=rgba[3])
+            bucket.set_stroke(width=0)
+        self.submobjects = buckets
+
+    # ------------- 公开接口 -------------
+    def add_terms(
+        self,
+        positions: np.ndarray,
+        radius: Optional[float] = None,
+        color: Optional[ParsableManimColor] = None,
+        opacity: Optional[float] = None
+    ) -> np.ndarray:
+        """追加若干项，返回它们的下标"""
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        if positions.shape[1] == 2:
+            positions = np.hstack([positions, np.zeros((len(positions), 1))])
+        rgba = self.default_rgba.copy()
+        if color is not None:
+            rgba = color_to_rgba(color, rgba[3])
+        if opacity is not None:
+            rgba[3] = opacity
+        start = self.num_terms
+        self.positions = np.vstack([self.positions, positions])
+        self.radii = np.concatenate([
+            self.radii,
+            np.full(len(positions), self.default_radius if radius is None else radius)
+        ])
+        self.rgbas = np.vstack([self.rgbas, np.tile(rgba, (len(positions), 1))])
+        self._rebuild()
+        return np.arange(start, self.num_terms)
+
+    def set_positions(self, positions: np.ndarray, indices: Optional[Sequence[int]] = None):
+        """整体（或按下标）设置各项位置"""
+        positions = np.asarray(positions, dtype=float)
+        if indices is None:
+            self.positions = positions.copy()
+        else:
+            self.positions[np.asarray(indices)] = positions
+        self._rebuild()
+        return self
+
+    def set_radii(self, radii, indices: Optional[Sequence[int]] = None):
+        if indices is None:
+            self.radii = np.broadcast_to(np.asarray(radii, dtype=float), self.radii.shape).copy()
+        else:
+            self.radii[np.asarray(indices)] = radii
+        self._rebuild()
+        return self
+
+    def set_term_style(
+        self,
+        indices: Sequence[int],
+        color: Optional[ParsableManimColor] = None,
+        opacity=None
+    ):
+        """修改若干项的颜色和/或透明度（opacity 可以是标量或与 indices 等长的数组）"""
+        indices = np.asarray(indices)
+        if color is not None:
+            self.rgbas[indices, :3] = color_to_rgba(color)[:3]
+        if opacity is not None:
+            self.rgbas[indices, 3] = opacity
+        self._rebuild()
+        return self
+
+    def set_term_opacity(self, indices: Sequence[int], opacity):
+        return self.set_term_style(indices, opacity=opacity)
+
+    def get_term_point(self, index: int) -> np.ndarray:
+        return self.positions[index].copy()
+
+    # ------------- 与 Mobject 变换保持同步 -------------
+    def shift(self, *vectors):
+        super().shift(*vectors)
+        self.positions += np.sum(vectors, axis=0)
+        return self
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            about_point = self.get_critical_point(ORIGIN if about_edge is None else about_edge)
+        about_point = np.array(about_point, dtype=float)
+        super().apply_points_function_about_point(func, about_point=about_point)
+        if self.num_terms:
+            self.positions = func(self.positions - about_point) + about_point
+            # 线性变换对长度的平均缩放倍数，用于更新半径
+            basis = func(np.array([ORIGIN, RIGHT, UP], dtype=float))
+            factor = (np.linalg.norm(basis[1] - basis[0]) + np.linalg.norm(basis[2] - basis[0])) / 2
+            self.radii = self.radii * factor
+        return self
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path()):
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if (
+            isinstance(mobject1, SequencePoints)
+            and isinstance(mobject2, SequencePoints)
+            and mobject1.num_terms == mobject2.num_terms
+        ):
+            self.positions = path_func(mobject1.positions, mobject2.positions, alpha)
+            self.radii = interpolate(mobject1.radii, mobject2.radii, alpha)
+            self.rgbas = interpolate(mobject1.rgbas, mobject2.rgbas, alpha)
+        return self
+
+
+class RevealTerms(Animation):
+    """把 SequencePoints 中若干项的透明度从当前值升到 opacity。
+
+    lag_ratio 与 LaggedStart 含义相同：各项依次错开出现，但整段只有一个动画，
+    每帧只做一次数组运算和一次重建。
+    """
+
+    def __init__(
+        self,
+        points: SequencePoints,
+        indices: Sequence[int],
+        opacity: float = 1.0,
+        lag_ratio: float = 0.0,
+        **kwargs
+    ):
+        self.indices = np.asarray(indices)
+        self.target_opacity = opacity
+        self.term_lag_ratio = lag_ratio
+        super().__init__(points, **kwargs)
+
+    def begin(self):
+        self.start_opacity = self.mobject.rgbas[self.indices, 3].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        n = len(self.indices)
+        if n == 0:
+            return
+        # 与 LaggedStart 相同的时间划分：每项占 span，第 i 项从 i * lag * span 开始
+        span = 1 / (1 + (n - 1) * self.term_lag_ratio)
+        starts = np.arange(n) * self.term_lag_ratio * span
+        sub_alpha = np.clip((alpha - starts) / span, 0, 1)
+        sub_alpha = np.array([self.rate_func(a) for a in sub_alpha])
+        self.mobject.set_term_opacity(
+            self.indices,
+            interpolate(self.start_opacity, self.target_opacity, sub_alpha)
+        )
+
+
+class TermSpawner:
+    """按时间逐项点亮 SequencePoints 的计时器。
+
+    计时 updater 直接挂在 points 上（这样 Cairo 渲染时点云会被当作运动物体逐帧重画），
+    points 在场景中才会计时；最后一项出现后 updater 自动摘除，之后的 wait 又可以冻结画面。
+    第 i 项在 spawn_times[i] = delay + (i + 1) * interval 秒出现，
+    t 时刻可见的项数 count_at(t) 只由 t 决定，与帧率无关；一帧跨过多个时刻时一次点亮多项，
+    也可以 set_time(t) 直接跳到任意时刻（包括倒退）。
+    """
+
+    def __init__(
+        self,
+        points: SequencePoints,
+        interval: float = 0.07,
+        delay: float = 0.0,
+        indices: Optional[Sequence[int]] = None,
+        opacity: float = 1.0,
+        spawn_times: Optional[Sequence[float]] = None,
+    ):
+        self.points = points
+        self.indices = np.arange(points.num_terms) if indices is None else np.asarray(indices)
+        if spawn_times is None:
+            spawn_times = delay + interval * np.arange(1, len(self.indices) + 1)
+        self.spawn_times = np.asarray(spawn_times, dtype=float)
+        self.target_opacity = opacity
+        self.time = 0.0
+        self.shown = 0
+        self.start()
+
+    @property
+    def duration(self) -> float:
+        """最后一项出现的时刻"""
+        return float(self.spawn_times[-1]) if len(self.spawn_times) else 0.0
+
+    def count_at(self, t: float) -> int:
+        return int(np.searchsorted(self.spawn_times, t, side="right"))
+
+    def _tick(self, points: Mobject, dt: float):
+        self.set_time(self.time + dt)
+        if self.shown == len(self.indices):
+            self.stop()
+
+    def start(self):
+        """挂上计时 updater（构造时已调用；stop 之后可再次调用继续计时）"""
+        if self._tick not in self.points.updaters:
+            self.points.add_updater(self._tick)
+        return self
+
+    def stop(self):
+        self.points.remove_updater(self._tick)
+        return self
+
+    def set_time(self, t: float):
+        """把可见项数同步到 t 时刻；项数不变的帧不做任何重建"""
+        self.time = t
+        count = self.count_at(t)
+        if count != self.shown:
+            opacity = np.where(np.arange(len(self.indices)) < count, self.target_opacity, 0.0)
+            self.points.set_term_opacity(self.indices, opacity)
+            self.shown = count
+        return self
+
+    def reset(self):
+        return self.set_time(0.0).start()
+
+
+# --------------------- ε 邻域 ---------------------
+def _value(v):
+    """ValueTracker 取当前值，普通数值原样返回"""
+    return v.get_value() if isinstance(v, ValueTracker) else v
+
+
+def dash_points(
+    start: np.ndarray,
+    end: np.ndarray,
+    num_dashes: int,
+    dashed_ratio: float = 0.5
+) -> np.ndarray:
+    """start -> end 的虚线控制点 (num_dashes * 4, 3)，分段方式与 DashedVMobject 对开放曲线一致"""
+    n = num_dashes
+    dash_len = dashed_ratio / n
+    period = dash_len + ((1 - dashed_ratio) / (n - 1) if n > 1 else 1 - dashed_ratio)
+    a0 = np.arange(n) * period
+    t = (a0[:, None] + dash_len * np.array([0, 1/3, 2/3, 1])[None, :]).reshape(-1, 1)
+    return start + t * (end - start)
+
+
+class DashedSegment(VMobject):
+    """可原地更新的虚线段：所有短划是同一个 VMobject 的子路径，
+    put_start_and_end_on 只重算控制点，不像 DashedLine 那样重新生成一组 Line。"""
+
+    def __init__(
+        self,
+        start: np.ndarray = LEFT,
+        end: np.ndarray = RIGHT,
+        dash_length: float = DEFAULT_DASH_LENGTH,
+        dashed_ratio: float = 0.5,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.dash_length = dash_length
+        self.dashed_ratio = dashed_ratio
+        self.put_start_and_end_on(start, end)
+
+    def put_start_and_end_on(self, start: np.ndarray, end: np.ndarray):
+        start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+        length = np.linalg.norm(end - start)
+        # 与 DashedLine._calculate_num_dashes 相同的短划数量
+        n = max(2, int(np.ceil(length / self.dash_length * self.dashed_ratio)))
+        self.set_points(dash_points(start, end, n, self.dashed_ratio))
+        return self
+
+
+class EpsilonBand(VGroup):
+    """绑定 ε 与极限 L 的邻域：上下（或左右）两条边界线 + 中间的区域。
+
+    boundary(v) 给出坐标 v 处边界线的 (起点, 终点)；L、epsilon、stroke_width 可以是数值
+    或 ValueTracker。每帧由各部件自己的 updater 原地改写控制点（虚线也一样），
+    不再像 always_redraw 那样每帧重建 DashedLine / Rectangle。
+    region / upper / lower 也可以单独 Create、Uncreate。
+    """
+
+    def __init__(
+        self,
+        boundary: Callable[[float], Tuple[np.ndarray, np.ndarray]],
+        L,
+        epsilon,
+        line_color: ParsableManimColor = WHITE,
+        stroke_width=3,
+        dashed: bool = True,
+        fill_color: ParsableManimColor = BLUE,
+        fill_opacity: float = 0.2,
+        region_stroke_color: Optional[ParsableManimColor] = None,
+        region_stroke_width: float = 0,
+        include_region: bool = True,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.boundary = boundary
+        self.L = L
+        self.epsilon = epsilon
+        self.line_width = stroke_width
+
+        line_cls = DashedSegment if dashed else Line
+        self.upper = line_cls(color=line_color)
+        self.lower = line_cls(color=line_color)
+        self.region = VMobject(
+            fill_color=fill_color, fill_opacity=fill_opacity,
+            stroke_color=fill_color if region_stroke_color is None else region_stroke_color,
+            stroke_width=region_stroke_width
+        )
+        if include_region:
+            self.add(self.region)
+        self.add(self.upper, self.lower)
+
+        self.update_band()
+        self.upper.add_updater(lambda m: self._update_line(m, 1))
+        self.lower.add_updater(lambda m: self._update_line(m, -1))
+        self.region.add_updater(lambda m: self._update_region())
+
+    # ------------- 构造 -------------
+    @classmethod
+    def on_axes(cls, axes: Axes, L, epsilon, x_range: Tuple[float, float], **kwargs):
+        """Axes 上的水平带：y = L ± ε，横跨 x_range"""
+        x0, x1 = x_range
+        return cls(lambda y: (axes.c2p(x0, y), axes.c2p(x1, y)), L, epsilon, **kwargs)
+
+    @classmethod
+    def on_number_line(
+        cls,
+        number_to_point: Callable[[float], np.ndarray],
+        L,
+        epsilon,
+        height: float = 1.0,
+        **kwargs
+    ):
+        """数轴上的竖直邻域：x = L ± ε 处两条高 height 的边界线"""
+        def boundary(x):
+            p = number_to_point(x)
+            return p + UP * height / 2, p + DOWN * height / 2
+        return cls(boundary, L, epsilon, **kwargs)
+
+    # ------------- 原地更新 -------------
+    def _edges(self) -> Tuple[float, float]:
+        L, eps = _value(self.L), _value(self.epsilon)
+        return L + eps, L - eps
+
+    def _update_line(self, line: VMobject, side: int):
+        hi, lo = self._edges()
+        line.put_start_and_end_on(*self.boundary(hi if side > 0 else lo))
+        if isinstance(self.line_width, ValueTracker):
+            line.set_stroke(width=self.line_width.get_value())
+
+    def _update_region(self):
+        hi, lo = self._edges()
+        (a, b), (c, d) = self.boundary(lo), self.boundary(hi)
+        self.region.set_points_as_corners([a, b, d, c, a])
+
+    def update_band(self):
+        """立即按当前 L、ε 重排全部部件"""
+        self._update_line(self.upper, 1)
+        self._update_line(self.lower, -1)
+        self._update_region()
+        if not isinstance(self.line_width, ValueTracker):
+            self.upper.set_stroke(width=self.line_width)
+            self.lower.set_stroke(width=self.line_width)
+        return self
+
+
+# --------------------- 相机跟随 ---------------------
+def catmull_rom(keys: np.ndarray, u: float) -> np.ndarray:
+    """在等间距关键帧 keys (K, D) 上按参数 u ∈ [0, K-1] 求 Catmull-Rom 样条值（端点重复，不越界）"""
+    last = len(keys) - 1
+    u = float(np.clip(u, 0, last))
+    i = min(int(u), max(last - 1, 0))
+    s = u - i
+    p0, p1, p2, p3 = (keys[np.clip(j, 0, last)] for j in (i - 1, i, i + 1, i + 2))
+    return 0.5 * (
+        2 * p1
+        + (p2 - p0) * s
+        + (2 * p0 - 5 * p1 + 4 * p2 - p3) * s ** 2
+        + (3 * p1 - p0 - 3 * p2 + p3) * s ** 3
+    )
+
+
+class FollowCamera:
+    """按数列点的出现时间预先规划好的跟随镜头。
+
+    计时 updater 挂在 camera.frame 自己身上，frame 必须加入场景（self.add(self.camera.frame)），
+    这样 MovingCameraScene 才知道相机在动、每帧重画全部物体；走完整条路径后 updater 自动摘除。
+
+    构造时按取景策略算出每隔 key_interval 秒的目标 (中心 x, 中心 y, 画面宽度)，
+    第 0 帧取相机当前状态，之后用 Catmull-Rom 样条连成平滑路径；每帧只按时间求一次样条值，
+    不阻塞场景，可与 TermSpawner 并行。取景策略：
+    - 画面中心领先最新一项 lead；
+    - 最近 window 项都在画面内（各方向留 margin 比例的余量）；
+    - 画面高度不低于 min_band_height，focus_y 给定时垂直方向以它为中心。
+    """
+
+    def __init__(
+        self,
+        frame: Mobject,
+        spawn_times: Sequence[float],
+        positions: np.ndarray,
+        lead: float = 0.6,
+        min_band_height: float = 1.0,
+        window: int = 15,
+        margin: float = 0.3,
+        focus_y: Optional[float] = None,
+        key_interval: float = 1.0,
+        min_width: float = 0.0,
+        max_width: Optional[float] = None,
+        hold: float = 1.0,
+    ):
+        self.frame = frame
+        self.spawn_times = np.asarray(spawn_times, dtype=float)
+        self.positions = np.asarray(positions, dtype=float)
+        self.lead = lead
+        self.min_band_height = min_band_height
+        self.window = window
+        self.margin = margin
+        self.focus_y = focus_y
+        self.aspect = frame.width / frame.height
+        self.min_width = min_width
+        self.max_width = frame.width if max_width is None else max_width
+        self.key_interval = key_interval
+
+        last_time = self.spawn_times[-1] if len(self.spawn_times) else 0.0
+        num_keys = int(np.ceil((last_time + hold) / key_interval)) + 1
+        start = np.array([*frame.get_center()[:2], frame.width])
+        self.keys = np.array(
+            [start] + [self.target_at(k * key_interval) for k in range(1, num_keys)]
+        )
+        self.time = 0.0
+        self.start()
+
+    @classmethod
+    def follow(cls, spawner: "TermSpawner", frame: Mobject, **kwargs) -> "FollowCamera":
+        """跟随 TermSpawner 的出现节奏（点云与 frame 应在同一帧加入场景）"""
+        return cls(frame, spawner.spawn_times, spawner.points.positions[spawner.indices], **kwargs)
+
+    @property
+    def duration(self) -> float:
+        return (len(self.keys) - 1) * self.key_interval
+
+    def target_at(self, t: float) -> np.ndarray:
+        """t 时刻取景策略给出的原始目标 (x, y, width)"""
+        count = int(np.searchsorted(self.spawn_times, t, side="right"))
+        if count == 0:
+            return np.array([*self.frame.get_center()[:2], self.frame.width])
+        recent = self.positions[max(0, count - self.window):count]
+        x = recent[-1, 0] + self.lead
+        ys = recent[:, 1]
+        if self.focus_y is None:
+            y = (ys.max() + ys.min()) / 2
+            height = ys.max() - ys.min()
+        else:
+            y = self.focus_y
+            height = 2 * np.abs(ys - y).max()
+        height = max(self.min_band_height, height * (1 + self.margin))
+        width = max(height * self.aspect, 2 * (x - recent[0, 0]) * (1 + self.margin))
+        return np.array([x, y, np.clip(width, self.min_width, self.max_width)])
+
+    def state_at(self, t: float) -> np.ndarray:
+        return catmull_rom(self.keys, t / self.key_interval)
+
+    def _tick(self, frame: Mobject, dt: float):
+        self.set_time(min(self.time + dt, self.duration))
+        if self.time >= self.duration:
+            self.stop()
+
+    def start(self):
+        if self._tick not in self.frame.updaters:
+            self.frame.add_updater(self._tick)
+        return self
+
+    def stop(self):
+        """摘除 updater，相机停在当前位置，之后可以照常对 frame 播放动画"""
+        self.frame.remove_updater(self._tick)
+        return self
+
+    def set_time(self, t: float):
+        self.time = t
+        x, y, width = self.state_at(t)
+        self.frame.set(width=width).move_to([x, y, 0])
+        return self
@@ -0,0 +1,568 @@
+from manim import *
+import atexit
+import hashlib
+import inspect
+import json
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.tex import _texcode_for_environment
+
+# --------------------- 常量区 ---------------------
+# 所有场景模块共用的 Tex/SVG 缓存目录，可用环境变量 HM_TEX_CACHE 指定
+TEX_CACHE_DIR = Path(
+    os.environ.get("HM_TEX_CACHE", Path.home() / ".cache" / "higher-mathematics" / "tex")
+)
+TEX_CACHE_MAX_BYTES = 1024 ** 3     # 缓存总大小上限，超出后按最近使用时间淘汰
+TEX_CACHE_EVICT_RATIO = 0.9         # 一次淘汰到上限的这个比例，避免每次写入都触发淘汰
+
+
+# --------------------- 缓存键 ---------------------
+def normalize_preamble(text: str) -> str:
+    """去掉导言区的空行、行首尾空白和整行注释，空白上的改动不会让缓存失效"""
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("%"))
+
+
+def template_hash(tex_template: TexTemplate) -> str:
+    """模板中真正影响排版结果的部分（编译器、输出格式、文档类、导言区、正文开头）的哈希"""
+    compiler = tex_template.tex_compiler
+    if not isinstance(compiler, str):
+        compiler = ",".join(compiler)
+    parts = [
+        compiler,
+        tex_template.output_format,
+        normalize_preamble(tex_template._body) if tex_template._body else "",
+        normalize_preamble(tex_template.documentclass),
+        normalize_preamble(tex_template.preamble),
+        normalize_preamble(tex_template.post_doc_commands),
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+def tex_key(expression: str, environment: Optional[str], tex_template: TexTemplate) -> str:
+    """(模板哈希, 环境, 表达式) -> 内容寻址的缓存键"""
+    source = "\0".join([template_hash(tex_template), environment or "", expression.strip()])
+    return hashlib.sha256(source.encode()).hexdigest()[:32]
+
+
+# --------------------- 磁盘缓存 ---------------------
+class TexCache:
+    """内容寻址的 SVG 缓存：文件存放在 <目录>/<键前两位>/<键>.svg，
+    大小与最近使用时间记在同目录的 SQLite 索引里，总大小超过 max_bytes 时按 LRU 淘汰。
+    同一进程内命中过的键记在内存里，重复取用不再访问索引。
+    索引连接由一把锁保护，后台预取线程（LabelCache.prefetch_tex）可以同时读写。
+    """
+
+    def __init__(self, directory: Path = TEX_CACHE_DIR, max_bytes: int = TEX_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._memo: Dict[str, Path] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite3", timeout=30, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS by_last_used ON entries(last_used)")
+        self._db.commit()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.svg"
+
+    def build_dir(self) -> Path:
+        """本次编译专用的临时目录（多个进程同时编译互不干扰）"""
+        root = self.directory / "build"
+        root.mkdir(exist_ok=True)
+        return Path(tempfile.mkdtemp(dir=root))
+
+    def get(self, key: str) -> Optional[Path]:
+        # 进入 _memo 之前都刚更新过 last_used，所以每个键在一个进程里至少刷新一次；
+        # 文件可能被别的进程淘汰掉，命中时仍要确认它还在，不在就回到索引里查
+        path = self._memo.get(key)
+        if path is not None:
+            if path.exists():
+                self.hits += 1
+                return path
+            self._memo.pop(key, None)
+        path = self.path_for(key)
+        with self._lock, self._db:
+            updated = self._db.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key)
+            ).rowcount
+            if updated and not path.exists():
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                updated = 0
+        if not updated:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._memo[key] = path
+        return path
+
+    def put(self, key: str, svg_file: Path) -> Path:
+        """把编译好的 SVG 原子地放进缓存，返回缓存中的路径"""
+        path = self.path_for(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        shutil.copyfile(svg_file, tmp)
+        os.replace(tmp, path)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, size, last_used) VALUES (?, ?, ?)",
+                (key, path.stat().st_size, time.time()),
+            )
+        self._memo[key] = path
+        self.evict()
+        return path
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def evict(self):
+        """总大小超过上限时，从最久未用的条目开始删，直到降到上限的 TEX_CACHE_EVICT_RATIO"""
+        with self._lock:
+            total = self.total_bytes()
+            if total <= self.max_bytes:
+                return
+            target = self.max_bytes * TEX_CACHE_EVICT_RATIO
+            rows = self._db.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall()
+            removed = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                self.path_for(key).unlink(missing_ok=True)
+                self._memo.pop(key, None)
+                removed.append((key,))
+                total -= size
+            with self._db:
+                self._db.executemany("DELETE FROM entries WHERE key = ?", removed)
+            self.evictions += len(removed)
+
+    def clear(self):
+        with self._lock:
+            for (key,) in self._db.execute("SELECT key FROM entries").fetchall():
+                self.path_for(key).unlink(missing_ok=True)
+            with self._db:
+                self._db.execute("DELETE FROM entries")
+            self._memo.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            "entries": entries,
+            "bytes": self.total_bytes(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_TEX_CACHE: Optional[TexCache] = None
+
+
+def get_tex_cache() -> TexCache:
+    global _TEX_CACHE
+    if _TEX_CACHE is None:
+        _TEX_CACHE = TexCache()
+    return _TEX_CACHE
+
+
+# --------------------- 预编译格式 ---------------------
+FORMAT_NAME = "hmpreamble"
+FORMAT_ENGINES = ("latex", "pdflatex", "xelatex")   # 支持用 mylatexformat 转储导言区的引擎
+FONTSPEC_ENGINES = ("xelatex",)     # 字体在运行时从系统加载、不能转储进格式的引擎
+# 这类引擎下导言区里第一处依赖系统字体的命令：ctex 文档类 / 宏包、fontspec、xeCJK 及各种字体设置
+FONT_DEPENDENT = re.compile(
+    r"\\(?:documentclass|usepackage|RequirePackage)\s*(?:\[[^\]]*\])?\s*\{[^}]*"
+    r"(?:ctex|fontspec|xeCJK|unicode-math)"
+    r"|\\set\w*font|\\new\w*fontfamily"
+)
+
+
+def tex_header(source: str) -> str:
+    r"""文档中 \begin{document} 之前的部分（文档类 + 导言区），格式文件由它决定"""
+    return source.split(r"\begin{document}", 1)[0]
+
+
+_FORMAT_LOCKS: Dict[Path, threading.Lock] = {}
+_FORMAT_LOCKS_GUARD = threading.Lock()
+
+
+def _format_lock(fmt_dir: Path) -> threading.Lock:
+    """同一个格式目录在本进程内只由一个线程构建"""
+    with _FORMAT_LOCKS_GUARD:
+        return _FORMAT_LOCKS.setdefault(fmt_dir, threading.Lock())
+
+
+_TEX_STAMPS: Dict[str, str] = {}
+
+
+def tex_stamp(compiler: str) -> str:
+    """编译器版本与 mylatexformat 所在路径；TeX 发行版升级后它会改变，据此重试构建失败过的格式"""
+    if compiler not in _TEX_STAMPS:
+        lines = []
+        for command in ([compiler, "--version"], ["kpsewhich", "mylatexformat.ltx"]):
+            try:
+                output = subprocess.run(command, capture_output=True, text=True).stdout
+            except OSError:
+                output = ""
+            lines.append(output.strip().split("\n", 1)[0])
+        _TEX_STAMPS[compiler] = "\n".join(lines)
+    return _TEX_STAMPS[compiler]
+
+
+def mark_format_failed(fmt_dir: Path, compiler: str):
+    """记下该格式在当前 TeX 发行版下不可用；格式文件本身留给可能正在使用它的编译"""
+    fmt_dir.mkdir(parents=True, exist_ok=True)
+    (fmt_dir / "failed").write_text(tex_stamp(compiler), encoding="utf-8")
+
+
+def dump_length(header: str, compiler: str) -> int:
+    """导言区中能转储进格式的前缀长度。
+
+    latex / pdflatex 下 ctex 用的是 TeX 字体，整个导言区都能转储；xelatex 下 ctex、fontspec
+    在运行时加载系统字体，只能转储它们之前与字体无关的部分，其余仍在每次编译时执行
+    （编译时在分界处插入 \\endofdump，mylatexformat 只跳过它之前的部分）。
+    """
+    if compiler not in FONTSPEC_ENGINES:
+        return len(header)
+    match = FONT_DEPENDENT.search(header)
+    return len(header) if match is None else match.start()
+
+
+def get_format(header: str, compiler: str) -> Optional[Path]:
+    """返回存放该导言区（可转储的前缀，见 dump_length）预编译格式（FORMAT_NAME.fmt）的目录，必要时先构建。
+
+    格式按 (编译器, 规范化后的导言区) 的哈希存放，导言区一改就自动换用新格式；
+    构建失败（缺少 mylatexformat、xelatex 无法转储系统字体等）或格式已过期时留下带 tex_stamp 的标记，
+    同一发行版下之后直接走普通编译，发行版变了再重新构建。新格式原子地替换旧文件。
+    """
+    if compiler not in FORMAT_ENGINES:
+        return None
+    header = header[:dump_length(header, compiler)]
+    if r"\documentclass" not in header:
+        return None                     # 文档类本身就依赖字体（如 ctexart），没有可转储的部分
+    digest = hashlib.sha256(f"{compiler}\0{normalize_preamble(header)}".encode()).hexdigest()[:16]
+    fmt_dir = get_tex_cache().directory / "formats" / digest
+    failed = fmt_dir / "failed"
+    with _format_lock(fmt_dir):
+        if failed.exists():
+            if failed.read_text(encoding="utf-8") == tex_stamp(compiler):
+                return None
+        elif (fmt_dir / f"{FORMAT_NAME}.fmt").exists():
+            return fmt_dir
+
+        build_dir = get_tex_cache().build_dir()
+        (build_dir / "preamble.tex").write_text(
+            header + "\n\\begin{document}\n\\end{document}\n", encoding="utf-8"
+        )
+        command = [
+            compiler, "-ini", "-interaction=batchmode", "-halt-on-error",
+            f"-jobname={FORMAT_NAME}", f"&{compiler}", "mylatexformat.ltx", "preamble.tex",
+        ]
+        returncode = subprocess.run(command, cwd=build_dir, stdout=subprocess.DEVNULL).returncode
+        fmt_file = build_dir / f"{FORMAT_NAME}.fmt"
+        if returncode != 0 or not fmt_file.exists():
+            logger.warning(f"Could not build a {compiler} format for the Tex preamble, compiling without it")
+            mark_format_failed(fmt_dir, compiler)
+            shutil.rmtree(build_dir, ignore_errors=True)
+            return None
+        fmt_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(fmt_file, fmt_dir / f"{FORMAT_NAME}.fmt")
+        except OSError:
+            # Windows 上旧格式仍被别的进程打开时不能替换，这次先不用格式
+            shutil.rmtree(build_dir, ignore_errors=True)
+            return None
+        failed.unlink(missing_ok=True)
+        shutil.rmtree(build_dir, ignore_errors=True)
+    logger.info(f"Built {compiler} format for the Tex preamble in {fmt_dir}")
+    return fmt_dir
+
+
+def _with_format(command: List[str], fmt_dir: Path) -> Tuple[List[str], dict]:
+    """在编译命令中加上 -fmt，并让 kpathsea 能在 fmt_dir 中找到它"""
+    env = dict(os.environ, TEXFORMATS=f"{fmt_dir}{os.pathsep}")
+    return [command[0], f"-fmt={FORMAT_NAME}", *command[1:]], env
+
+
+# --------------------- 编译 ---------------------
+def run_engine_once(
+    command: List[str],
+    tex_file: Path,
+    build_dir: Path,
+    fmt_dir: Optional[Path] = None
+) -> int:
+    """启动一次 TeX 进程执行 command（最后一项为 tex_file，输出写入 build_dir），返回退出码。
+    fmt_dir 不为空时加载其中的预编译格式。
+    """
+    env = None
+    if fmt_dir is not None:
+        command, env = _with_format(command, fmt_dir)
+    return subprocess.run(command, stdout=subprocess.DEVNULL, env=env).returncode
+
+
+# 实际执行编译的函数；TexWorker.install_tex_worker 会把它换成常驻引擎池
+run_engine = run_engine_once
+
+
+def _run_tex(tex_file: Path, tex_template: TexTemplate, build_dir: Path, report: bool = True) -> Path:
+    """按模板的编译器（可以是多个，依次执行）编译 tex_file，返回 dvi/xdv/pdf 路径。
+    有可用的预编译格式时直接加载，跳过导言区中已转储部分的加载。
+    """
+    source = tex_file.read_text(encoding="utf-8")
+    header = tex_header(source)
+    compilers = tex_template.tex_compiler
+    for compiler in [compilers] if isinstance(compilers, str) else compilers:
+        command = tex_file_writing.make_tex_compilation_command(
+            compiler, tex_template.output_format, tex_file, build_dir
+        )
+        fmt_dir = get_format(header, compiler)
+        if fmt_dir is not None:
+            split = dump_length(header, compiler)
+            if split < len(header):
+                # 只转储了导言区的前一部分：标出分界，其后的字体相关部分照常执行
+                tex_file.write_text(source[:split] + "\\endofdump\n" + source[split:], encoding="utf-8")
+            returncode = run_engine(command, tex_file, build_dir, fmt_dir)
+            tex_file.write_text(source, encoding="utf-8")
+            if returncode == 0:
+                continue
+        if run_engine(command, tex_file, build_dir) == 0:
+            if fmt_dir is not None:
+                # 不用格式能编译、用格式却失败：格式已过期，在 TeX 发行版变化之前不再使用
+                mark_format_failed(fmt_dir, compiler)
+        else:
+            log_file = tex_file.with_suffix(".log")
+            if report:
+                tex_file_writing.print_all_tex_errors(log_file, compiler, tex_file)
+            raise ValueError(
+                f"{compiler} error compiling {tex_file.name}. See log output above or"
+                f" the log file: {log_file}"
+            )
+    return tex_file.with_suffix(tex_template.output_format)
+
+
+def _compile_svg(
+    expression: str,
+    environment: Optional[str],
+    tex_template: TexTemplate,
+    build_dir: Path
+) -> Path:
+    """在 build_dir 中把单个表达式编译成 SVG（不写入 manim 的 media/Tex 目录）"""
+    if environment is not None:
+        source = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        source = tex_template.get_texcode_for_expression(expression)
+    tex_file = build_dir / "expression.tex"
+    tex_file.write_text(source, encoding="utf-8")
+    dvi_file = _run_tex(tex_file, tex_template, build_dir)
+    return tex_file_writing.convert_to_svg(dvi_file, tex_template.output_format)
+
+
+def cached_tex_to_svg_file(
+    expression: str,
+    environment: Optional[str] = None,
+    tex_template: Optional[TexTemplate] = None,
+) -> Path:
+    """与 manim 的 tex_to_svg_file 接口相同，但结果放在共享的内容寻址缓存里"""
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if _SCENE_TEX is not None:
+        _SCENE_TEX.record(expression, environment)
+    cache = get_tex_cache()
+    key = tex_key(expression, environment, tex_template)
+    path = cache.get(key)
+    if path is not None:
+        return path
+    build_dir = cache.build_dir()
+    # 编译失败时保留 build_dir，方便按报错信息查看日志
+    path = cache.put(key, _compile_svg(expression, environment, tex_template, build_dir))
+    shutil.rmtree(build_dir, ignore_errors=True)
+    return path
+
+
+# --------------------- 批量编译 ---------------------
+BATCH_PAGE_ENV = "manimbatchpage"   # 批量文档中每个表达式单独成页所用的环境
+
+
+def batch_document(
+    items: Sequence[Tuple[str, Optional[str]]],
+    tex_template: TexTemplate
+) -> Optional[str]:
+    """把多个 (表达式, 环境) 排成同一个 standalone 文档的各页（multi 模式，每页单独裁切）。
+    模板不是 standalone 文档类或使用了自定义 body 时无法合并，返回 None。
+    """
+    if tex_template._body:
+        return None
+    match = re.fullmatch(
+        r"\s*\\documentclass(?:\[(.*)\])?\{standalone\}\s*", tex_template.documentclass, flags=re.S
+    )
+    if match is None:
+        return None
+    options = [o.strip() for o in (match.group(1) or "").split(",") if o.strip()]
+    options.append(f"multi={BATCH_PAGE_ENV}")
+    pages = []
+    for expression, environment in items:
+        if environment is not None:
+            begin, end = _texcode_for_environment(environment)
+            expression = "\n".join([begin, expression, end])
+        pages.append(f"\\begin{{{BATCH_PAGE_ENV}}}\n{expression}\n\\end{{{BATCH_PAGE_ENV}}}")
+    return "\n".join(filter(None, [
+        f"\\documentclass[{','.join(options)}]{{standalone}}",
+        tex_template.preamble,
+        f"\\newenvironment{{{BATCH_PAGE_ENV}}}{{}}{{}}",
+        r"\begin{document}",
+        tex_template.post_doc_commands,
+        *pages,
+        r"\end{document}",
+    ]))
+
+
+def _convert_pages(dvi_file: Path, output_format: str, build_dir: Path) -> List[Path]:
+    """一次 dvisvgm 把所有页拆成单独的 SVG，按页码排序返回"""
+    command = [
+        "dvisvgm",
+        *(["--pdf"] if output_format == ".pdf" else []),
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={(build_dir / 'page-%p.svg').as_posix()}",
+        dvi_file.as_posix(),
+    ]
+    subprocess.run(command, stdout=subprocess.DEVNULL)
+    return sorted(build_dir.glob("page-*.svg"), key=lambda f: int(f.stem.split("-")[-1]))
+
+
+def compile_tex_batch(
+    requests: Iterable[Tuple[str, Optional[str]]],
+    tex_template: Optional[TexTemplate] = None
+) -> int:
+    """把 requests 中尚未缓存的 (表达式, 环境) 放进一个文档，只启动一次 LaTeX，
+    再拆成逐条的 SVG 写入缓存；返回本次编译的条数。
+    批量编译失败（某条有语法错误）或页数对不上时退回逐条编译，报错会指向出错的那一条。
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    cache = get_tex_cache()
+    pending: Dict[str, Tuple[str, Optional[str]]] = {}
+    for expression, environment in requests:
+        key = tex_key(expression, environment, tex_template)
+        if key not in pending and cache.get(key) is None:
+            pending[key] = (expression.strip(), environment)
+    if not pending:
+        return 0
+
+    items = list(pending.values())
+    source = batch_document(items, tex_template) if len(items) > 1 else None
+    if source is not None and all(expression for expression, _ in items):
+        build_dir = cache.build_dir()
+        tex_file = build_dir / "batch.tex"
+        tex_file.write_text(source, encoding="utf-8")
+        try:
+            pages = _convert_pages(
+                _run_tex(tex_file, tex_template, build_dir, report=False),
+                tex_template.output_format,
+                build_dir,
+            )
+        except ValueError:
+            pages = []
+        if len(pages) == len(items):
+            for key, page in zip(pending, pages):
+                cache.put(key, page)
+            shutil.rmtree(build_dir, ignore_errors=True)
+            logger.info(f"Batch-compiled {len(items)} Tex strings in one run")
+            return len(items)
+        logger.warning("Batch Tex compilation failed, compiling strings one by one")
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    for expression, environment in items:
+        cached_tex_to_svg_file(expression, environment, tex_template)
+    return len(items)
+
+
+# --------------------- 场景字符串清单 ---------------------
+class SceneTexList:
+    """记录一个场景请求过的全部 (表达式, 环境)，存成缓存目录下的 JSON 清单。
+    下次渲染开始时先把清单里没缓存的一次性批量编译（例如改了导言区之后的冷启动）。
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.previous: List[Tuple[str, Optional[str]]] = []
+        if path.exists():
+            self.previous = [tuple(item) for item in json.loads(path.read_text(encoding="utf-8"))]
+        self.recorded: Dict[Tuple[str, Optional[str]], None] = {}
+
+    def record(self, expression: str, environment: Optional[str]):
+        self.recorded[(expression, environment)] = None
+
+    def save(self):
+        if self.recorded:
+            self.path.parent.mkdir(exist_ok=True)
+            self.path.write_text(
+                json.dumps(list(self.recorded), ensure_ascii=False), encoding="utf-8"
+            )
+
+
+_SCENE_TEX: Optional[SceneTexList] = None
+
+
+def _save_scene_tex():
+    if _SCENE_TEX is not None:
+        _SCENE_TEX.save()
+
+
+atexit.register(_save_scene_tex)
+
+
+def scene_tex_list_path(scene_class: type) -> Path:
+    ident = f"{Path(inspect.getfile(scene_class)).resolve()}:{scene_class.__qualname__}"
+    digest = hashlib.sha256(ident.encode()).hexdigest()[:12]
+    return get_tex_cache().directory / "scenes" / f"{scene_class.__name__}-{digest}.json"
+
+
+def precompile_scene_tex(scene: Scene) -> int:
+    """在 construct 开头调用：批量编译该场景上次用到而现在缺失的 Tex，并开始记录本次的清单"""
+    global _SCENE_TEX
+    _save_scene_tex()
+    _SCENE_TEX = SceneTexList(scene_tex_list_path(type(scene)))
+    return compile_tex_batch(_SCENE_TEX.previous)
+
+
+def install_tex_cache(
+    directory: Optional[Path] = None,
+    max_bytes: Optional[int] = None
+) -> TexCache:
+    """让本进程中所有 MathTex / Tex 都经过共享缓存（可重复调用）"""
+    global _TEX_CACHE
+    if directory is not None or max_bytes is not None:
+        _TEX_CACHE = TexCache(
+            TEX_CACHE_DIR if directory is None else directory,
+            TEX_CACHE_MAX_BYTES if max_bytes is None else max_bytes,
+        )
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+    return get_tex_cache()
@@ -0,0 +1,351 @@
+from manim import *
+import argparse
+import atexit
+import os
+import secrets
+import shutil
+import subprocess
+import sys
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from manim.utils import tex_file_writing
+
+import TexPipeline
+
+# --------------------- 常量区 ---------------------
+TEX_WORKER_POOL_SIZE = 2        # 每种 (编译命令, 格式) 预先启动、等待任务的引擎数量
+TEX_WORKER_TIMEOUT = 120        # 单次编译的最长等待时间（秒），超时即结束该引擎
+JOB_NAME = "job"                # 预热引擎的 jobname，输出文件编译完再改成源文件的名字
+OUTPUT_SUFFIXES = (".dvi", ".xdv", ".pdf")
+
+
+def worker_address() -> str:
+    """守护进程监听的地址：Windows 上是命名管道，其他系统是缓存目录下的 Unix 套接字"""
+    if sys.platform == "win32":
+        return r"\\.\pipe\higher-mathematics-tex"
+    return str(TexPipeline.get_tex_cache().directory / "worker.sock")
+
+
+def _authkey_path() -> Path:
+    return TexPipeline.get_tex_cache().directory / "worker.key"
+
+
+# --------------------- 预热引擎 ---------------------
+class PrimedEngine:
+    """已经启动、载入了格式，正阻塞在 \\read16 上等待文件名的 TeX 进程。
+
+    TeX 在载入格式之前就要读第一行（**），所以文件名不能等引擎就绪后再作为第一行送进去：
+    这里把 DRIVER 作为第一行放在命令行上，引擎载入格式后执行它，停在从终端读一行的地方；
+    compile 写入 tex 文件路径后，它切到 batchmode 并 \\input 该文件。
+    进程启动、读入格式文件（有预编译格式时连同 ctex 导言区）因此都提前在后台完成。每个引擎只编译一次。
+    """
+
+    # \read16 要求非 batch/nonstop 模式，所以引擎以 scrollmode 启动，读到文件名后再切到 batchmode；
+    # 读取时关掉行尾字符，免得文件名末尾多出一个空格
+    DRIVER = r"{\endlinechar=-1 \global\read16 to\hmfile}\batchmode\input{\hmfile}"
+
+    def __init__(self, command: List[str], fmt_dir: Optional[Path] = None):
+        # command 为去掉最后的 tex 文件之后的编译命令
+        self.directory = TexPipeline.get_tex_cache().build_dir()
+        args = [
+            a for a in command
+            if not a.startswith(("-output-directory=", "-interaction=", "-jobname="))
+        ]
+        args += [
+            "-interaction=scrollmode",
+            f"-output-directory={self.directory.as_posix()}",
+            f"-jobname={JOB_NAME}",
+            self.DRIVER,
+        ]
+        env = None
+        if fmt_dir is not None:
+            args, env = TexPipeline._with_format(args, fmt_dir)
+        self.process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=self.directory,
+            env=env,
+        )
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def compile(self, tex_file: Path, build_dir: Path) -> int:
+        """编译 tex_file，把输出（dvi/xdv/pdf、log 等）按 tex_file 的名字移到 build_dir，返回退出码"""
+        try:
+            self.process.stdin.write(f'"{tex_file.resolve().as_posix()}"\n'.encode("utf-8"))
+            self.process.stdin.close()
+        except OSError:
+            pass                        # 引擎已经退出，下面取到的就是它的退出码
+        try:
+            returncode = self.process.wait(TEX_WORKER_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            returncode = self.process.wait()
+        for output in self.directory.glob(f"{JOB_NAME}.*"):
+            os.replace(output, build_dir / f"{tex_file.stem}{output.suffix}")
+        shutil.rmtree(self.directory, ignore_errors=True)
+        return returncode
+
+    def close(self):
+        if self.alive():
+            self.process.kill()
+            self.process.wait()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class EnginePool:
+    """按 (编译命令, 格式目录) 分组的预热引擎池：每取走一个最多补启动一个，池中空闲引擎不超过 size 个，
+    新引擎在后台加载，等下一次编译请求到来时通常已经就绪。
+    """
+
+    def __init__(self, size: int = TEX_WORKER_POOL_SIZE):
+        self.size = size
+        self._idle: Dict[Tuple, List[PrimedEngine]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, command: List[str], fmt_dir: Optional[Path] = None) -> PrimedEngine:
+        key = (tuple(a for a in command if not a.startswith("-output-directory=")), fmt_dir)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            for engine in [e for e in idle if not e.alive()]:
+                idle.remove(engine)
+                engine.close()
+            engine = idle.pop(0) if idle else PrimedEngine(command, fmt_dir)
+            if len(idle) < self.size:
+                idle.append(PrimedEngine(command, fmt_dir))
+        return engine
+
+    def run(
+        self,
+        command: List[str],
+        tex_file: Path,
+        build_dir: Path,
+        fmt_dir: Optional[Path] = None
+    ) -> int:
+        return self.acquire(command[:-1], fmt_dir).compile(tex_file, build_dir)
+
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                for engine in idle:
+                    engine.close()
+            self._idle.clear()
+
+
+# --------------------- 守护进程 ---------------------
+def _serve_connection(connection: Connection, pool: EnginePool):
+    with connection:
+        while True:
+            try:
+                request = connection.recv()
+            except EOFError:
+                return
+            fmt_dir = request["fmt_dir"]
+            connection.send(pool.run(
+                request["command"],
+                Path(request["tex_file"]),
+                Path(request["build_dir"]),
+                None if fmt_dir is None else Path(fmt_dir),
+            ))
+
+
+def serve(pool_size: int = TEX_WORKER_POOL_SIZE):
+    """常驻编译进程：监听本地套接字/命名管道，让多次渲染、多个场景进程共用同一个预热引擎池。
+    在仓库根目录执行 python TexWorker.py 启动，Ctrl+C 退出。
+    """
+    address = worker_address()
+    if sys.platform != "win32" and os.path.exists(address):
+        os.unlink(address)              # 上次异常退出留下的套接字文件
+    authkey = secrets.token_bytes(32)
+    key_file = _authkey_path()
+    key_file.write_bytes(authkey)
+    os.chmod(key_file, 0o600)
+    pool = EnginePool(pool_size)
+    logger.info(f"Tex worker listening on {address}")
+    try:
+        with Listener(address, authkey=authkey) as listener:
+            while True:
+                try:
+                    connection = listener.accept()
+                except (OSError, EOFError):
+                    continue            # 握手失败（密钥不符等）的连接直接丢弃
+                threading.Thread(
+                    target=_serve_connection, args=(connection, pool), daemon=True
+                ).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.close()
+        key_file.unlink(missing_ok=True)
+
+
+class WorkerClient:
+    """守护进程的客户端；每个线程各用一条连接，用完放回，供并发编译复用"""
+
+    def __init__(self, address: str, authkey: bytes):
+        self.address = address
+        self.authkey = authkey
+        self._free: List[Connection] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def connect(cls) -> Optional["WorkerClient"]:
+        """守护进程在运行就返回客户端，否则返回 None"""
+        key_file = _authkey_path()
+        if not key_file.exists():
+            return None
+        client = cls(worker_address(), key_file.read_bytes())
+        try:
+            client._free.append(Client(client.address, authkey=client.authkey))
+        except (OSError, EOFError):
+            return None
+        return client
+
+    def run(
+        self,
+        command: List[str],
+        tex_file: Path,
+        build_dir: Path,
+        fmt_dir: Optional[Path] = None
+    ) -> int:
+        with self._lock:
+            connection = self._free.pop() if self._free else None
+        if connection is None:
+            connection = Client(self.address, authkey=self.authkey)
+        connection.send({
+            "command": command,
+            "tex_file": str(tex_file.resolve()),
+            "build_dir": str(build_dir.resolve()),
+            "fmt_dir": None if fmt_dir is None else str(fmt_dir),
+        })
+        returncode = connection.recv()
+        with self._lock:
+            self._free.append(connection)
+        return returncode
+
+
+# --------------------- 一致性检查 ---------------------
+def _output_svg(build_dir: Path, stem: str) -> Optional[str]:
+    """build_dir 中 stem 的编译输出经 dvisvgm 转出的 SVG 文本（转完即删，不占用正式转换的文件名）"""
+    for suffix in OUTPUT_SUFFIXES:
+        output = build_dir / f"{stem}{suffix}"
+        if output.exists():
+            try:
+                svg = tex_file_writing.convert_to_svg(output, suffix)
+            except ValueError:
+                return None
+            text = svg.read_text(encoding="utf-8")
+            svg.unlink()
+            return text
+    return None
+
+
+def outputs_match(
+    command: List[str],
+    tex_file: Path,
+    build_dir: Path,
+    fmt_dir: Optional[Path] = None
+) -> bool:
+    """在另一个目录里用一次性进程重新编译 tex_file，与 build_dir 中预热引擎的输出比较 SVG 是否相同"""
+    check_dir = TexPipeline.get_tex_cache().build_dir()
+    check_file = check_dir / tex_file.name
+    shutil.copyfile(tex_file, check_file)
+    cold = [
+        f"-output-directory={check_dir.as_posix()}" if a.startswith("-output-directory=") else a
+        for a in command[:-1]
+    ] + [check_file.as_posix()]
+    TexPipeline.run_engine_once(cold, check_file, check_dir, fmt_dir)
+    warm_svg = _output_svg(build_dir, tex_file.stem)
+    same = warm_svg is not None and warm_svg == _output_svg(check_dir, check_file.stem)
+    shutil.rmtree(check_dir, ignore_errors=True)
+    return same
+
+
+# --------------------- 接入编译流程 ---------------------
+_CLIENT: Optional[WorkerClient] = None
+_POOL: Optional[EnginePool] = None
+_VERIFY = True
+# (编译命令, 格式目录) -> 预热引擎的输出是否与一次性编译一致；每种命令只在第一次成功编译时检查
+_VERIFIED: Dict[Tuple, bool] = {}
+
+
+def _warm_run(
+    command: List[str],
+    tex_file: Path,
+    build_dir: Path,
+    fmt_dir: Optional[Path] = None
+) -> Optional[int]:
+    """依次尝试守护进程、进程内引擎池，都不可用时返回 None"""
+    global _CLIENT, _POOL
+    if _CLIENT is not None:
+        try:
+            return _CLIENT.run(command, tex_file, build_dir, fmt_dir)
+        except (OSError, EOFError):
+            logger.warning("Tex worker is gone, compiling in this process")
+            _CLIENT = None
+    if _POOL is not None:
+        try:
+            return _POOL.run(command, tex_file, build_dir, fmt_dir)
+        except OSError:
+            logger.warning("Could not start a warm TeX engine, falling back to one-shot compiles")
+            _POOL.close()
+            _POOL = None
+    return None
+
+
+def run_engine(
+    command: List[str],
+    tex_file: Path,
+    build_dir: Path,
+    fmt_dir: Optional[Path] = None
+) -> int:
+    """交给预热引擎编译，不可用时退回一次性编译。
+
+    每种编译命令第一次由预热引擎编译成功时，另用一次性进程编译同一文件并比较 SVG；
+    不一致则记下来，这种命令以后都走一次性编译（这一次的结果也换成一次性编译的）。
+    """
+    key = (tuple(a for a in command[:-1] if not a.startswith("-output-directory=")), fmt_dir)
+    if _VERIFIED.get(key) is not False:
+        returncode = _warm_run(command, tex_file, build_dir, fmt_dir)
+        if returncode is not None:
+            if returncode != 0 or not _VERIFY or key in _VERIFIED:
+                return returncode
+            _VERIFIED[key] = outputs_match(command, tex_file, build_dir, fmt_dir)
+            if _VERIFIED[key]:
+                return returncode
+            logger.warning(f"Warm {command[0]} output differs from a one-shot compile, not using warm engines for it")
+    return TexPipeline.run_engine_once(command, tex_file, build_dir, fmt_dir)
+
+
+def _close_pool():
+    if _POOL is not None:
+        _POOL.close()
+
+
+atexit.register(_close_pool)
+
+
+def install_tex_worker(pool_size: int = TEX_WORKER_POOL_SIZE, local_pool: bool = True, verify: bool = True):
+    """让 TexPipeline 的编译交给常驻引擎（可重复调用）：
+    守护进程（python TexWorker.py）在运行时发给它，否则 local_pool 为真时在本进程内维持预热池。
+    verify 为真时每种编译命令先与一次性编译核对一次输出（见 run_engine）。
+    """
+    global _CLIENT, _POOL, _VERIFY
+    _VERIFY = verify
+    if _CLIENT is None:
+        _CLIENT = WorkerClient.connect()
+    if _CLIENT is None and local_pool and _POOL is None:
+        _POOL = EnginePool(pool_size)
+    TexPipeline.run_engine = run_engine
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Long-lived warm LaTeX worker for Tex compilation")
+    parser.add_argument("--pool-size", type=int, default=TEX_WORKER_POOL_SIZE)
+    serve(parser.parse_args().pool_size)
@@ -0,0 +1,11 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+# 测试用独立的 Tex 缓存目录，不碰本机共享的缓存（TexPipeline 导入时读取）
+os.environ.setdefault("HM_TEX_CACHE", tempfile.mkdtemp(prefix="hm-tex-"))
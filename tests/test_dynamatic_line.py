@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+
+from DynamaticLine import (
+    KEY_DECIMALS, CoordRegistry, ViewportTicks,
+    key_level, key_to_text, level_keys, step_keys, tick_level_exponent, to_key,
+)
+
+UNIT = 10 ** KEY_DECIMALS
+
+
+def test_to_key_is_exact_on_decimal_grid():
+    assert to_key(0.1) * 3 == to_key(0.3)
+    assert to_key(-2.5) == -25 * UNIT // 10
+
+
+def test_key_level_and_text():
+    assert key_level(to_key(3)) == 0
+    assert key_level(to_key(0.5)) == -1
+    assert key_level(to_key(0.25)) == -2
+    assert key_to_text(to_key(1)) == "1"
+    assert key_to_text(to_key(-0.5)) == "-0.5"
+    assert key_to_text(to_key(0.125)) == "0.125"
+
+
+def test_step_keys_has_no_float_drift():
+    keys = list(step_keys(0, 1, 0.1))
+    assert keys == [i * UNIT // 10 for i in range(11)]
+    assert list(step_keys(0.05, 0.3, 0.1)) == [to_key(0.1), to_key(0.2), to_key(0.3)]
+
+
+def test_level_keys_and_exponent():
+    assert tick_level_exponent(1.0) == 0
+    assert tick_level_exponent(10.0) == -1
+    assert list(level_keys(-0.25, 0.25, -1)) == [to_key(x) for x in (-0.2, -0.1, 0, 0.1, 0.2)]
+
+
+def test_viewport_ticks_switch_level_on_zoom():
+    ticks = ViewportTicks(-15, 15, 1.0, np.zeros(3), include_numbers=False, frame_width=14.0)
+    assert all(key % UNIT == 0 for key in ticks._items)
+
+    ticks.zoom_anims(10.0, np.zeros(3))
+    ticks.finish_zoom()
+    lo, hi = -14.0 * (0.5 + ticks.margin) / 10, 14.0 * (0.5 + ticks.margin) / 10
+    assert set(ticks._items) == set(level_keys(lo, hi, -1))
+    assert len(ticks.ticks) + len(ticks.sub_ticks) == len(ticks)
+
+
+def test_coord_registry_appends_per_kind():
+    coords = CoordRegistry()
+    coords.extend("tick", [1, 2])
+    coords.extend("tick", 3)
+    coords.extend("seq", 0.5)
+    np.testing.assert_array_equal(coords["tick"], [1, 2, 3])
+    assert len(coords["missing"]) == 0
+    assert len(coords) == 4
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+
+from HiveTools import SplitTree
+
+
+def _grid(n: int) -> np.ndarray:
+    xs, ys = np.meshgrid(np.arange(n), np.arange(n))
+    return np.column_stack([xs.ravel(), ys.ravel()]).astype(float)
+
+
+def test_split_tree_halves_alternate_axes():
+    centers = _grid(4)
+    tree = SplitTree(centers, max_depth=2)
+    left, right = tree.groups(1)
+    assert centers[left, 0].max() < centers[right, 0].min()
+    for pair in (tree.groups(2)[0:2], tree.groups(2)[2:4]):
+        low, high = pair
+        assert centers[low, 1].max() < centers[high, 1].min()
+    assert sorted(np.concatenate(tree.groups(2))) == list(range(16))
+
+
+def test_split_tree_matches_per_group_sort():
+    rng = np.random.default_rng(0)
+    centers = rng.random((37, 2))
+    tree = SplitTree(centers, max_depth=4)
+    groups = [list(range(len(centers)))]
+    for depth in range(4):
+        split = []
+        for group in groups:
+            group = sorted(group, key=lambda i: centers[i, depth % 2])
+            split += [group[:len(group) // 2], group[len(group) // 2:]]
+        groups = split
+    assert [list(g) for g in tree.groups(4)] == groups
+
+
+def test_group_ids_agree_with_groups():
+    tree = SplitTree(_grid(4), max_depth=3)
+    ids = tree.group_ids(3)
+    for g, members in enumerate(tree.groups(3)):
+        assert (ids[members] == g).all()
+
+
+def test_split_offsets_move_siblings_apart():
+    centers = _grid(4)
+    tree = SplitTree(centers, max_depth=1)
+    offsets = tree.split_offsets(1, centers, (1.0, 1.0), gap_step=0.5)
+    left, right = tree.groups(1)
+    # 两组各宽 2，各自退开 (2 + 2) / 2 + 0.5
+    np.testing.assert_allclose(offsets[left], [[-2.5, 0, 0]] * len(left))
+    np.testing.assert_allclose(offsets[right], [[2.5, 0, 0]] * len(right))
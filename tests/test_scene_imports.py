@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from manim import Scene
+
+SCENE_DIR = Path(__file__).resolve().parent.parent / "极限"
+SCENE_FILES = sorted(SCENE_DIR.glob("*.py"))
+
+
+@pytest.mark.parametrize("path", SCENE_FILES, ids=[p.name for p in SCENE_FILES])
+def test_scene_module_imports_like_manim_cli(path, monkeypatch):
+    # manim 的 get_module 把场景文件所在目录放在 sys.path 最前，同名模块会优先从那里导入
+    monkeypatch.syspath_prepend(str(SCENE_DIR))
+    for name in ("DynamaticLine", "SequenceTools", "LabelCache", "TexPipeline", "TexWorker",
+                 "HiveTools", "DeepZoom"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    spec = importlib.util.spec_from_file_location(f"scene_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    scenes = [v for v in vars(module).values()
+              if isinstance(v, type) and issubclass(v, Scene) and v.__module__ == module.__name__]
+    assert scenes
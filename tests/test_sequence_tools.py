@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import numpy as np
+
+from SequenceTools import (
+    EpsilonNSolver, SequencePoints, TermSpawner, catmull_rom, evaluate_sequence,
+)
+
+
+def test_evaluate_sequence_falls_back_to_scalar_calls():
+    import math
+    values = evaluate_sequence(lambda n: math.sin(n) / n, [1, 2, 3])
+    np.testing.assert_allclose(values, [math.sin(n) / n for n in (1, 2, 3)])
+
+
+def test_epsilon_n_solver_matches_closed_form():
+    solver = EpsilonNSolver(lambda n: 1 / n, 0)
+    # 1/n < ε  <=>  n > 1/ε，最小的 N 就是 ceil(1/ε) 附近第一个满足的整数
+    for eps in (0.5, 0.3, 0.1, 0.013):
+        N = solver.N(eps)
+        assert all(1 / n < eps for n in range(N + 1, N + 200))
+        assert not 1 / N < eps
+    np.testing.assert_array_equal(solver.solve([0.5, 0.1]), [2, 10])
+
+
+def test_epsilon_n_solver_alternating_sequence():
+    solver = EpsilonNSolver(lambda n: (-1) ** n / (n + 1) ** 2, 0)
+    assert solver.N(0.1) == 2
+    assert solver.first_term(0.1) == 3
+    assert solver.N(0.1) <= np.ceil(np.sqrt(1 / 0.1))
+
+
+def test_epsilon_n_solver_outside_horizon():
+    solver = EpsilonNSolver(lambda n: 1 / n, 0, horizon=100)
+    assert solver.N(1e-4) is None
+    assert solver.solve([1e-4])[0] == -1
+
+
+def test_term_spawner_timing_is_frame_rate_independent():
+    points = SequencePoints(np.zeros((5, 3)), opacity=0)
+    spawner = TermSpawner(points, interval=0.5, delay=1.0)
+    assert spawner.duration == pytest.approx(3.5)
+    assert [spawner.count_at(t) for t in (0, 1.49, 1.5, 2.6, 10)] == [0, 0, 1, 3, 5]
+
+    spawner._tick(points, 2.0)
+    assert spawner.shown == 2
+    np.testing.assert_array_equal(points.rgbas[:, 3], [1, 1, 0, 0, 0])
+    spawner._tick(points, 5.0)
+    assert spawner.shown == 5
+    assert spawner._tick not in points.updaters
+
+    spawner.reset()
+    assert spawner.shown == 0
+    assert spawner._tick in points.updaters
+
+
+def test_catmull_rom_passes_through_keys():
+    keys = np.array([[0.0, 0.0], [1.0, 2.0], [3.0, 1.0], [4.0, 4.0]])
+    for i, key in enumerate(keys):
+        np.testing.assert_allclose(catmull_rom(keys, i), key)
+    np.testing.assert_allclose(catmull_rom(keys, 10), keys[-1])
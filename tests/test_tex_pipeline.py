@@ -0,0 +1,72 @@
+import pytest
+
+pytest.importorskip("manim")
+
+import time
+
+from manim import TexTemplate
+
+import TexPipeline
+from TexPipeline import TexCache, dump_length, normalize_preamble, tex_key
+
+
+def _template(preamble: str) -> TexTemplate:
+    return TexTemplate(preamble=preamble)
+
+
+def test_tex_key_ignores_preamble_whitespace_and_comments():
+    a = _template("\\usepackage{ctex}\n\\usepackage{amsmath}\n")
+    b = _template("  \\usepackage{ctex}\n% 注释\n\n\\usepackage{amsmath}")
+    assert normalize_preamble(a.preamble) == normalize_preamble(b.preamble)
+    assert tex_key("x^2", "align*", a) == tex_key(" x^2 ", "align*", b)
+    assert tex_key("x^2", "align*", a) != tex_key("x^3", "align*", a)
+    assert tex_key("x^2", "align*", a) != tex_key("x^2", None, a)
+    assert tex_key("x^2", None, a) != tex_key("x^2", None, _template("\\usepackage{amsmath}"))
+
+
+def _svg(tmp_path, name: str, size: int):
+    path = tmp_path / f"{name}.svg"
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_tex_cache_round_trip(tmp_path):
+    cache = TexCache(tmp_path / "cache")
+    assert cache.get("ab" + "0" * 30) is None
+    stored = cache.put("ab" + "0" * 30, _svg(tmp_path, "a", 10))
+    assert stored.read_bytes() == b"x" * 10
+    assert cache.get("ab" + "0" * 30) == stored
+    # 另一个进程里的同一份缓存从索引中查到
+    assert TexCache(tmp_path / "cache").get("ab" + "0" * 30) == stored
+
+
+def test_tex_cache_memo_rechecks_evicted_files(tmp_path):
+    cache = TexCache(tmp_path / "cache")
+    key = "cd" + "0" * 30
+    cache.put(key, _svg(tmp_path, "a", 10)).unlink()
+    assert cache.get(key) is None
+
+
+def test_tex_cache_evicts_least_recently_used(tmp_path):
+    cache = TexCache(tmp_path / "cache", max_bytes=250)
+    keys = [f"{i:02d}" + "0" * 30 for i in range(3)]
+    cache.put(keys[0], _svg(tmp_path, "a", 100))
+    time.sleep(0.01)
+    cache.put(keys[1], _svg(tmp_path, "b", 100))
+    time.sleep(0.01)
+    cache._memo.clear()
+    cache.get(keys[0])                  # keys[1] 成为最久未用
+    time.sleep(0.01)
+    cache.put(keys[2], _svg(tmp_path, "c", 100))
+    assert cache.evictions == 1
+    assert not cache.path_for(keys[1]).exists()
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+    assert cache.total_bytes() == 200
+
+
+def test_dump_length_keeps_font_setup_out_of_xelatex_formats():
+    header = "\\documentclass[preview]{standalone}\n\\usepackage{amsmath}\n\\usepackage[UTF8]{ctex}\n"
+    assert dump_length(header, "latex") == len(header)
+    assert header[:dump_length(header, "xelatex")] == "\\documentclass[preview]{standalone}\n\\usepackage{amsmath}\n"
+    assert dump_length("\\documentclass{ctexart}\n", "xelatex") == 0
+    assert TexPipeline.get_format("\\documentclass{ctexart}\n", "xelatex") is None
@@ -1,6 +1,21 @@
 from manim import *
 import numpy as np
 from typing import Optional
+import sys
+from pathlib import Path
+
+# 公共模块（DynamaticLine、SequenceTools、TexPipeline 等）只在仓库根目录保留一份；
+# manim 渲染时把本目录放在 sys.path 最前，这里把根目录放到它前面
+ROOT_DIR = str(Path(__file__).resolve().parent.parent)
+if ROOT_DIR in sys.path:
+    sys.path.remove(ROOT_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from DynamaticLine import ViewportTicks, CoordRegistry, TickPath, KEY_DECIMALS, to_key, key_level, key_to_text
+from SequenceTools import SequencePoints, RevealTerms, evaluate_sequence, EpsilonBand, DashedSegment, EpsilonNSolver, TermSpawner, FollowCamera
+from LabelCache import LiveTex, prefetch_tex
+from TexPipeline import install_tex_cache, precompile_scene_tex
+from TexWorker import install_tex_worker
 
 # --------------------- 常量区 ---------------------
 TITLE_TEXT       = "数列极限的动态演示"
@@ -24,7 +39,12 @@ class NumberAxis(VGroup):
                  line_length: float = 10,
                  initial_scale: float = 1,
                  center: np.ndarray = ORIGIN,
+                 culling: bool = False,
+                 compound_ticks: bool = False,
                  **kwargs):
+        """culling=True 时刻度交给 ViewportTicks 管理：只保留可视窗口内的刻度，
+        并随缩放自动切换 1 / 0.1 / 0.01 …… 的刻度密度（此时 add_sub_ticks 不再需要）；
+        compound_ticks=True 时每个层级的刻度合成一个 TickPath，而不是每个刻度一个 Line"""
         super().__init__(**kwargs)
         self.x_min         = x_min
         self.x_max         = x_max
@@ -33,19 +53,35 @@ class NumberAxis(VGroup):
         self.seq_dots      = VGroup() # 已经创建的数列点
         self.seq_labels    = VGroup()
         self.seq_n_values  = []      # 每个点对应的n值
-        # --- 主刻度 ---
+        self.coords        = CoordRegistry() # 刻度、子刻度、数列点的数学坐标
+        self._sub_tick_keys = set()          # 已创建的子刻度键
+        self.compound_ticks = compound_ticks
+        self._sub_paths     = {}             # compound_ticks 时：层级 -> 该层级的 TickPath
         self.line   = Line(LEFT*line_length, RIGHT*line_length, color=TICK_COLOR)
-        self.ticks  = VGroup()
-        self.labels = VGroup()
-        for x in range(self.x_min, self.x_max + 1):
-            t = Line(UP*0.2, DOWN*0.1)
-            lab = Text(str(x), font_size=TICK_FONT_SIZE)
-            self.ticks.add(t)
-            self.labels.add(lab)
-        self._layout_main_ticks()
-        # --- 0.1 子刻度 ---
-        self.sub_ticks  = VGroup()
-        self.sub_labels = VGroup()
+        self.viewport = None
+        if culling:
+            # --- 视口刻度：只物化可见部分 ---
+            self.viewport = ViewportTicks(self.x_min, self.x_max,
+                                          self.scale_factor, self.center_offset,
+                                          label_buff=0.3)
+            self.ticks,     self.labels     = self.viewport.ticks,     self.viewport.labels
+            self.sub_ticks, self.sub_labels = self.viewport.sub_ticks, self.viewport.sub_labels
+        else:
+            # --- 主刻度 ---
+            self.ticks  = VGroup()
+            self.labels = VGroup()
+            for x in range(self.x_min, self.x_max + 1):
+                lab = Text(str(x), font_size=TICK_FONT_SIZE)
+                if not self.compound_ticks:
+                    self.ticks.add(Line(UP*0.2, DOWN*0.1))
+                self.labels.add(lab)
+            self.coords.extend("tick", np.arange(self.x_min, self.x_max + 1))
+            if self.compound_ticks:
+                self.ticks.add(TickPath(self.coords["tick"], length=0.3))
+            self._layout_main_ticks()
+            # --- 0.1 子刻度 ---
+            self.sub_ticks  = VGroup()
+            self.sub_labels = VGroup()
         # for i in range(1, 10):
         #     pos = i * 0.1
         #     t = Line(UP*0.1, DOWN*0.1, color=SUB_TICK_COLOR)
@@ -61,25 +97,23 @@ class NumberAxis(VGroup):
         """把数学坐标 x 转换成 Manim 坐标"""
         return self.center_offset + RIGHT * x * self.scale_factor
     
-    def _pos2x(self, pos: np.ndarray) -> float:
-        """将 Manim 坐标转换为数学坐标 x"""
-        # 确保我们处理的是单个坐标而不是数组
-        if isinstance(pos, np.ndarray):
-            return (pos[0] - self.center_offset[0]) / self.scale_factor
-        else:
-            # 如果 pos 不是数组，直接返回
-            return pos
-
-    def _layout_main_ticks(self):
-        for x, tick, lab in zip(range(self.x_min, self.x_max + 1),
-                                self.ticks, self.labels):
+    def _layout_ticks(self, ticks: VGroup, labels: VGroup, xs: np.ndarray,
+                      length: float, buff: float):
+        """按数学坐标摆放一组刻度及其标签（独立 Line 或合成的 TickPath）"""
+        if self.compound_ticks:
+            for path in ticks:
+                path.layout(self.scale_factor, self.center_offset)
+            for x, lab in zip(xs, labels):
+                lab.next_to(self._x2pos(x) + DOWN * length / 2, DOWN, buff=buff)
+            return
+        for x, tick, lab in zip(xs, ticks, labels):
             tick.move_to(self._x2pos(x))
-            lab.next_to(tick, DOWN, buff=0.1)
-    def _layout_sub_ticks(self,startPos = 0):
-        for i, (tick, lab) in enumerate(zip(self.sub_ticks, self.sub_labels)):
-            x = startPos + (i + 1) * 0.1
-            tick.move_to(self._x2pos(x))
-            lab.next_to(tick, DOWN, buff=0.15)
+            lab.next_to(tick, DOWN, buff=buff)
+    def _layout_main_ticks(self):
+        self._layout_ticks(self.ticks, self.labels, self.coords["tick"], 0.3, 0.1)
+    def _layout_sub_ticks(self):
+        # 位置取自坐标表：跳过整数刻度后下标与坐标不再一一对应，不能再用 (i + 1) * 0.1 推算
+        self._layout_ticks(self.sub_ticks, self.sub_labels, self.coords["sub_tick"], 0.2, 0.15)
     # ------------- 公开接口 -------------
     def add_sequence_points(self, n_start: int, n_end: int, scene: Scene, runTime=ANIM_TIME):
         """把 a_n = 1/n (n_start..n_end) 逐个出现"""
@@ -101,23 +135,37 @@ class NumberAxis(VGroup):
             self.seq_dots.add(dot)
             self.seq_labels.add(label)
             self.seq_n_values.append(n)  # 存储n值
+            self.coords.extend("seq", a_n)
             # scene.play(FadeIn(dot), Write(label), run_time=runTime)
             insert_dot_animes+=[FadeIn(dot), Write(label)]
             # scene.wait(runTime/2)
         
         return insert_dot_animes
 
-    def add_sub_ticks(self,startPos:int = 0,new_sub_ticks_range:tuple[int, int] = (0,1)):
+    def add_sub_ticks(self,startPos:float = 0,new_sub_ticks_range:tuple[int, int] = (0,1), step: float = 0.1):
+        """添加 startPos + i * step 处的子刻度（整数键运算；整数与已存在的刻度跳过）"""
+        if self.viewport is not None:
+            return  # 子刻度由视口按缩放层级自动生成
+        base, step_key = to_key(startPos), to_key(step)
         for i in range(new_sub_ticks_range[0], new_sub_ticks_range[1] + 1):
-            pos =startPos + i * 0.1
-            if abs(pos - round(pos)) < 1e-9:
-                continue  # 跳过整数刻度
-
-            t = Line(UP*0.1, DOWN*0.1, color=SUB_TICK_COLOR)
-            lab = Text(f"{pos:.1f}", font_size=SUB_TICK_FS, color=SUB_TICK_COLOR)
-            self.sub_ticks.add(t)
+            key = base + i * step_key
+            if key_level(key) == 0 or key in self._sub_tick_keys:
+                continue  # 跳过整数刻度和已有刻度
+
+            x = key / 10 ** KEY_DECIMALS
+            if self.compound_ticks:
+                level = key_level(key)
+                if level not in self._sub_paths:
+                    self._sub_paths[level] = TickPath(length=0.2, color=SUB_TICK_COLOR)
+                    self.sub_ticks.add(self._sub_paths[level])
+                self._sub_paths[level].add_ticks(x)
+            else:
+                self.sub_ticks.add(Line(UP*0.1, DOWN*0.1, color=SUB_TICK_COLOR))
+            lab = Text(key_to_text(key), font_size=SUB_TICK_FS, color=SUB_TICK_COLOR)
             self.sub_labels.add(lab)
-        self._layout_sub_ticks(startPos)
+            self.coords.extend("sub_tick", x)
+            self._sub_tick_keys.add(key)
+        self._layout_sub_ticks()
         # self.add(self.sub_ticks, self.sub_labels)
        
     def zoom_to(self, new_scale: float, new_points: tuple[int, int] = None, scene: Scene = None,new_center: Optional[np.ndarray] = None, runTime=ZOOM_TIME):
@@ -131,25 +179,29 @@ class NumberAxis(VGroup):
         old_scale = self.scale_factor
         # 更新内部状态
         self.scale_factor = new_scale
-        # 主刻度
-        for x, tick, lab in zip(range(self.x_min, self.x_max + 1),
-                                self.ticks, self.labels):
-            anims += [
-                tick.animate.move_to(self._x2pos(x)),
-                lab.animate.next_to(self._x2pos(x), DOWN, buff=0.3)
-            ]
-        # 子刻度
-        for i, (tick, lab) in enumerate(zip(self.sub_ticks, self.sub_labels)):
-            x = (float(lab.text))
-            anims += [
-                tick.animate.move_to(self._x2pos(x)),
-                lab.animate.next_to(self._x2pos(x), DOWN, buff=0.15)
-            ]
+        if self.viewport is not None:
+            # 只为窗口内的刻度生成动画，并按新缩放切换刻度密度
+            anims += self.viewport.zoom_anims(new_scale, self.center_offset)
+        else:
+            if self.compound_ticks:
+                # 合成刻度：每个层级的路径整体重排一次
+                anims += [path.animate.layout(new_scale, self.center_offset)
+                          for path in [*self.ticks, *self.sub_ticks]]
+            else:
+                anims += [tick.animate.move_to(self._x2pos(x))
+                          for x, tick in zip(self.coords["tick"], self.ticks)]
+                anims += [tick.animate.move_to(self._x2pos(x))
+                          for x, tick in zip(self.coords["sub_tick"], self.sub_ticks)]
+            # 主刻度标签
+            for x, lab in zip(self.coords["tick"], self.labels):
+                anims.append(lab.animate.next_to(self._x2pos(x), DOWN, buff=0.3))
+            # 子刻度标签：坐标取自坐标表，不再解析标签文字
+            for x, lab in zip(self.coords["sub_tick"], self.sub_labels):
+                anims.append(lab.animate.next_to(self._x2pos(x), DOWN, buff=0.15))
      
 
         # 已有点
-        for n, dot, lab in zip(self.seq_n_values, self.seq_dots, self.seq_labels):
-            a_n = 1 / n
+        for n, a_n, dot, lab in zip(self.seq_n_values, self.coords["seq"], self.seq_dots, self.seq_labels):
             direction = UP if n % 2 == 0 else DOWN
             anims += [
                 dot.animate.move_to(self._x2pos(a_n)),
@@ -169,6 +221,8 @@ class NumberAxis(VGroup):
 
         if scene:
            scene.play(*anims,run_time=runTime)
+           if self.viewport is not None:
+               self.viewport.finish_zoom(scene)
            scene.play(AnimationGroup(*dotAnims,lag_ratio=.5),run_time=runTime)
 class DemoScene(Scene):
     def construct(self):
@@ -242,41 +296,37 @@ class NbConceptDemo(Scene):
         ).shift(DOWN * 0.8)
 
         x0 = ValueTracker(1.0)
-        dot =always_redraw(lambda: Dot(axis.number_to_point(x0.get_value()), color=YELLOW, radius=0.1))
-        dot_label = always_redraw(lambda: MathTex("a").next_to(dot, UP, buff=0.15))
+        dot = Dot(color=YELLOW, radius=0.1).add_updater(
+            lambda m: m.move_to(axis.number_to_point(x0.get_value())), call_updater=True)
+        dot_label = MathTex("a").add_updater(
+            lambda m: m.next_to(dot, UP, buff=0.15), call_updater=True)
 
         eps = ValueTracker(1.0)
         
-        box = always_redraw(lambda: Rectangle(
-            width=axis.number_to_point(x0.get_value() + eps.get_value())[0]
-                  - axis.number_to_point(x0.get_value() - eps.get_value())[0],
+        # 方框邻域与两条端点线：同一个 EpsilonBand 的部件，随 x0、eps 原地更新
+        neighborhood = EpsilonBand.on_number_line(
+            axis.number_to_point, x0, eps,
             height=1.4,
-            stroke_color=GREEN_B, stroke_width=2,
-            fill_color=GREEN, fill_opacity=0.35
-        ).move_to(axis.number_to_point(x0.get_value()), aligned_edge=ORIGIN))
+            line_color=RED, stroke_width=7,
+            fill_color=GREEN, fill_opacity=0.35,
+            region_stroke_color=GREEN_B, region_stroke_width=2
+        )
+        box = neighborhood.region
 
         self.play(Create(axis), FadeIn(dot), Write(dot_label))
         self.play(Create(box))
 
         # ---------------- 3. 字幕同步强调 ----------------  
         
-        epsilone=always_redraw(
-            lambda: MathTex(r"\mathbf{\varepsilon = }", f"{eps.get_value():.1f}",color=RED_D)
-            .move_to(axis.number_to_point(x0.get_value())+UP)
+        # 静态部分与数值分开，数值字符串不变的帧不重新编译
+        epsilone=LiveTex(
+            r"\mathbf{\varepsilon = }", lambda: f"{eps.get_value():.1f}",
+            placement=lambda m: m.move_to(axis.number_to_point(x0.get_value())+UP),
+            color=RED_D
         )
         # 端点红线
-        left_line = always_redraw(lambda: DashedLine(
-            axis.number_to_point(x0.get_value() - eps.get_value()) + UP * 0.7,
-            axis.number_to_point(x0.get_value() - eps.get_value()) + DOWN * 0.7,
-            stroke_color=RED, 
-            stroke_width=7
-        ))
-        right_line = always_redraw(lambda: DashedLine(
-            axis.number_to_point(x0.get_value() + eps.get_value()) + UP * 0.7,
-            axis.number_to_point(x0.get_value() + eps.get_value()) + DOWN * 0.7,
-            stroke_color=RED, 
-            stroke_width=7
-        ))
+        left_line = neighborhood.lower
+        right_line = neighborhood.upper
         self.play(Create(left_line), Create(right_line), Create(epsilone))
 
         # 闪烁强调“不算”
@@ -329,6 +379,10 @@ config.tex_template = TexTemplate(
 \usepackage{amsmath,amssymb}
 """
 )
+# 所有 MathTex / Tex 走共享的磁盘缓存（按模板哈希与字符串寻址）
+install_tex_cache()
+# 编译交给预热好的 TeX 引擎（python TexWorker.py 常驻时多次渲染共用）
+install_tex_worker()
 
 
 
@@ -352,6 +406,7 @@ class SequenceLimitWithZoom(ZoomedScene,MovingCameraScene):
         )
     
     def construct(self):
+        precompile_scene_tex(self)
         # 创建坐标系
         
         x_amx_length=77
@@ -403,37 +458,33 @@ class SequenceLimitWithZoom(ZoomedScene,MovingCameraScene):
         # 定义 epsilon 邻域
         epsilon_band_width =ValueTracker(4)
         epsilon = ValueTracker(0.1)
-        epsilon_band_upper = always_redraw(lambda: DashedLine(
-            axes.c2p(0, L + epsilon.get_value()), 
-            axes.c2p(x_amx_length, L + epsilon.get_value()), 
-            color=ManimColor("#3fc1c9"), 
-            stroke_width=epsilon_band_width.get_value()
-        ))
-        epsilon_band_lower = always_redraw(lambda: DashedLine(
-            axes.c2p(0, L - epsilon.get_value()), 
-            axes.c2p(x_amx_length, L - epsilon.get_value()), 
-            color=ManimColor("#3fc1c9"), 
-            stroke_width=epsilon_band_width .get_value()          
-        ))
+        # ε 带：上下两条虚线与中间区域，随 epsilon / 线宽原地更新
+        epsilon_band = EpsilonBand.on_axes(
+            axes, L, epsilon, (0, x_amx_length),
+            line_color=ManimColor("#3fc1c9"),
+            stroke_width=epsilon_band_width,
+            fill_color=RED,
+            fill_opacity=0.2
+        )
+        epsilon_band_upper = epsilon_band.upper
+        epsilon_band_lower = epsilon_band.lower
        
         # 创建邻域区域
-        epsilon_region = always_redraw(lambda: Rectangle(
-            width=axes.c2p(x_amx_length, 0)[0] - axes.c2p(0, 0)[0],            
-            height=2*epsilon.get_value()*axes.y_length/(axes.y_range[1]-axes.y_range[0]), 
-            fill_color=RED,
-            fill_opacity=0.2,
-            stroke_width=0
-        ).move_to(axes.c2p(x_amx_length/2, L)))
+        epsilon_region = epsilon_band.region
         # 添加 epsilon 标签
-        def get_epsilon_label():
-            return MathTex(r"\text{若 }\varepsilon \text{取值为：} ",
-                           f"{epsilon.get_value():.2f}",
-                            font_size=27
-                            ).next_to(limit_line, UP, buff=0.5)
-        epsilon_label = always_redraw(get_epsilon_label)
-
-        epsilon_label_upper = always_redraw(lambda: MathTex(r"L + \varepsilon ",font_size=27).next_to(epsilon_band_upper, LEFT, buff=0.1))
-        epsilon_label_lower = always_redraw(lambda: MathTex(r"L - \varepsilon ",font_size=27).next_to(epsilon_band_lower, LEFT, buff=0.1))
+        def get_epsilon_label(placement=lambda m: m.next_to(limit_line, UP, buff=0.5)):
+            return LiveTex(r"\text{若 }\varepsilon \text{取值为：} ",
+                           lambda: f"{epsilon.get_value():.2f}",
+                           placement=placement,
+                           font_size=27
+                           )
+        epsilon_label = get_epsilon_label()
+
+        # 标签内容不变，只需跟随虚线移动
+        epsilon_label_upper = MathTex(r"L + \varepsilon ",font_size=27).add_updater(
+            lambda m: m.next_to(epsilon_band_upper, LEFT, buff=0.1), call_updater=True)
+        epsilon_label_lower = MathTex(r"L - \varepsilon ",font_size=27).add_updater(
+            lambda m: m.next_to(epsilon_band_lower, LEFT, buff=0.1), call_updater=True)
         
         # 显示极限定义
         text_1=MathTex(r"\text{由数列极限的定义：}",font_size=25)
@@ -478,90 +529,37 @@ class SequenceLimitWithZoom(ZoomedScene,MovingCameraScene):
        
         
         # 生成数列点
-        x_values = list(range(1, 77))
-        y_values = [np.sin(n)/n for n in x_values]
+        x_values = np.arange(1, 77)
+        y_values = evaluate_sequence(lambda n: np.sin(n)/n, x_values)
        
-        # 创建数列点
-        dots = []
-        for n, y in zip(x_values, y_values):
-            point = axes.c2p(n, y)           
-            dot = Dot(point, color=RED, radius=0.05)
-            dots.append(dot)
+        # 创建数列点：全部项预先放进一个点云，初始透明，由 updater 逐项点亮
+        dots = SequencePoints(
+            axes.c2p(np.column_stack([x_values, y_values])),
+            radius=0.04, color=RED, opacity=0
+        )
         
         self.wait(.5)
 #=========================================================
 # 定义相机移动策略
 
-        dot_group = VGroup()            # 【新增】
-        self.add(dot_group)             # 挂到场景里，后续由 updater 往里填点
-        
-        def spawn_dot_on_tick(mob, dt):                       # 【新增】
-            if not hasattr(spawn_dot_on_tick, "idx"):         # 静态计数器
-                spawn_dot_on_tick.idx = 0
-                spawn_dot_on_tick.accum=0.0
-            
-            INTERVAL=0.07
-            spawn_dot_on_tick.accum+=dt
-            # print("============================.dot_group count: "+str(len(dot_group)))
-            idx = spawn_dot_on_tick.idx
-            
-            if spawn_dot_on_tick.accum<INTERVAL:
-                return
-            if idx < len(x_values):                           # 还有没描的点
-                dot = Dot(axes.c2p(x_values[idx], y_values[idx]), radius=0.04,color=RED)
-                mob.add(dot)                                  # 填到容器里
-                spawn_dot_on_tick.idx += 1                    # 计数器 +1
-                spawn_dot_on_tick.accum=0.0
-
-        
-        dot_group.add_updater(spawn_dot_on_tick)              # 【新增】正式交给引擎
-
-        camera_moves = {                                      # 【新增】把要移动的关键帧先列出来
-              # n==30 时，run_time=1 s
-            40: 1.5,
-            44: 1.5,
-            50: 1.5,
-            # 58: 1.5,           
-        }
-
-        
-        def get_camera_target(n):
-            """根据当前点的位置计算相机应该移动到的目标位置和缩放级别"""
-            # 目标位置：当前点的x坐标稍微靠右，y坐标保持在极限线附近
-            target_x = n + 4  # 让相机稍微超前一些
-            target_point = axes.c2p(target_x, L+0.25)
-            width=self.camera.frame.width
-            # 动态调整缩放级别：随着n增大，视野变窄以看清细节
-            # 当n较小时，保持较宽的视野；当n较大时，缩小视野以聚焦
-            if 30 < n < 40:
-                width = 15  # 初始较宽的视野
-            if 40 <n < 70:
-                width = 10   # 中等视野
-            # else:
-            #     width = 8   # 后期聚焦的窄视野
-                
-            return target_point, width        
-
-        self.wait(1.5)  # 等待数轴和极限线等元素稳定下来
-
-        for _, (dot, n, y) in enumerate(zip(dots, x_values, y_values)):
-    # ---------- 触发相机移动 ----------
-            # self.wait(0.02  )
-            if n in camera_moves:                               # 【改动】只留关键帧
-                target_point, new_width = get_camera_target(n)
-                # 并行播放，不影响描点
-                self.play(
-                    self.camera.frame.animate.move_to(target_point).set(width=new_width),
-                    run_time=camera_moves[n],
-                    rate_func=smooth
-               )
-    # ---------- 其他一次性小动画 ----------
-            if n == 50:
-                self.play(axes.x_axis.animate.set_font_size(5), run_time=0.3)
-            
-           
+        # 每 0.07 s 点亮一项，可见项数只取决于点云加入场景后的时间，与帧率无关
+        spawner = TermSpawner(dots, interval=0.07)
+        # 相机按点的出现节奏预先规划：领先最新一项 4 个单位，至少保持 y ∈ [-1.2, 1.2] 可见
+        camera_path = FollowCamera.follow(
+            spawner, self.camera.frame,
+            lead=axes.c2p(4, 0)[0] - axes.c2p(0, 0)[0],
+            min_band_height=axes.c2p(0, 1.2)[1] - axes.c2p(0, -1.2)[1],
+            focus_y=axes.c2p(0, L)[1],
+        )
+        self.add(dots, self.camera.frame)  # 同一帧加入场景，描点与运镜共用同一时间轴
+
+        # ---------- 其他一次性小动画：第 50 项出现时缩小横轴字号，与描点、运镜并行 ----------
+        font_time = spawner.spawn_times[49]
+        self.wait(font_time)
+        self.play(axes.x_axis.animate.set_font_size(5), run_time=0.3)
+        self.wait(max(camera_path.duration - font_time - 0.3, 0))
+        camera_path.stop()
 
-            
         self.play(
             self.camera.frame.animate.move_to(ORIGIN).set(width=15),
             run_time=2
@@ -721,8 +719,8 @@ class SequenceLimitWithZoom(ZoomedScene,MovingCameraScene):
         epsilon_label_temp_pos=epsilon_label.get_center()
         self.remove(epsilon_label)
         
-        epsilon_label = always_redraw(
-            lambda:get_epsilon_label().move_to(epsilon_label_temp_pos)
+        epsilon_label = get_epsilon_label(
+            lambda m: m.move_to(epsilon_label_temp_pos)
             )
         # epsilon_label.move_to(epsilon_label_temp_pos)
         self.add(epsilon_label) 
@@ -794,7 +792,7 @@ class SequenceLimitWithZoom(ZoomedScene,MovingCameraScene):
         
         # 清理
         self.play(
-            *[Uncreate(dot) for dot in dots],
+            Uncreate(dots),
             Uncreate(limit_line),
             Uncreate(limit_label),
             Uncreate(definition),
@@ -827,6 +825,52 @@ class SequenceLimitWithZoom(ZoomedScene,MovingCameraScene):
 
 class specificExample_1(MovingCameraScene):
     def construct(self):
+        # 上次渲染用到、现在缺失的公式一次性批量编译
+        precompile_scene_tex(self)
+        # 后面逐条写出的证明步骤先交给后台线程排版，与前面动画的渲染重叠，用到时再取
+        proof_1_tex=prefetch_tex(
+            r"\text{这样就得到了n 的 理想 取值范围,}",
+            r"\text{只要} n>\frac{1}{\varepsilon},\
+            \text{就能保证} \left | x_n-L \right|<\varepsilon" \
+            r"\text{成立，满足数列极限定义}",
+            font_size=27
+        )
+        proof_2_tex=prefetch_tex(
+            r"\text{要注意的是，}\frac{1}{\varepsilon}\text{是一个具体的正数,}",
+            r"\text{我们可以很自然的想到让} N = \frac{1}{\varepsilon}",
+            r"\text{就能满足定义中的”当} n>N \text{时“}",
+            font_size=27,
+            color=BLUE_C
+        )
+        proof_3_tex=prefetch_tex(
+            r"\text{但是，} \frac{1}{\varepsilon} \text{不一定是整数,}\
+            \text{而N必须取整数.}",
+            font_size=27,
+            color=RED_B
+        )
+        proof_4_tex=prefetch_tex(
+            r"\text{所以，我们可以另 N 为}  \text{比}\frac{1}{\varepsilon}\
+            \text{大的任意一个整数，即 N }\geq \frac{1}{\varepsilon} ,N \in \mathbb{N}",
+            # r"\text{，所以，} ",
+            r"\text{，就能保证} ",
+            font_size=27,
+            color=BLUE_C
+        )
+        proof_6_tex=prefetch_tex(
+            r"\text{就有，} \left | \frac{1}{n} - 0 \right | <\varepsilon ",
+            r"\text{，即：}\lim_{ n\to\infty}\frac{1}{n}=0  ",
+            font_size=30,
+        )
+        proof_8_tex=prefetch_tex(
+            r"\text{可以用数学符号表示： } N = \lceil \frac{1}{\varepsilon} \rceil ",
+            r"\text{； 意思为不小于} \frac{1}{\varepsilon} \text{的最小整数；}",
+            r"\text{“} \lceil \text{ } \rceil\text{”}\text{为向上取整} ",
+            font_size=25,
+        )
+        proof_9_tex=prefetch_tex(
+            r"\text{比如：} \lceil 1.2 \rceil = 2,\lceil 2.7 \rceil = 3",
+            font_size=25,
+        )
         # 题目
         example=MathTex(
             r"\text{例：用定义证明数列 }x_n = \frac{1}{n}\text{ 的极限是 0 }",
@@ -878,44 +922,20 @@ class specificExample_1(MovingCameraScene):
             color=YELLOW, buff=0.1, 
             stroke_width=3).shift(UP*1.1)
         def printProof_1():
-            proof_1=MathTex(
-                r"\text{这样就得到了n 的 理想 取值范围,}",
-                r"\text{只要} n>\frac{1}{\varepsilon},\
-                \text{就能保证} \left | x_n-L \right|<\varepsilon" \
-                r"\text{成立，满足数列极限定义}",
-                font_size=27  
-            ).next_to(proof,DOWN,buff=.2).align_to(proof,LEFT)
+            proof_1=proof_1_tex.result().next_to(proof,DOWN,buff=.2).align_to(proof,LEFT)
             return proof_1
         
         def printProof_2():
-            proof_2=MathTex(
-                r"\text{要注意的是，}\frac{1}{\varepsilon}\text{是一个具体的正数,}",
-                r"\text{我们可以很自然的想到让} N = \frac{1}{\varepsilon}",
-                r"\text{就能满足定义中的”当} n>N \text{时“}",
-                font_size=27,
-                color=BLUE_C  
-            )            
+            proof_2=proof_2_tex.result()
             return proof_2
         
         def printProof_3():
-            proof_3=MathTex(
-                r"\text{但是，} \frac{1}{\varepsilon} \text{不一定是整数,}\
-                \text{而N必须取整数.}",
-                font_size=27,
-                color=RED_B  
-            )
+            proof_3=proof_3_tex.result()
             return proof_3
         
         def printProof_4():
-            proof_4=MathTex(
-                r"\text{所以，我们可以另 N 为}  \text{比}\frac{1}{\varepsilon}\
-                \text{大的任意一个整数，即 N }\geq \frac{1}{\varepsilon} ,N \in \mathbb{N}",
-                # r"\text{，所以，} ",
-                r"\text{，就能保证} ",
-                font_size=27,
-                color=BLUE_C  
-            )
-            return proof_4  
+            proof_4=proof_4_tex.result()
+            return proof_4
         
         proof_5=MathTex(
             r"n>N\geq \frac{1}{\varepsilon}",
@@ -933,12 +953,7 @@ class specificExample_1(MovingCameraScene):
             stroke_width=3)
         
         def printProof_6():
-            proof_6=MathTex(
-                r"\text{就有，} \left | \frac{1}{n} - 0 \right | <\varepsilon ",
-                r"\text{，即：}\lim_{ n\to\infty}\frac{1}{n}=0  ",
-                font_size=30,
-                  
-            )
+            proof_6=proof_6_tex.result()
             return proof_6
         
         def printProof_7(width=3,height=.7):
@@ -950,17 +965,8 @@ class specificExample_1(MovingCameraScene):
             return emphasizeRect_2
         
         def printProof_8():
-            proof_8=MathTex(
-                r"\text{可以用数学符号表示： } N = \lceil \frac{1}{\varepsilon} \rceil ",
-                r"\text{； 意思为不小于} \frac{1}{\varepsilon} \text{的最小整数；}",
-                r"\text{“} \lceil \text{ } \rceil\text{”}\text{为向上取整} ",                
-                font_size=25,            
-            )
-
-            proof_9=MathTex(
-                r"\text{比如：} \lceil 1.2 \rceil = 2,\lceil 2.7 \rceil = 3",
-                font_size=25,
-            )
+            proof_8=proof_8_tex.result()
+            proof_9=proof_9_tex.result()
             return proof_8,proof_9
         
 #======动画播放区间=============================
@@ -1044,6 +1050,7 @@ from DynamaticLine import EnhancedNumberAxis
 
 class specificExampleGraph_1(Scene):
     def construct(self):
+        precompile_scene_tex(self)
         axes=EnhancedNumberAxis(
             x_range=(-2,2,1),
             initial_scale=2.0,
@@ -1070,6 +1077,7 @@ class specificExampleGraph_1(Scene):
 #=================================================================>        
         epsilon=ValueTracker(.5)
         limitValue=0
+        solver=EpsilonNSolver(lambda n: 1/n, limitValue)
 #=================================================================>
         self.play(Write(example),run_time=.8)
         self.play(Write(proof))
@@ -1090,19 +1098,19 @@ class specificExampleGraph_1(Scene):
             scene=self,           
             sub_tick_range=None,
             sub_tick_step=.1,
-            sequence_func=lambda n: 1/n
+            sequence_func=lambda n: 1/n,
+            vectorized=True
         )        
         
-        assumingTex=always_redraw(lambda: MathTex(
+        assumingTex=LiveTex(
             r"\text{若假设 } \varepsilon = \text{ }",
-            f"{epsilon.get_value():.2f}",
+            lambda: f"{epsilon.get_value():.2f}",
             r"\text{，此时极限的 }\varepsilon\text{邻域为 }",
-            f"(-{epsilon.get_value():.2f},{epsilon.get_value():.2f})", 
+            lambda: f"(-{epsilon.get_value():.2f},{epsilon.get_value():.2f})", 
             r"\text{，} N = \lceil \frac{1}{\varepsilon} \rceil = " ,
-            rf"\lceil \frac{1}{{{epsilon.get_value():.2f}}} \rceil = {np.ceil(1/epsilon.get_value()):.2f}",
-            
+            lambda: rf"\lceil \frac{1}{{{epsilon.get_value():.2f}}} \rceil = {np.ceil(1/epsilon.get_value()):.2f}",
+            placement=lambda m: m.next_to(proof,DOWN,buff=.3).align_to(proof,LEFT),
             font_size=27,
-            ).next_to(proof,DOWN,buff=.3).align_to(proof,LEFT)
         )
         
         surrendAssuTex_1=SurroundingRectangle(
@@ -1111,14 +1119,14 @@ class specificExampleGraph_1(Scene):
             color=ManimColor("#39c5bb")
         )
 
-        assumingTex_2=always_redraw(lambda: MathTex(
+        assumingTex_2=LiveTex(
                     r"\text{{意味着从 }",
-                    rf"\text{{第}}{int(np.ceil(1/epsilon.get_value()))}\text{{项 }}",
+                    lambda: rf"\text{{第}}{solver.first_term(epsilon.get_value())}\text{{项 }}",
                     r"\text{开始数列的取值进入邻域，即}",
                     # r"\lvert x_n - 0 \rvert < \varepsilon",
+                    placement=lambda m: m.next_to(assumingTex,DOWN,buff=.3).align_to(assumingTex,LEFT),
                     font_size=27,
                     color=ManimColor("#39c5bb")
-                    ).next_to(assumingTex,DOWN,buff=.3).align_to(assumingTex,LEFT)
         )
         assumingTex_3= MathTex(
             r"\lvert x_n - 0 \rvert < \varepsilon",
@@ -1131,40 +1139,24 @@ class specificExampleGraph_1(Scene):
             buff=.07,
             color=WHITE
         )
-        def GetrecNumberhood(scale_factor,epsilonVlaue):
-            axes.scale_factor=scale_factor
-            recNumberhood=Rectangle(
-            width=2*axes._x2pos(epsilonVlaue)[0],
+        # ε 邻域：跟随 epsilon 与数轴的实际布局原地更新
+        neighborhood=EpsilonBand.on_number_line(
+            axes.number_to_point,
+            limitValue,
+            epsilon,
             height=1,
+            line_color=WHITE,
+            stroke_width=3,
             fill_color=BLUE,
             fill_opacity=.2,
-            stroke_width=0,
-            ).move_to(axes._x2pos(limitValue))            
-            return recNumberhood
-
-        def GetNerberHoodline(epsilonVlaue,edge):
-            nerberHoodline=DashedLine(
-                start=UP*0.5,
-                end=DOWN*0.5,
-                stroke_width=3,
-                stroke_color=WHITE,
-            ).move_to(
-                axes._x2pos(epsilonVlaue)if edge == 1 
-                else axes._x2pos(-epsilonVlaue))
-            return nerberHoodline
+        )
            
         
 
         self.play(Create(assumingTex))
         self.play(Create(assumingTex_2),Create(assumingTex_3))
         self.play(Create(surrendAssuTex_1),Create(surrendAssuTex_2))    
-        recNumberhood_1=GetrecNumberhood(5,.5)
-        lineNeigberhood_left=GetNerberHoodline(.5,-1)
-        lineNeigberhood_right=GetNerberHoodline(.5,1)
-        self.play(Create(recNumberhood_1),
-                  Create(lineNeigberhood_left),
-                  Create(lineNeigberhood_right)
-                )       
+        self.play(Create(neighborhood))       
         self.wait(.3)
         axes.zoom_to(
             new_scale=5.0,
@@ -1173,82 +1165,57 @@ class specificExampleGraph_1(Scene):
             scene=self,   
             pointLablesize=20,
             run_time=.5,
-            sequence_func=lambda n: 1/n
+            sequence_func=lambda n: 1/n,
+            vectorized=True
         ) 
        
        
          
         
         # self.play(epsilon.animate.set_value(.3),run_time=2.5)
-        # GetrecNumberhood 和 GetNerberHoodline 按照顺序调用
-        recNumberhood_2=GetrecNumberhood(10,.3)
-        lineNeigberhood_left_2=GetNerberHoodline(.3,-1)
-        lineNeigberhood_right_2=GetNerberHoodline(.3,1)
+        # 邻域跟随 epsilon 与数轴缩放自动更新，不再需要 ReplacementTransform
         axes.zoom_to(
             new_scale=10.0,
             scene=self,
             otherAnimationsTicks=[
-                ReplacementTransform(recNumberhood_1,recNumberhood_2),
-                ReplacementTransform(lineNeigberhood_left,lineNeigberhood_left_2),
-                ReplacementTransform(lineNeigberhood_right,lineNeigberhood_right_2),
                 epsilon.animate.set_value(.3)               
             ],
             pointLablesize=20,           
-            run_time=2.5
+            run_time=2.5,
+            vectorized=True
         )
         
         self.wait(1)
 
-        recNumberhood_3=GetrecNumberhood(10,.2)
-        lineNeigberhood_left_3=GetNerberHoodline(.2,-1)
-        lineNeigberhood_right_3=GetNerberHoodline(.2,1)
-
         self.play(
             epsilon.animate.set_value(.2),
-            ReplacementTransform(recNumberhood_2,recNumberhood_3),
-            ReplacementTransform(lineNeigberhood_left_2,lineNeigberhood_left_3),
-            ReplacementTransform(lineNeigberhood_right_2,lineNeigberhood_right_3),
             run_time=2.5
             )
         
         self.wait(1)
 
-        recNumberhood_4=GetrecNumberhood(10,.1)
-        lineNeigberhood_left_4=GetNerberHoodline(.1,-1)
-        lineNeigberhood_right_4=GetNerberHoodline(.1,1)
-
         self.play(
             epsilon.animate.set_value(.1),
-            ReplacementTransform(recNumberhood_3,recNumberhood_4),
-            ReplacementTransform(lineNeigberhood_left_3,lineNeigberhood_left_4),
-            ReplacementTransform(lineNeigberhood_right_3,lineNeigberhood_right_4),
             run_time=2
             )
         
 
         self.wait(1)
         
-        recNumberhood_5=GetrecNumberhood(41,.1)
-        lineNeigberhood_left_5=GetNerberHoodline(.1,-1)
-        lineNeigberhood_right_5=GetNerberHoodline(.1,1)
-
         axes.zoom_to(
             new_scale=41.0,
             scene=self,
             new_points=(11,17),
-            otherAnimationsTicks=[
-                ReplacementTransform(recNumberhood_4,recNumberhood_5),
-                ReplacementTransform(lineNeigberhood_left_4,lineNeigberhood_left_5),
-                ReplacementTransform(lineNeigberhood_right_4,lineNeigberhood_right_5),                             
-            ],
             pointLablesize=20,    
             isPlayPoint=False,       
-            run_time=2            
+            run_time=2,
+            vectorized=True
         )            
 
 
 class SpecificExample_2(MovingCameraScene):
     def construct(self):
+        precompile_scene_tex(self)
         # -------------- 0. 基本配色 --------------
         BLUE_D  = "#59A3FD"
         GREEN_B = "#8CFF98"
@@ -1294,29 +1261,22 @@ class SpecificExample_2(MovingCameraScene):
 
         # -------------- 4. ε 带 --------------
         epsilon = ValueTracker(0.1)
+        # 数值求 N(ε)：N 线与标签共用同一个结果
+        solver = EpsilonNSolver(lambda n: (-1)**n / (n+1)**2, 0)
 
-        def eps_band():
-            upper = DashedLine(
-                axes.c2p(0,  epsilon.get_value()),
-                axes.c2p(40, epsilon.get_value()),
-                color=GREEN_B, stroke_width=3
-            )
-            lower = DashedLine(
-                axes.c2p(0, -epsilon.get_value()),
-                axes.c2p(40,-epsilon.get_value()),
-                color=GREEN_B, stroke_width=3
-            )
-            return VGroup(upper, lower)
-
-        band = always_redraw(eps_band)
+        band = EpsilonBand.on_axes(
+            axes, 0, epsilon, (0, 40),
+            line_color=GREEN_B, stroke_width=3,
+            include_region=False
+        )
         
 
         # -------------- 5. 逐点描迹 --------------
-        dots = VGroup()
-        for n in range(1, 41):
-            y = (-1)**n / (n+1)**2
-            dot = Dot(axes.c2p(n, y), radius=0.04, color=BLUE_D)
-            dots.add(dot)
+        ns = np.arange(1, 41)
+        dots = SequencePoints(
+            axes.c2p(np.column_stack([ns, evaluate_sequence(lambda n: (-1)**n / (n+1)**2, ns)])),
+            radius=0.04, color=BLUE_D, opacity=0
+        )
 
         
         # -------------- 6. 计算 |x_n - 0| < ε --------------
@@ -1385,10 +1345,10 @@ class SpecificExample_2(MovingCameraScene):
 
 
                # -------------- 10. 缩小 ε 验证 --------------
-        eps_text = always_redraw(
-            lambda: MathTex(f"\\varepsilon={epsilon.get_value():.3f}",
-                            font_size=30,stroke_width=1)
-                     .next_to(limit_line,UP,buff=0.2)
+        eps_text = LiveTex(
+            r"\varepsilon=", lambda: f"{epsilon.get_value():.3f}",
+            placement=lambda m: m.next_to(limit_line,UP,buff=0.2),
+            font_size=30,stroke_width=1
         )
         
         #============领域===========
@@ -1399,33 +1359,36 @@ class SpecificExample_2(MovingCameraScene):
 
 
 
-        self.play(LaggedStartMap(Create, dots, lag_ratio=0.05), run_time=2)
+        self.play(RevealTerms(dots, range(dots.num_terms), lag_ratio=0.05), run_time=2)
         self.wait()
 
 
         # -------------- 9. 动态 N 线 --------------
-        def n_line():
-            eps = epsilon.get_value()
-            N = max(1, int(np.ceil(1/np.sqrt(eps))) - 1)
+        def n_line(line):
+            N = solver.N(epsilon.get_value())
             x_pos = axes.c2p(N, 0)[0]
-            return DashedLine(
+            return line.put_start_and_end_on(
                 [x_pos, axes.c2p(0, -0.15)[1], 0],
-                [x_pos, axes.c2p(0,  0.07)[1], 0],
-                color=RED, stroke_width=3
+                [x_pos, axes.c2p(0,  0.07)[1], 0]
             )
         
         
-        nl = always_redraw(n_line)
-        n_line_lable = always_redraw(lambda:
-            MathTex(
-                rf"N = {max(1, int(np.ceil(1/np.sqrt(epsilon.get_value()))) + 1)}",
-                font_size=25,
-                color=RED
-                ).next_to(nl, UP, buff=0.2)
+        nl = n_line(DashedSegment(color=RED, stroke_width=3)).add_updater(n_line)
+        n_line_lable = LiveTex(
+            r"N_{\min} = ", lambda: f"{solver.N(epsilon.get_value())}",
+            placement=lambda m: m.next_to(nl, UP, buff=0.2),
+            font_size=25,
+            color=RED
         )
+        # N 线画的是数值求出的最小 N，比上面取整公式给出的 N 小；说明两者的关系，免得画面与推导对不上
+        n_min_note = MathTex(
+            r"\text{虚线：}N_{\min}=\min\{N : n>N\Rightarrow|x_n-0|<\varepsilon\}",
+            r"\le\left\lceil\sqrt{\frac{1}{\varepsilon}}\,\right\rceil",
+            font_size=25,color=RED
+        ).next_to(n_int, DOWN, buff=0.1,aligned_edge=LEFT)
 
         
-        self.play(Create(nl),Create(n_line_lable))
+        self.play(Create(nl),Create(n_line_lable),Write(n_min_note))
         self.wait()     
        
 
@@ -1442,6 +1405,7 @@ class SpecificExample_2(MovingCameraScene):
 
 class SpecificExample_3(MovingCameraScene):
     def construct(self): 
+        precompile_scene_tex(self)
 
         _color_1="#39c5bb"  
         _color_2="#C1003C"  
@@ -1605,29 +1569,26 @@ class SpecificExample_3(MovingCameraScene):
         self.wait(1)
 
         # 计算并绘制数列点
-        n_values = list(range(1, 21))
-        dots = VGroup()
+        n_values = np.arange(1, 21)
+        a_values = evaluate_sequence(lambda n: (3*n + 1) / (2*n + 1), n_values)
+        dots = SequencePoints(
+            axes.coords_to_point(np.column_stack([n_values, a_values])),
+            color=RED, radius=0.05, opacity=0
+        )
         values_text = VGroup()
 
-        for n in n_values:
-            # 计算数列值
-            a_n = (3*n + 1) / (2*n + 1)
-            
-            # 创建点
-            dot = Dot(axes.coords_to_point(n, a_n), color=RED, radius=0.05)
-            dots.add(dot)
-            
+        for i, (n, a_n) in enumerate(zip(n_values, a_values)):
             # 每5个点显示数值
             if n % 4 == 0:
                 value_text = MathTex(
                     f"a_{{{n}}} = {a_n:.3f}", 
                     font_size=17
                 )
-                value_text.next_to(dot, UP * 0.3)
+                value_text.next_to(dots.get_term_point(i) + UP * dots.radii[i], UP * 0.3)
                 values_text.add(value_text)
 
         # 动画显示点
-        self.play(LaggedStartMap(Create, dots, lag_ratio=0.1))
+        self.play(RevealTerms(dots, range(dots.num_terms), lag_ratio=0.1))
         self.play(Write(values_text))
         self.wait(2)
 
@@ -3,6 +3,19 @@ import numpy as np
 
 from manim.utils.rate_functions import (ease_in_out_cubic )
 from typing import Callable, Sequence
+import sys
+from pathlib import Path
+
+# HiveTools、DeepZoom、TexPipeline 等公共模块在仓库根目录，渲染本文件时也要能导入
+ROOT_DIR = str(Path(__file__).resolve().parent.parent)
+if ROOT_DIR in sys.path:
+    sys.path.remove(ROOT_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from HiveTools import SplitTree, CellArray, ShiftCells
+from DeepZoom import TilePyramid
+from TexPipeline import install_tex_cache, precompile_scene_tex
+from TexWorker import install_tex_worker
 
 # 配置LaTeX支持中文
 config.tex_template = TexTemplate(
@@ -11,6 +24,8 @@ config.tex_template = TexTemplate(
 \usepackage{amsmath,amssymb}
 """
 )
+install_tex_cache()
+install_tex_worker()
 _color_1="#39c5bb"  
 _color_2="#C1003C"  
 _color_3="#07A1B1"  
@@ -60,6 +75,7 @@ class Infinitesimal(ZoomedScene,MovingCameraScene):
     )
     
     def construct(self):
+        precompile_scene_tex(self)
         
         rec_playground = Rectangle(
             width=10,
@@ -882,14 +898,15 @@ class Infinitesimal(ZoomedScene,MovingCameraScene):
         MAX_DEPTH      = 10            # 总层数
 
         # ========== 1. 创建 100 块紧密方阵 ==========
-        rects = VGroup(*[
-            Rectangle(
-                width=init_w+ 0.01, height=init_h+0.01, 
-                stroke_width=0, fill_opacity=1,color=WHITE)
-            .move_to(np.array(
-                [(j-COLS/2+0.5)*init_w, (i-ROWS/2+0.5)*init_h, 0]))
-                    for i in range(ROWS) for j in range(COLS)
-        ]).move_to(target.get_corner(DR)+LEFT*1+UP).scale(0.02)
+        jj, ii = np.meshgrid(np.arange(COLS), np.arange(ROWS))
+        centers = np.column_stack([
+            ((jj - COLS/2 + 0.5)*init_w).ravel(),
+            ((ii - ROWS/2 + 0.5)*init_h).ravel(),
+            np.zeros(COLS*ROWS)])
+        # 全部格子合成一个 CellArray，逐层移动时只改一个点数组
+        rects = CellArray(
+            centers, width=init_w+ 0.01, height=init_h+0.01, color=WHITE
+        ).move_to(target.get_corner(DR)+LEFT*1+UP).scale(0.02)
         self.play(FadeIn(rects))
         self.wait(.3)
         cakeTex=Text(
@@ -898,21 +915,9 @@ class Infinitesimal(ZoomedScene,MovingCameraScene):
          
         
 
-        # ========== 2. BFS 预处理 ==========
-        # 第 0 层：只有根组
-        layers = [ [VGroup(*rects)] ]   # layers[depth] = 当前层所有组
-
-        for depth in range(MAX_DEPTH):
-            new_layer = []
-            axis = depth % 2            # 0 横切 1 竖切
-            for grp in layers[-1]:      # 对上一层每个组
-                # 排序 + 对半分
-                grp.submobjects.sort(key=lambda m: m.get_center()[axis])
-                n = len(grp)
-                left_g  = VGroup(*grp[:n//2])
-                right_g = VGroup(*grp[n//2:])
-                new_layer.extend([left_g, right_g])
-            layers.append(new_layer)
+        # ========== 2. 分割树预处理 ==========
+        # 只在格子中心的下标数组上逐层对半分，每层的组都是下标切片
+        tree = SplitTree(centers, MAX_DEPTH)
 
         # ========== 2. 移动镜头 ==========
 
@@ -929,10 +934,6 @@ class Infinitesimal(ZoomedScene,MovingCameraScene):
 
         # ========== 3. 逐层同时分裂 ==========
         for depth in range(1, MAX_DEPTH + 1):
-            axis = (depth - 1) % 2
-            prev_groups = layers[depth - 1]  # 父层
-            curr_groups = layers[depth]      # 子层（已是对半分好的顺序）
-
             anims = []
             if depth == 7:
                 anims.append(
@@ -943,30 +944,24 @@ class Infinitesimal(ZoomedScene,MovingCameraScene):
                 anims.append(
                     self.camera.frame.animate.set_width(2.5)
                 )
-            for i, parent in enumerate(prev_groups):
-                left_child  = curr_groups[i * 2]
-                right_child = curr_groups[i * 2 + 1]
-
-                # 计算裂口距离
-                if axis == 0:  # 水平切 → 左右分离
-                    gap = (left_child.width + right_child.width) / 2 + gap_step
-                    anims += [
-                    left_child.animate.shift(-gap * RIGHT),
-                    right_child.animate.shift( gap * RIGHT),
-                    ]
-                else:  # 垂直切 → 上下分离
-                    gap = (left_child.height + right_child.height) / 2 + gap_step
-                    anims += [
-                    left_child.animate.shift(-gap * UP),
-                    right_child.animate.shift( gap * UP),
-                    ]
+            # 本层每对兄弟组沿切向各自退开（奇数层左右分离，偶数层上下分离），
+            # 全部格子的位移合成一个数组，由一个动画完成
+            offsets = tree.split_offsets(depth, rects.positions, rects.cell_size, gap_step)
+            anims.append(ShiftCells(rects, offsets))
 
             self.play(*anims, run_time=.7,rate_func=smooth)
 
         self.wait(1.5)
 
+        # 分裂结束后蛋糕不再变化：换成以目标格子为中心的瓦片金字塔再推近，
+        # 每帧只画与画面相交的那几块图片
+        focus = rects.get_cell_center(100)
+        hive_tiles = TilePyramid(rects, focus=focus).follow(self.camera.frame)
+        self.add(hive_tiles)
+        self.remove(rects)
+
         self.play(
-            self.camera.frame.animate.move_to(rects[100].get_center()).set_width(0.01),
+            self.camera.frame.animate.move_to(focus).set_width(0.01),
             run_time=2.5,rate_functions=smooth)
 # 第1列：时间段
 table_data_1 = [
@@ -1039,6 +1034,7 @@ table_data_f =[
 
 class TheHigherInfinitesimal(Scene):
     def construct(self):
+        precompile_scene_tex(self)
         def_card = MathTex(
             r"\lim_{x\to a}{\alpha(x)\over\beta(x)}=0\;\Rightarrow\;\alpha(x)=o(\beta(x))",
             font_size=36
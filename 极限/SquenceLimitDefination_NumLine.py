@@ -1,5 +1,18 @@
 from manim import *
 import numpy as np
+import sys
+from pathlib import Path
+
+# 公共模块（DynamaticLine、SequenceTools、TexPipeline 等）只在仓库根目录保留一份；
+# manim 渲染时把本目录放在 sys.path 最前，这里把根目录放到它前面
+ROOT_DIR = str(Path(__file__).resolve().parent.parent)
+if ROOT_DIR in sys.path:
+    sys.path.remove(ROOT_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+from DynamaticLine import ViewportTicks, staggered_reveal
+from TexPipeline import install_tex_cache, precompile_scene_tex
+from TexWorker import install_tex_worker
 
 # --------------------- 常量区 ---------------------
 TITLE_TEXT       = "数列极限的动态演示"
@@ -22,7 +35,10 @@ class NumberAxis(VGroup):
                  x_max: int = 15,
                  initial_scale: float = 1,
                  center: np.ndarray = ORIGIN,
+                 culling: bool = False,
                  **kwargs):
+        """culling=True 时刻度交给 ViewportTicks 管理：只保留可视窗口内的刻度，
+        并随缩放自动切换 1 / 0.1 / 0.01 …… 的刻度密度"""
         super().__init__(**kwargs)
         self.x_min         = x_min
         self.x_max         = x_max
@@ -31,26 +47,35 @@ class NumberAxis(VGroup):
         self.seq_dots      = VGroup() # 已经创建的数列点
         self.seq_labels    = VGroup()
         self.seq_n_values  = []      # 每个点对应的n值
-        # --- 主刻度 ---
         self.line   = Line(LEFT*10, RIGHT*10, color=TICK_COLOR)
-        self.ticks  = VGroup()
-        self.labels = VGroup()
-        for x in range(self.x_min, self.x_max + 1):
-            t = Line(UP*0.2, DOWN*0.1)
-            lab = Text(str(x), font_size=TICK_FONT_SIZE)
-            self.ticks.add(t)
-            self.labels.add(lab)
-        self._layout_main_ticks()
-        # --- 0.1 子刻度 ---
-        self.sub_ticks  = VGroup()
-        self.sub_labels = VGroup()
-        for i in range(1, 10):
-            pos = i * 0.1
-            t = Line(UP*0.1, DOWN*0.1, color=SUB_TICK_COLOR)
-            lab = Text(f"{pos:.1f}", font_size=SUB_TICK_FS, color=SUB_TICK_COLOR)
-            self.sub_ticks.add(t)
-            self.sub_labels.add(lab)
-        self._layout_sub_ticks()
+        self.viewport = None
+        if culling:
+            # --- 视口刻度：只物化可见部分 ---
+            self.viewport = ViewportTicks(self.x_min, self.x_max,
+                                          self.scale_factor, self.center_offset,
+                                          label_buff=0.3)
+            self.ticks,     self.labels     = self.viewport.ticks,     self.viewport.labels
+            self.sub_ticks, self.sub_labels = self.viewport.sub_ticks, self.viewport.sub_labels
+        else:
+            # --- 主刻度 ---
+            self.ticks  = VGroup()
+            self.labels = VGroup()
+            for x in range(self.x_min, self.x_max + 1):
+                t = Line(UP*0.2, DOWN*0.1)
+                lab = Text(str(x), font_size=TICK_FONT_SIZE)
+                self.ticks.add(t)
+                self.labels.add(lab)
+            self._layout_main_ticks()
+            # --- 0.1 子刻度 ---
+            self.sub_ticks  = VGroup()
+            self.sub_labels = VGroup()
+            for i in range(1, 10):
+                pos = i * 0.1
+                t = Line(UP*0.1, DOWN*0.1, color=SUB_TICK_COLOR)
+                lab = Text(f"{pos:.1f}", font_size=SUB_TICK_FS, color=SUB_TICK_COLOR)
+                self.sub_ticks.add(t)
+                self.sub_labels.add(lab)
+            self._layout_sub_ticks()
         self.add(self.line, self.ticks, self.labels,
                  self.sub_ticks, self.sub_labels,
                  self.seq_dots, self.seq_labels)
@@ -69,8 +94,11 @@ class NumberAxis(VGroup):
             tick.move_to(self._x2pos(x))
             lab.next_to(tick, DOWN, buff=0.15)
     # ------------- 公开接口 -------------
-    def add_sequence_points(self, n_start: int, n_end: int, scene: Scene, runTime=ANIM_TIME):
-        """把 a_n = 1/n (n_start..n_end) 逐个出现"""
+    def add_sequence_points(self, n_start: int, n_end: int, scene: Scene, runTime=ANIM_TIME,
+                            batched: bool = False, stagger: float = None):
+        """把 a_n = 1/n (n_start..n_end) 逐个出现；
+        batched=True 时整段只播放一个错开 stagger 秒的动画，节奏不变"""
+        term_anims = []
         for n in range(n_start, n_end + 1):
             a_n = 1 / n
             dot = Dot(color=DOT_COLOR).move_to(self._x2pos(a_n))
@@ -88,9 +116,16 @@ class NumberAxis(VGroup):
             self.seq_dots.add(dot)
             self.seq_labels.add(label)
             self.seq_n_values.append(n)  # 存储n值
+            if batched:
+                term_anims.append([FadeIn(dot), Write(label)])
+                continue
             scene.play(FadeIn(dot), Write(label), run_time=runTime)
             scene.wait(runTime/2)
-    def zoom_to(self, new_scale: float, new_points: tuple[int, int] = None, scene: Scene = None, runTime=ZOOM_TIME):
+        if term_anims:
+            scene.play(staggered_reveal(term_anims, runTime, stagger))
+            scene.wait(runTime/2)
+    def zoom_to(self, new_scale: float, new_points: tuple[int, int] = None, scene: Scene = None, runTime=ZOOM_TIME,
+                batched: bool = False):
         """一次性完成：
         1) 所有主刻度、子刻度、已有点的缩放与移动
         2) 新增 new_points 区间的数列点
@@ -100,20 +135,24 @@ class NumberAxis(VGroup):
         old_scale = self.scale_factor
         # 更新内部状态
         self.scale_factor = new_scale
-        # 主刻度
-        for x, tick, lab in zip(range(self.x_min, self.x_max + 1),
-                                self.ticks, self.labels):
-            anims += [
-                tick.animate.move_to(self._x2pos(x)),
-                lab.animate.next_to(self._x2pos(x), DOWN, buff=0.3)
-            ]
-        # 子刻度
-        for i, (tick, lab) in enumerate(zip(self.sub_ticks, self.sub_labels)):
-            x = (i + 1) * 0.1
-            anims += [
-                tick.animate.move_to(self._x2pos(x)),
-                lab.animate.next_to(self._x2pos(x), DOWN, buff=0.15)
-            ]
+        if self.viewport is not None:
+            # 只为窗口内的刻度生成动画，并按新缩放切换刻度密度
+            anims += self.viewport.zoom_anims(new_scale, self.center_offset)
+        else:
+            # 主刻度
+            for x, tick, lab in zip(range(self.x_min, self.x_max + 1),
+                                    self.ticks, self.labels):
+                anims += [
+                    tick.animate.move_to(self._x2pos(x)),
+                    lab.animate.next_to(self._x2pos(x), DOWN, buff=0.3)
+                ]
+            # 子刻度
+            for i, (tick, lab) in enumerate(zip(self.sub_ticks, self.sub_labels)):
+                x = (i + 1) * 0.1
+                anims += [
+                    tick.animate.move_to(self._x2pos(x)),
+                    lab.animate.next_to(self._x2pos(x), DOWN, buff=0.15)
+                ]
         # 已有点
         for n, dot, lab in zip(self.seq_n_values, self.seq_dots, self.seq_labels):
             a_n = 1 / n
@@ -127,9 +166,11 @@ class NumberAxis(VGroup):
             self.line.get_width() * new_scale / old_scale))
         if scene:
             scene.play(*anims, run_time=runTime)
+        if self.viewport is not None:
+            self.viewport.finish_zoom(scene)
         # 新增点（如果有）
         if new_points and scene:
-            self.add_sequence_points(new_points[0], new_points[1], scene, runTime/2)
+            self.add_sequence_points(new_points[0], new_points[1], scene, runTime/2, batched=batched)
 
 # 配置LaTeX支持中文
 config.tex_template = TexTemplate(
@@ -138,9 +179,12 @@ config.tex_template = TexTemplate(
 \usepackage{amsmath,amssymb}
 """
 )
+install_tex_cache()
+install_tex_worker()
 # --------------------- 场景剧本 ---------------------
 class ImprovedNumberLine(Scene):
     def construct(self):
+        precompile_scene_tex(self)
         # 标题
         title = Text(TITLE_TEXT, font_size=TITLE_SIZE, color=BLUE)
         title.to_edge(UP)
@@ -171,7 +215,7 @@ class ImprovedNumberLine(Scene):
        
 
         # 初始数轴
-        axis = NumberAxis(initial_scale=1, center=np.array([-3, 0, 0]))
+        axis = NumberAxis(initial_scale=1, center=np.array([-3, 0, 0]), culling=True)
         self.play(Create(axis.line), Create(axis.ticks), Write(axis.labels))
         
         # 第一轮 放大
@@ -179,14 +223,14 @@ class ImprovedNumberLine(Scene):
         
 
         # 第一轮点
-        axis.add_sequence_points(1, 4, self)
+        axis.add_sequence_points(1, 4, self, batched=True)
 
         # 三次放大
-        axis.zoom_to(15, (6, 9),  self)
-        axis.zoom_to(30, (10, 17), self, 0.7)
-        axis.zoom_to(50, (18, 25), self, 0.7)
-        axis.zoom_to(100, (26,50), self, 0.5)
-        axis.zoom_to(200, (50,77), self, 0.4)
+        axis.zoom_to(15, (6, 9),  self, batched=True)
+        axis.zoom_to(30, (10, 17), self, 0.7, batched=True)
+        axis.zoom_to(50, (18, 25), self, 0.7, batched=True)
+        axis.zoom_to(100, (26,50), self, 0.5, batched=True)
+        axis.zoom_to(200, (50,77), self, 0.4, batched=True)
         self.wait(1)
 
         self.play(Write(conclusion), conclusion.animate.to_edge(DOWN).shift(LEFT*0.5), buff=0.4)